@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+
+"""Compiled virtual machine for the assembly programs of 2017 (day18, day23).
+
+A program is parsed once into three arrays: the opcode, the first operand and
+the second operand of each instruction. Each operand is resolved to an index in
+the list of registers. The registers of a program are followed by one slot per
+constant of the program, so reading an operand is always `registers[index]`,
+whether it is a register or an immediate value.
+
+`optimize` replaces the loops it recognizes by native Python functions (NATIVE
+instructions), which update the registers and the profile as if the loop had
+been executed instruction by instruction.
+"""
+
+from math import isqrt
+from typing import NamedTuple
+
+# opcodes
+SND, SET, ADD, SUB, MUL, MOD, RCV, JGZ, JNZ, NATIVE = range(10)
+OPCODES = {"snd": SND, "set": SET, "add": ADD, "sub": SUB, "mul": MUL,
+           "mod": MOD, "rcv": RCV, "jgz": JGZ, "jnz": JNZ}
+
+# why `execute` returned
+HALTED, BLOCKED, PAUSED = "halted", "blocked", "paused"
+
+class Program(NamedTuple):
+    """A compiled program: opcodes and operand indices of each instruction."""
+    ops: list
+    x: list
+    y: list
+    registers: dict  # register name -> index
+    constants: list  # value of the slots after the registers
+    source: list     # text of each instruction
+    natives: tuple = ()  # functions called by the NATIVE instructions
+
+def is_number(s):
+    """Return True if s is an integer literal."""
+
+    return s.lstrip("-").isdigit()
+
+def compile_program(lines):
+    """Compile the assembly instructions of lines (empty lines are ignored)
+    into a Program."""
+
+    source = [line.strip() for line in lines if line.strip()]
+    rows = [line.split() for line in source]
+
+    names = {}
+    for row in rows:
+        for operand in row[1:]:
+            if not is_number(operand) and operand not in names:
+                names[operand] = len(names)
+
+    constants, slots = [], {}
+    def resolve(operand):
+        if not is_number(operand):
+            return names[operand]
+        if operand not in slots:
+            slots[operand] = len(names) + len(constants)
+            constants.append(int(operand))
+        return slots[operand]
+
+    ops, x, y = [], [], []
+    for row in rows:
+        if row[0] not in OPCODES:
+            raise ValueError(f"unknown instruction: {' '.join(row)}")
+        ops.append(OPCODES[row[0]])
+        x.append(resolve(row[1]))
+        y.append(resolve(row[2]) if len(row) > 2 else 0)
+
+    return Program(ops, x, y, names, constants, source)
+
+def new_registers(program, **values):
+    """Return the registers of a new process running program. All registers
+    are 0, except the ones given in values."""
+
+    registers = [0] * len(program.registers) + program.constants
+    for name, value in values.items():
+        if name in program.registers:
+            registers[program.registers[name]] = value
+    return registers
+
+def execute(program, registers, pc=0, inbox=None, outbox=None,
+            max_steps=None, profile=None):
+    """Execute program from instruction pc, until it jumps outside of the
+    program (HALTED), it needs to receive a value and inbox is empty (BLOCKED)
+    or max_steps instructions were executed (PAUSED).
+
+    snd appends a value to outbox, rcv pops the oldest value of inbox (a deque)
+    into its register. If profile is a list, profile[i] is incremented each
+    time instruction i is executed. Return (status, pc, number of steps).
+
+    A NATIVE instruction counts as all the instructions it replaces, so it can
+    make execute run a little more than max_steps steps."""
+
+    ops, xs, ys = program.ops, program.x, program.y
+    n = len(ops)
+    limit = -1 if max_steps is None else max_steps
+    steps = 0
+
+    while 0 <= pc < n:
+        if steps == limit:
+            return PAUSED, pc, steps
+
+        op = ops[pc]
+        if op == RCV:
+            if not inbox:
+                return BLOCKED, pc, steps
+            registers[xs[pc]] = inbox.popleft()
+        elif op == SET:
+            registers[xs[pc]] = registers[ys[pc]]
+        elif op == ADD:
+            registers[xs[pc]] += registers[ys[pc]]
+        elif op == SUB:
+            registers[xs[pc]] -= registers[ys[pc]]
+        elif op == MUL:
+            registers[xs[pc]] *= registers[ys[pc]]
+        elif op == MOD:
+            registers[xs[pc]] %= registers[ys[pc]]
+        elif op == SND:
+            outbox.append(registers[xs[pc]])
+        elif op == NATIVE:
+            pc, n_steps = program.natives[xs[pc]](registers, profile)
+            steps += n_steps
+            if 0 <= limit < steps:
+                return PAUSED, pc, steps
+            continue
+        elif op == JGZ:
+            if registers[xs[pc]] > 0:
+                if profile is not None:
+                    profile[pc] += 1
+                steps += 1
+                pc += registers[ys[pc]]
+                continue
+        elif registers[xs[pc]] != 0: # JNZ
+            if profile is not None:
+                profile[pc] += 1
+            steps += 1
+            pc += registers[ys[pc]]
+            continue
+
+        if profile is not None:
+            profile[pc] += 1
+        steps += 1
+        pc += 1
+
+    return HALTED, pc, steps
+
+def constant(program, index):
+    """Return the value of the operand index if it is a constant, else None."""
+
+    n_registers = len(program.registers)
+    if index < n_registers:
+        return None
+    return program.constants[index-n_registers]
+
+def jump_targets(program):
+    """Return the set of (pc, target) of the jumps of program, or None if the
+    offset of one of them is not a constant."""
+
+    targets = set()
+    for pc, op in enumerate(program.ops):
+        if op in (JGZ, JNZ):
+            offset = constant(program, program.y[pc])
+            if offset is None:
+                return None
+            targets.add((pc, pc + offset))
+    return targets
+
+def is_increment(program, pc, register):
+    """Return True if instruction pc adds 1 to register."""
+
+    op, x, y = program.ops[pc], program.x[pc], program.y[pc]
+    return x == register and ((op == SUB and constant(program, y) == -1) or
+                              (op == ADD and constant(program, y) == 1))
+
+def match_test(program, pc, register, bound, offset):
+    """Match the instructions: set t register, sub t bound, jnz t offset (jump
+    while register != bound) from pc. Return the operand index t or None."""
+
+    ops, xs, ys = program.ops, program.x, program.y
+    if ops[pc:pc+3] != [SET, SUB, JNZ]:
+        return None
+    t = xs[pc]
+    if (ys[pc] != register or xs[pc+1] != t or ys[pc+1] != bound or
+            xs[pc+2] != t or constant(program, ys[pc+2]) != offset):
+        return None
+    return t
+
+def match_divisibility_loop(program, pc):
+    """Match the loop that sets a flag if a number is a multiple of x:
+
+        set t x      <- pc
+        mul t y
+        sub t n
+        jnz t 2
+        set f v
+        sub y -1
+        set t y
+        sub t n
+        jnz t -8
+
+    Return the operand indices (t, x, y, n, f, v) or None."""
+
+    ops, xs, ys = program.ops, program.x, program.y
+    if pc + 9 > len(ops) or ops[pc:pc+5] != [SET, MUL, SUB, JNZ, SET]:
+        return None
+
+    t, f, v = xs[pc], xs[pc+4], ys[pc+4]
+    if not is_increment(program, pc+5, xs[pc+5]):
+        return None
+    y = xs[pc+5]
+    # multiplication is commutative: set t y, mul t x is the same loop
+    operands = [ys[pc], ys[pc+1]]
+    if xs[pc+1] != t or y not in operands:
+        return None
+    operands.remove(y)
+    x, n = operands[0], ys[pc+2]
+
+    if (xs[pc+2] != t or xs[pc+3] != t or constant(program, ys[pc+3]) != 2 or
+            match_test(program, pc+6, y, n, -8) != t):
+        return None
+    # t, y and f are the only modified registers, the other operands must be
+    # left untouched
+    if any(constant(program, r) is not None for r in (t, y, f)):
+        return None
+    if len({t, y, f}) < 3 or {t, y, f} & {x, n} or v in (t, y):
+        return None
+
+    return t, x, y, n, f, v
+
+def divisibility_loop(head, t, x, y, n, f, v):
+    """Return the NATIVE function of the divisibility loop starting at head:
+    for each y from its value to n-1, if x*y == n then f = v."""
+
+    def native(registers, profile):
+        y0, bound = registers[y], registers[n]
+        if y0 >= bound: # never ends, let it run one instruction at a time
+            registers[t] = registers[x]
+            if profile is not None:
+                profile[head] += 1
+            return head + 1, 1
+
+        n_loops = bound - y0
+        factor = registers[x]
+        if factor == 0:
+            n_hits = n_loops if bound == 0 else 0
+        else:
+            n_hits = int(bound % factor == 0 and y0 <= bound // factor < bound)
+
+        if n_hits:
+            registers[f] = registers[v]
+        registers[t] = 0
+        registers[y] = bound
+
+        if profile is not None:
+            for i in range(9):
+                profile[head+i] += n_hits if i == 4 else n_loops
+        return head + 9, 8*n_loops + n_hits
+
+    return native
+
+def count_products(n, x_min, x_max, y_min, y_max):
+    """Return the number of (x, y) such that x*y == n with x_min <= x < x_max
+    and y_min <= y < y_max. n must not be 0."""
+
+    count = 0
+    for d in range(1, isqrt(abs(n)) + 1):
+        if n % d:
+            continue
+        # the divisors d and n/d, with both signs
+        for x in {d, -d, abs(n) // d, -abs(n) // d}:
+            if x_min <= x < x_max and y_min <= n // x < y_max:
+                count += 1
+    return count
+
+def match_nested_divisibility_loop(program, pc):
+    """Match a divisibility loop (see match_divisibility_loop) nested in a loop
+    over x:
+
+        set y k      <- pc
+        ...          (divisibility loop)
+        sub x -1
+        set u x
+        sub u m
+        jnz u -13
+
+    Return the operand indices (t, x, y, n, f, v, k, u, m) or None."""
+
+    ops, xs, ys = program.ops, program.x, program.y
+    if pc + 14 > len(ops) or ops[pc] != SET:
+        return None
+    inner = match_divisibility_loop(program, pc+1)
+    if inner is None:
+        return None
+
+    t, x, y, n, f, v = inner
+    k = ys[pc]
+    if xs[pc] != y or not is_increment(program, pc+10, x):
+        return None
+    m = ys[pc+12]
+    u = match_test(program, pc+11, x, m, -13)
+    if u is None or constant(program, x) is not None:
+        return None
+    # x, u are also modified now
+    modified = {t, y, f, x, u}
+    if (constant(program, u) is not None or u in (y, f, x) or
+            modified & {n, m, k} or v in modified):
+        return None
+
+    return t, x, y, n, f, v, k, u, m
+
+def nested_divisibility_loop(head, t, x, y, n, f, v, k, u, m):
+    """Return the NATIVE function of the nested divisibility loop starting at
+    head: for each x from its value to m-1 and each y from k to n-1, if
+    x*y == n then f = v."""
+
+    def native(registers, profile):
+        x0, x_bound = registers[x], registers[m]
+        y0, y_bound = registers[k], registers[n]
+        if x0 >= x_bound or y0 >= y_bound: # let it run one by one
+            registers[y] = registers[k]
+            if profile is not None:
+                profile[head] += 1
+            return head + 1, 1
+
+        n_outer = x_bound - x0
+        n_inner = y_bound - y0
+        # x*y == 0 is impossible, both are non-zero when y_bound == 0
+        n_hits = 0
+        if y_bound != 0:
+            n_hits = count_products(y_bound, x0, x_bound, y0, y_bound)
+
+        if n_hits:
+            registers[f] = registers[v]
+        registers[t] = registers[u] = 0
+        registers[y] = y_bound
+        registers[x] = x_bound
+
+        if profile is not None:
+            profile[head] += n_outer
+            for i in range(1, 10):
+                profile[head+i] += n_hits if i == 5 else n_outer * n_inner
+            for i in range(10, 14):
+                profile[head+i] += n_outer
+        return head + 14, n_outer * (5 + 8*n_inner) + n_hits
+
+    return native
+
+def optimize(program):
+    """Return a copy of program whose (nested) divisibility loops are replaced
+    by NATIVE instructions. A loop is replaced only if no other instruction
+    jumps into it."""
+
+    targets = jump_targets(program)
+    if targets is None: # any instruction can be the target of a jump
+        return program
+
+    def jumped_into(start, end):
+        return any(target in range(start+1, end) and not start <= pc < end
+                   for pc, target in targets)
+
+    ops, xs = list(program.ops), list(program.x)
+    natives = list(program.natives)
+    loops = [(match_nested_divisibility_loop, nested_divisibility_loop, 14),
+             (match_divisibility_loop, divisibility_loop, 9)]
+
+    for pc in range(len(ops)):
+        for match, make_native, size in loops:
+            operands = match(program, pc)
+            if operands is not None and not jumped_into(pc, pc + size):
+                ops[pc], xs[pc] = NATIVE, len(natives)
+                natives.append(make_native(pc, *operands))
+                break
+
+    return program._replace(ops=ops, x=xs, natives=tuple(natives))
+
+def hot_instructions(program, profile, n=10):
+    """Return the n most executed instructions as (count, pc, source)."""
+
+    counts = sorted(((count, pc) for pc, count in enumerate(profile)),
+                    reverse=True)
+    return [(count, pc, program.source[pc]) for count, pc in counts[:n]]
+
+def run_process(program, registers, inbox, outbox, batch=None, profile=None):
+    """Run program as a cooperative process (a generator). Each time it is
+    resumed, execute at most batch instructions (until it blocks or halts if
+    batch is None) and yield (status, number of steps, number of values sent).
+    Stop after it halts."""
+
+    pc = 0
+    while True:
+        # only this process runs until it yields, so nobody else can touch
+        # its outbox in the meantime
+        n_values = len(outbox)
+        status, pc, steps = execute(program, registers, pc, inbox, outbox,
+                                    batch, profile)
+        yield status, steps, len(outbox) - n_values
+        if status == HALTED:
+            return
+
+def schedule(processes):
+    """Resume each process (see run_process) in turn until all of them are
+    halted or blocked on an empty inbox (deadlock). Return the last status and
+    the number of values sent by each process."""
+
+    statuses = [None] * len(processes)
+    n_sent = [0] * len(processes)
+
+    while True:
+        # a whole round without executing any instruction means that no
+        # process can receive anything anymore
+        progress = False
+        for i, process in enumerate(processes):
+            if statuses[i] == HALTED:
+                continue
+            statuses[i], steps, sent = next(process)
+            n_sent[i] += sent
+            progress |= steps > 0
+
+        if not progress:
+            return statuses, n_sent
@@ -13,14 +13,21 @@ def find_captcha(number, offset=1):
 
     return s
 
+def solve(text):
+    """Read the captcha from text. Yield the answer of each part."""
+
+    if isinstance(text, bytes):
+        text = text.decode()
+
+    number = text.strip()
+    yield find_captcha(number)
+    yield find_captcha(number, offset=len(number)//2)
+
 if __name__ == '__main__':
     filename = "day01_captcha.txt"
     if not os.path.exists(filename):
         print("ERROR. Name your input file as:", filename)
     else:
-        number = open(filename).read().strip()
-        part_1 = find_captcha(number)
-        print("PART ONE:", part_1)
-        part_2 = find_captcha(number, offset=len(number)//2)
-        print("PART TWO:", part_2)
-
+        answers = solve(open(filename).read())
+        print("PART ONE:", next(answers))
+        print("PART TWO:", next(answers))
@@ -29,13 +29,21 @@ def evenly_divide_rows(lines):
 
     return s
 
+def solve(text):
+    """Read the spreadsheet from text. Yield the answer of each part."""
+
+    if isinstance(text, bytes):
+        text = text.decode()
+
+    lines = text.strip().split("\n")
+    yield checksum_rows(lines)
+    yield evenly_divide_rows(lines)
+
 if __name__ == '__main__':
     filename = "day02_spreadsheet.txt"
     if not os.path.exists(filename):
         print("ERROR. Name your input file as:", filename)
     else:
-        lines = open(filename).read().strip().split("\n")
-        part_1 = checksum_rows(lines)
-        print("PART ONE:", part_1)
-        part_2 = evenly_divide_rows(lines)
-        print("PART TWO:", part_2)
+        answers = solve(open(filename).read())
+        print("PART ONE:", next(answers))
+        print("PART TWO:", next(answers))
@@ -20,12 +20,20 @@ def number_valid(passphrases):
 
     return n_valid_1, n_valid_2
 
+def solve(text):
+    """Read the passphrases from text. Yield the answer of each part."""
+
+    if isinstance(text, bytes):
+        text = text.decode()
+
+    passphrases = text.strip().split("\n")
+    yield from number_valid(passphrases)
+
 if __name__ == '__main__':
     filename = "day04_passphrases.txt"
     if not os.path.exists(filename):
         print("ERROR. Name your input file as:", filename)
     else:
-        passphrases = open(filename).read().strip().split("\n")
-        part_1, part_2 = number_valid(passphrases)
-        print("PART ONE:", part_1)
-        print("PART TWO:", part_2)
+        answers = solve(open(filename).read())
+        print("PART ONE:", next(answers))
+        print("PART TWO:", next(answers))
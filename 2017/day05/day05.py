@@ -19,14 +19,21 @@ def n_steps(array, specific_condition=False):
 
     return step
 
+def solve(text):
+    """Read the jump offsets from text. Yield the answer of each part."""
+
+    if isinstance(text, bytes):
+        text = text.decode()
+
+    offsets = list(map(int, text.split()))
+    yield n_steps(offsets[:]) # copy because we need original for part 2
+    yield n_steps(offsets, specific_condition=True)
+
 if __name__ == '__main__':
     filename = "day05_jumps.txt"
     if not os.path.exists(filename):
         print("ERROR. Name your input file as:", filename)
     else:
-        lines = open(filename).read().split()
-        offsets = list(map(int, lines))
-        part_1 = n_steps(offsets[:]) # copy because we need original for part 2
-        print("PART ONE:", part_1)
-        part_2 = n_steps(offsets, specific_condition=True)
-        print("PART TWO:", part_2)
+        answers = solve(open(filename).read())
+        print("PART ONE:", next(answers))
+        print("PART TWO:", next(answers))
@@ -36,12 +36,20 @@ def loop_size(banks):
 
     return n_state, n_state - states[representation]
 
+def solve(text):
+    """Read the memory banks from text. Yield the answer of each part."""
+
+    if isinstance(text, bytes):
+        text = text.decode()
+
+    banks = list(map(int, text.split()))
+    yield from loop_size(banks)
+
 if __name__ == '__main__':
     filename = "day06_banks.txt"
     if not os.path.exists(filename):
         print("ERROR. Name your input file as:", filename)
     else:
-        banks = list(map(int, open(filename).read().split()))
-        part_1, part_2 = loop_size(banks)
-        print("PART ONE:", part_1)
-        print("PART TWO:", part_2)
+        answers = solve(open(filename).read())
+        print("PART ONE:", next(answers))
+        print("PART TWO:", next(answers))
@@ -93,12 +93,20 @@ def verify(tree, node):
         # children are ok, so the problem comes from faulty_node
         return tree[faulty_node]["weight"] + (correct - faulty)
 
+def solve(text):
+    """Read the tower structure from text. Yield the answer of each part."""
+
+    if isinstance(text, bytes):
+        text = text.decode()
+
+    lines = text.strip().split("\n")
+    yield from find_faulty_weight(lines)
+
 if __name__ == '__main__':
     filename = "day07_structure.txt"
     if not os.path.exists(filename):
         print("ERROR. Name your input file as:", filename)
     else:
-        lines = open(filename).read().strip().split("\n")
-        part_1, part_2 = find_faulty_weight(lines)
-        print("PART ONE:", part_1)
-        print("PART TWO:", part_2)
+        answers = solve(open(filename).read())
+        print("PART ONE:", next(answers))
+        print("PART TWO:", next(answers))
@@ -25,12 +25,20 @@ def process_instructions(instructions):
 
     return max(registers.values()), max_held_val
 
+def solve(text):
+    """Read the instructions from text. Yield the answer of each part."""
+
+    if isinstance(text, bytes):
+        text = text.decode()
+
+    instructions = text.strip().split("\n")
+    yield from process_instructions(instructions)
+
 if __name__ == '__main__':
     filename = "day08_instructions.txt"
     if not os.path.exists(filename):
         print("ERROR. Name your input file as:", filename)
     else:
-        instructions = open(filename).read().strip().split("\n")
-        part_1, part_2 = process_instructions(instructions)
-        print("PART ONE:", part_1)
-        print("PART TWO:", part_2)
+        answers = solve(open(filename).read())
+        print("PART ONE:", next(answers))
+        print("PART TWO:", next(answers))
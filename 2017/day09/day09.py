@@ -29,12 +29,20 @@ def score(stream):
 
     return score, garbage_length
 
+def solve(text):
+    """Read the stream from text. Yield the answer of each part."""
+
+    if isinstance(text, bytes):
+        text = text.decode()
+
+    stream = text.strip()
+    yield from score(stream)
+
 if __name__ == '__main__':
     filename = "day09_stream.txt"
     if not os.path.exists(filename):
         print("ERROR. Name your input file as:", filename)
     else:
-        stream = open(filename).read().strip()
-        part_1, part_2 = score(stream)
-        print("PART ONE:", part_1)
-        print("PART TWO:", part_2)
+        answers = solve(open(filename).read())
+        print("PART ONE:", next(answers))
+        print("PART TWO:", next(answers))
@@ -1,60 +1,31 @@
 #!/usr/bin/env python3
 
 import os.path
+import sys
 
-def knot_round(lengths, numbers, position=0, skip_size=0):
-    """Process one round of knot hash algorithm on numbers list."""
+# when run as a script, the modules shared by the days of 2017 are in the
+# parent directory (aoc.days.load_module adds it when it imports the script)
+if __name__ == "__main__":
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                 ".."))
+from knothash import knot_hash, sparse_hash
 
-    n = 256 # size of numbers array
+def solve(text):
+    """Read the lengths from text. Yield the answer of each part."""
 
-    for length in list(map(int, lengths.split(","))):
-        end = position + length
+    if isinstance(text, bytes):
+        text = text.decode()
 
-        if end < n:
-            numbers[position:end] = numbers[position:end][::-1]
-        else:
-            rev_sublist = (2 * numbers)[position:end][::-1]
-            numbers[position:] = rev_sublist[:n-position]
-            numbers[:end%n] = rev_sublist[n-position:]
-
-        position = (position + length + skip_size) % n
-        skip_size += 1
-
-    return position, skip_size, numbers[0] * numbers[1]
-
-def knot_hash(message):
-    """Compute the Knot Hash of message."""
-
-    ascii_codes = [str(ord(c)) for c in message]
-    ascii_codes = ','.join(ascii_codes + ["17", "31", "73", "47", "23"])
-
-    numbers  = list(range(256))
-    position = skip_size = 0
-
-    # do 64 rounds
-    for _ in range(64):
-        position, skip_size, _ =  knot_round(ascii_codes, numbers,
-                                             position, skip_size)
-
-    # sparse hash (256 elements) => deep hash (16 elements)
-    deep_hash = []
-    for i in range(0, 256, 16):
-        xor = 0
-        for j in range(16):
-            xor ^= numbers[i+j]
-        deep_hash.append(xor)
-
-    hex_hash = ''.join([hex(x)[2:] for x in deep_hash])
-
-    return hex_hash
+    lengths = text.strip()
+    numbers = sparse_hash([int(x) for x in lengths.split(",")])
+    yield numbers[0] * numbers[1]
+    yield knot_hash(lengths)
 
 if __name__ == '__main__':
     filename = "day10_lengths.txt"
     if not os.path.exists(filename):
         print("ERROR. Name your input file as:", filename)
     else:
-        lengths = open(filename).read().strip()
-        _, _, part_1 = knot_round(lengths, list(range(256)))
-        print("PART ONE:", part_1)
-        part_2 = knot_hash(lengths)
-        print("PART TWO:", part_2)
+        answers = solve(open(filename).read())
+        print("PART ONE:", next(answers))
+        print("PART TWO:", next(answers))
@@ -31,12 +31,20 @@ def min_steps(path):
     steps = max(abs(x), abs(y), abs(x-y))
     return steps, max_distance
 
+def solve(text):
+    """Read the path from text. Yield the answer of each part."""
+
+    if isinstance(text, bytes):
+        text = text.decode()
+
+    path = text.strip().split(',')
+    yield from min_steps(path)
+
 if __name__ == '__main__':
     filename = "day11_path.txt"
     if not os.path.exists(filename):
         print("ERROR. Name your input file as:", filename)
     else:
-        path = open(filename).read().strip().split(',')
-        part_1, part_2 = min_steps(path)
-        print("PART ONE:", part_1)
-        print("PART TWO:", part_2)
+        answers = solve(open(filename).read())
+        print("PART ONE:", next(answers))
+        print("PART TWO:", next(answers))
@@ -1,60 +1,116 @@
 #!/usr/bin/env python3
 
 import os.path
+from array import array
 
-def programs_reached(neighbors, start_id):
-    """Return the list of programs connected to (and including) start_id."""
+def new_sets():
+    """Return empty disjoint sets of programs: the parent, rank and size arrays
+    (indexed by program id)."""
 
-    already_seen = {start_id}
-    to_visit     = set(neighbors[start_id])
+    return array("l"), array("l"), array("l")
 
-    while len(to_visit) > 0:
-        next_to_visit = set()
-        for node in to_visit:
-            already_seen.add(node)
-            for next_node in neighbors[node]:
-                if next_node not in already_seen and \
-                   next_node not in to_visit:
-                    next_to_visit.add(next_node)
+def grow(sets, n):
+    """Add programs to sets, each in its own group, until there are n."""
 
-        to_visit = next_to_visit
+    parent, rank, size = sets
+    k = n - len(parent)
+    if k > 0:
+        parent.extend(range(len(parent), n))
+        rank.extend([0] * k)
+        size.extend([1] * k)
 
-    return already_seen
+def find(sets, x):
+    """Return the root program of the group of x. Compress the path on the
+    way: each visited program then points to the root."""
+
+    parent = sets[0]
+    root = x
+    while parent[root] != root:
+        root = parent[root]
+    while parent[x] != root:
+        parent[x], x = root, parent[x]
+
+    return root
+
+def link(sets, a, b):
+    """Merge the groups of roots a and b (a != b). Return the new root."""
+
+    parent, rank, size = sets
+
+    # attach the shallowest tree under the deepest one
+    if rank[a] < rank[b]:
+        a, b = b, a
+    parent[b] = a
+    size[a] += size[b]
+    if rank[a] == rank[b]:
+        rank[a] += 1
+
+    return a
+
+def union(sets, a, b):
+    """Merge the groups of programs a and b. Return the root of the group."""
+
+    grow(sets, max(a, b) + 1)
+    a, b = find(sets, a), find(sets, b)
+
+    return a if a == b else link(sets, a, b)
+
+def add_pipes(sets, lines):
+    """Read each line ("2 <-> 0, 3, 4") and merge the groups of the connected
+    programs. lines can be any iterable (like a file), and the sets can still
+    be given more pipes afterwards."""
+
+    parent = sets[0]
+    for line in lines:
+        program, _, neighbors = line.partition("<->")
+        if not neighbors:
+            continue
+        programs = [int(x) for x in neighbors.split(",")]
+        programs.append(int(program))
+        grow(sets, max(programs) + 1)
+
+        root = programs.pop()
+        if parent[root] != root:
+            root = find(sets, root)
+        for other in programs:
+            if parent[other] != other:
+                other = find(sets, other)
+            if other != root:
+                root = link(sets, root, other)
+
+def group_size(sets, program):
+    """Return the number of programs in the group of program."""
+
+    return sets[2][find(sets, program)]
+
+def count_groups(sets):
+    """Return the number of independent groups."""
+
+    return sum(1 for i, root in enumerate(sets[0]) if i == root)
 
 def n_groups(lines):
     """Read each line to build the pipes map, find the number of different
     independent groups (part 2) and number of programs in group 0 (part 1)."""
 
-    # build communication map
-    neighbors = {}
-    for line in lines:
-        line = line.strip().split("<->")
-        program = int(line[0])
-        neigh = list(map(int, line[1].split(',')))
-        neighbors[program] = neigh
+    sets = new_sets()
+    add_pipes(sets, lines)
 
-    # cell[i] contains the group_id of program with id i
-    group_of = [None for _ in range(len(neighbors))]
-    group_id = 0
+    return group_size(sets, 0), count_groups(sets)
 
-    for i in range(len(neighbors)):
-        if group_of[i] is None: # never seen, so use it as starting node
-            programs = programs_reached(neighbors, i)
-            for prog in programs:
-                group_of[prog] = group_id
-            group_id += 1 # move to next group
+def solve(text):
+    """Read the pipes from text. Yield the answer of each part."""
 
-    # find number of programs in group 0
-    group0 = [x for x in group_of if x == 0]
+    if isinstance(text, bytes):
+        text = text.decode()
 
-    return len(group0), group_id
+    pipes = text.strip().split('\n')
+    yield from n_groups(pipes)
 
 if __name__ == '__main__':
     filename = "day12_village.txt"
     if not os.path.exists(filename):
         print("ERROR. Name your input file as:", filename)
     else:
-        pipes = open(filename).read().strip().split('\n')
-        part_1, part_2 = n_groups(pipes)
-        print("PART ONE:", part_1)
-        print("PART TWO:", part_2)
+        answers = solve(open(filename).read())
+        print("PART ONE:", next(answers))
+        print("PART TWO:", next(answers))
@@ -2,6 +2,7 @@
 
 import os.path
 from collections import defaultdict
+from math import gcd
 
 def create_lengths(lines):
     """Read lines to create a list of layers length."""
@@ -38,35 +39,107 @@ def compute_severity(lengths):
 
     return severity
 
-def find_delay(lengths):
-    """Find the delay required to not get caught."""
+def forbidden_residues(lengths):
+    """Return a dict {period: set of delays modulo period to avoid}."""
 
-    # bruteforce: test all delays until finding the right one. We stop when the
-    # packet can traverse all layers without getting caught.
-    delay = 0
-    while True:
-        caught = False
-        for depth in range(len(lengths)):
-            if lengths[depth] == 0:
-                continue
-            if (depth+delay) % (2 * (lengths[depth] - 1)) == 0:
-                caught = True
-                break
+    # the packet arrives at layer depth at time depth+delay, so it is caught if
+    # depth+delay = 0 modulo the period 2*(n-1) of the scanner. A layer of
+    # length 1 always catches the packet (period 1, every delay is forbidden).
+    forbidden = defaultdict(set)
+    for depth in range(len(lengths)):
+        if lengths[depth] == 0:
+            continue
+        period = max(2 * (lengths[depth] - 1), 1)
+        forbidden[period].add(-depth % period)
+
+    return forbidden
+
+def merge_periods(forbidden, limit):
+    """Combine the periods of forbidden into one modulus M (their LCM) and the
+    sorted list of delays modulo M that are allowed by all of them. Stop when M
+    or the number of allowed delays would exceed limit. Return M, the allowed
+    delays and the list of (period, residues) that could not be merged."""
+
+    modulus, allowed = 1, [0]
+    periods = sorted(forbidden.items())
+
+    for i, (period, residues) in enumerate(periods):
+        lcm = modulus * period // gcd(modulus, period)
+        if lcm > limit or len(allowed) * (lcm // modulus) > limit:
+            return modulus, allowed, periods[i:]
+
+        # each allowed delay r modulo M is r, r+M, r+2M... modulo the LCM
+        allowed = sorted(delay for r in allowed
+                         for delay in range(r, lcm, modulus)
+                         if delay % period not in residues)
+        modulus = lcm
+
+    return modulus, allowed, []
+
+def sieve_delay(modulus, allowed, periods, block_size):
+    """Find the smallest delay that is one of allowed modulo modulus and that is
+    not forbidden by periods (a list of (period, residues)). Sieve the delays
+    by blocks of about block_size. Return None if there is no such delay."""
+
+    # the block starts with the allowed delays modulo M, repeated
+    n_repeat = max(1, block_size // modulus)
+    size = modulus * n_repeat
+    pattern = bytearray(modulus)
+    for r in allowed:
+        pattern[r] = 1
+    pattern *= n_repeat
+
+    # the delays allowed modulo the LCM of all periods repeat forever, so if
+    # none is found below the LCM, there is none.
+    end = modulus
+    for period, _ in periods:
+        end = end * period // gcd(end, period)
+
+    start = 0
+    while start < end:
+        block = bytearray(pattern)
+        for period, residues in periods:
+            for r in residues:
+                first = (r - start) % period
+                block[first::period] = bytes((size - first - 1) // period + 1)
+        delay = block.find(1)
+        if delay != -1:
+            return start + delay
+        start += size
+
+    return None
+
+def find_delay(lengths, limit=1 << 16, block_size=1 << 20):
+    """Find the delay required to not get caught. Return None if the packet is
+    always caught."""
+
+    # instead of testing all delays, combine the delays allowed by each period
+    # as long as their LCM stays small, then sieve the delays with the periods
+    # left, block by block.
+    modulus, allowed, periods = merge_periods(forbidden_residues(lengths),
+                                              limit)
+    if not allowed:
+        return None
+    if not periods:
+        return allowed[0]
+
+    return sieve_delay(modulus, allowed, periods, block_size)
 
-        if not caught:
-            break
+def solve(text):
+    """Read the firewall from text. Yield the answer of each part."""
 
-        delay += 1
+    if isinstance(text, bytes):
+        text = text.decode()
 
-    return delay
+    lengths = create_lengths(text.strip().split("\n"))
+    yield compute_severity(lengths)
+    yield find_delay(lengths)
 
 if __name__ == '__main__':
     filename = "day13_firewall.txt"
     if not os.path.exists(filename):
         print("ERROR. Name your input file as:", filename)
     else:
-        lengths = create_lengths(open(filename).read().strip().split("\n"))
-        part_1 = compute_severity(lengths)
-        print("PART ONE:", part_1)
-        part_2 = find_delay(lengths)
-        print("PART TWO:", part_2)
+        answers = solve(open(filename).read())
+        print("PART ONE:", next(answers))
+        print("PART TWO:", next(answers))
@@ -1,105 +1,79 @@
 #!/usr/bin/env python3
 
 import os.path
+import sys
 
-def knot_round(lengths, numbers, position=0, skip_size=0):
-    """Process one round of knot hash algorithm on numbers list."""
+# when run as a script, the modules shared by the days of 2017 are in the
+# parent directory (aoc.days.load_module adds it when it imports the script)
+if __name__ == "__main__":
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                 ".."))
+from knothash import knot_hashes
 
-    n = 256 # size of numbers array
-
-    for length in list(map(int, lengths.split(","))):
-        end = position + length
-
-        if end < n:
-            numbers[position:end] = numbers[position:end][::-1]
-        else:
-            rev_sublist = (2 * numbers)[position:end][::-1]
-            numbers[position:] = rev_sublist[:n-position]
-            numbers[:end%n] = rev_sublist[n-position:]
-
-        position = (position + length + skip_size) % n
-        skip_size += 1
-
-    return position, skip_size, numbers[0] * numbers[1]
-
-def knot_hash(message):
-    """Compute the Knot Hash of message. Return the binary string of hash."""
-
-    ascii_codes = [str(ord(c)) for c in message]
-    ascii_codes = ','.join(ascii_codes + ["17", "31", "73", "47", "23"])
-
-    numbers  = list(range(256))
-    position = skip_size = 0
-
-    # do 64 rounds
-    for _ in range(64):
-        position, skip_size, _ =  knot_round(ascii_codes, numbers,
-                                             position, skip_size)
-
-    # sparse hash (256 elements) => deep hash (16 elements)
-    deep_hash = []
-    for i in range(0, 256, 16):
-        xor = 0
-        for j in range(16):
-            xor ^= numbers[i+j]
-        deep_hash.append(xor)
-
-    bin_hash = ''.join(["{:0>8}".format(bin(x)[2:]) for x in deep_hash])
-
-    return bin_hash
-
-def n_bits_1(message):
+def n_bits_1(message, n_rows=128):
     """Compute number of bits equal to 1 in all binary knot hashes of message-0
-    to message-127. Return the grid formed by all hashes as well."""
+    to message-(n_rows-1). Return the grid formed by all hashes as well, as a
+    list of integers (bit j of row i is the square (i,j))."""
 
-    grid = [knot_hash("{}-{}".format(message, i)) for i in range(128)]
-    n    = sum([row.count("1") for row in grid])
+    grid = knot_hashes(["{}-{}".format(message, i) for i in range(n_rows)],
+                       as_int=True)
+    n    = sum(row.bit_count() for row in grid)
 
     return n, grid
 
-def visit_region(grid, seen, i, j):
-    """Start at (i,j), mark all points of the same region as seen."""
-
-    # already seen, nothing more to do
-    if seen[i][j]:
-        return
-
-    seen[i][j] = True
-
-    # not in the same region, no need to see neighbors
-    if grid[i][j] == "0":
-        return
-
-    # visit each 4 neighbors
-    if i > 0:
-        visit_region(grid, seen, i-1, j)
-    if i < 127:
-        visit_region(grid, seen, i+1, j)
-    if j > 0:
-        visit_region(grid, seen, i, j-1)
-    if j < 127:
-        visit_region(grid, seen, i, j+1)
+def remove_region(rows, i, seed):
+    """Remove from rows all squares of the region containing the squares seed
+    (a bitmask) of row i."""
+
+    to_visit = [(i, seed)]
+    while to_visit:
+        i, bits = to_visit.pop()
+        bits &= rows[i]
+        if not bits:
+            continue
+
+        # spread to the left and right neighbors within the row
+        while True:
+            spread = (bits | bits << 1 | bits >> 1) & rows[i]
+            if spread == bits:
+                break
+            bits = spread
+
+        # remove them, then visit the same columns on the rows above and below
+        rows[i] &= ~bits
+        if i > 0:
+            to_visit.append((i-1, bits))
+        if i < len(rows) - 1:
+            to_visit.append((i+1, bits))
 
 def number_regions(grid):
-    """Find the number of independent regions of '1' in grid."""
+    """Find the number of independent regions of 1 bits in grid."""
 
-    seen = [[False for _ in range(128)] for _ in range(128)]
+    rows = list(grid)
     n = 0
-    for i in range(128):
-        for j in range(128):
-            if grid[i][j] == "1" and not seen[i][j]:
-                n += 1
-                visit_region(grid, seen, i, j)
+    for i in range(len(rows)):
+        while rows[i]:
+            remove_region(rows, i, rows[i] & -rows[i]) # lowest bit of row
+            n += 1
 
     return n
 
+def solve(text):
+    """Read the key string from text. Yield the answer of each part."""
+
+    if isinstance(text, bytes):
+        text = text.decode()
+
+    string = text.strip()
+    part_1, grid = n_bits_1(string)
+    yield part_1
+    yield number_regions(grid)
+
 if __name__ == '__main__':
     filename = "day14_string.txt"
     if not os.path.exists(filename):
         print("ERROR. Name your input file as:", filename)
     else:
-        string = open(filename).read().strip()
-        part_1, grid = n_bits_1(string)
-        print("PART ONE:", part_1)
-        part_2 = number_regions(grid)
-        print("PART TWO:", part_2)
+        answers = solve(open(filename).read())
+        print("PART ONE:", next(answers))
+        print("PART TWO:", next(answers))
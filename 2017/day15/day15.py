@@ -1,38 +1,177 @@
 #!/usr/bin/env python3
 
 import os.path
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import compress
 
-def n_matches(valA, valB, n_pairs, criteria=False):
-    """Return number of value matches between generator A and generator B after
-    n_pairs generated."""
+P = 2**31 - 1
+MUL_A, MUL_B = 16807, 48271
+
+# The values of a generator are computed by blocks of LANES consecutive values,
+# packed in a single integer: value i of the block is in bits [64i, 64i+64).
+# Going from one block to the next multiplies each value by mul^LANES modulo P
+# (skip-ahead), which is one big integer multiplication and a few masks, done
+# at C speed instead of one Python operation per value.
+LANES = 1 << 14
+
+def lanes_of(value, n=LANES):
+    """Return the integer made of n lanes of 64 bits equal to value."""
+
+    return int.from_bytes(value.to_bytes(8, "little") * n, "little")
+
+MASK_P, MASK_1 = lanes_of(P), lanes_of(1)
+MASK_16, BIT_16 = lanes_of(0xFFFF), lanes_of(1 << 16)
+
+def first_block(value, mul):
+    """Return the block of the LANES values generated after value."""
+
+    values = array("Q")
+    for _ in range(LANES):
+        value = (value * mul) % P
+        values.append(value)
+    if sys.byteorder == "big":
+        values.byteswap()
+
+    return int.from_bytes(values.tobytes(), "little")
+
+def next_block(block, step):
+    """Return the block following block, where step is mul^LANES modulo P."""
+
+    # each lane is < 2^31 * 2^31, so the lanes do not overflow into each other.
+    # Since P = 2^31 - 1, x = (x >> 31) + (x & P) modulo P, and two such folds
+    # bring each lane back below P.
+    block *= step
+    block = (block & MASK_P) + (block >> 31 & MASK_P)
+    return (block & MASK_P) + (block >> 31 & MASK_1)
+
+def count_equal(blockA, blockB, n=LANES):
+    """Return the number of lanes, among the first n ones, whose lowest 16 bits
+    are the same in blockA and blockB."""
+
+    # a lane of diff is 0 if and only if adding 0xFFFF to it does not carry
+    # into its bit 16
+    diff = (blockA ^ blockB) & MASK_16
+    differ = (diff + MASK_16) & BIT_16
+    if n < LANES:
+        differ &= (1 << 64*n) - 1
+
+    return n - differ.bit_count()
+
+def count_segment(valA, valB, start, n_pairs):
+    """Return number of value matches between generator A and generator B among
+    the pairs start+1 to start+n_pairs."""
+
+    # skip ahead to the start of the segment
+    valA = (valA * pow(MUL_A, start, P)) % P
+    valB = (valB * pow(MUL_B, start, P)) % P
+    stepA, stepB = pow(MUL_A, LANES, P), pow(MUL_B, LANES, P)
+    blockA, blockB = first_block(valA, MUL_A), first_block(valB, MUL_B)
 
     n = 0
-    mulA, mulB, p = 16807, 48271, 2**31 - 1
+    while True:
+        n += count_equal(blockA, blockB, min(n_pairs, LANES))
+        n_pairs -= LANES
+        if n_pairs <= 0:
+            return n
+        blockA, blockB = next_block(blockA, stepA), next_block(blockB, stepB)
+
+def filtered_values(value, mul, multiple):
+    """Yield the lowest 16 bits of the values of the generator that are a
+    multiple of multiple (a power of 2). For each block, yield the bytes of the
+    lowest 8 bits of the kept values, and the bytes of their next 8 bits."""
 
-    for _ in range(n_pairs):
-        valA = (valA * mulA) % p
-        valB = (valB * mulB) % p
+    keep = bytes(b % multiple == 0 for b in range(256))
+    step = pow(mul, LANES, P)
+    block = first_block(value, mul)
 
-        # regenerate until it's a multiple of 4 (for part 2)
-        while criteria and (valA & 0b11) > 0:
-            valA = (valA * mulA) % p
-        # regenerate until it's a multiple of 8 (for part 2)
-        while criteria and (valB & 0b111) > 0:
-            valB = (valB * mulB) % p
+    while True:
+        # byte 8i (resp. 8i+1) of raw holds bits 0-7 (resp. 8-15) of value i.
+        # Iterating over bytes does not create any int object, so compress is
+        # fast.
+        raw = block.to_bytes(LANES * 8, "little")
+        low = raw[0::8]
+        selected = low.translate(keep)
+        yield bytes(compress(low, selected)), bytes(compress(raw[1::8],
+                                                             selected))
+        block = next_block(block, step)
 
-        if (valA &  0xFFFF) == (valB &  0xFFFF): # same last 16 bits
-            n += 1
+def count_equal_bytes(lowA, highA, lowB, highB):
+    """Return the number of indexes i where lowA[i] == lowB[i] and highA[i] ==
+    highB[i]."""
+
+    n = len(lowA)
+    diff = (int.from_bytes(lowA, "little") ^ int.from_bytes(lowB, "little")) | \
+           (int.from_bytes(highA, "little") ^ int.from_bytes(highB, "little"))
+
+    # bit 7 of each byte of differ is set if and only if the byte of diff is not
+    # 0 (the addition never carries into the next byte)
+    mask_7f = int.from_bytes(b"\x7f" * n, "little")
+    mask_80 = int.from_bytes(b"\x80" * n, "little")
+    differ = (((diff & mask_7f) + mask_7f) | diff) & mask_80
+
+    return n - differ.bit_count()
+
+def n_matches_filtered(valA, valB, n_pairs):
+    """Return number of value matches between the multiples of 4 of generator A
+    and the multiples of 8 of generator B after n_pairs generated."""
+
+    valuesA = filtered_values(valA, MUL_A, 4)
+    valuesB = filtered_values(valB, MUL_B, 8)
+    lowA = highA = lowB = highB = b""
+
+    # generator B keeps fewer values than A: the values of each one wait in a
+    # buffer until the other one generates the values to pair them with
+    n = 0
+    while n_pairs > 0:
+        if not lowA:
+            lowA, highA = next(valuesA)
+        if not lowB:
+            lowB, highB = next(valuesB)
+
+        m = min(len(lowA), len(lowB), n_pairs)
+        n += count_equal_bytes(lowA[:m], highA[:m], lowB[:m], highB[:m])
+        lowA, highA, lowB, highB = lowA[m:], highA[m:], lowB[m:], highB[m:]
+        n_pairs -= m
 
     return n
 
+def n_matches(valA, valB, n_pairs, criteria=False, jobs=1):
+    """Return number of value matches between generator A and generator B after
+    n_pairs generated. With criteria, only multiples of 4 (for A) and of 8 (for
+    B) are kept. Without criteria, the pairs can be split into segments counted
+    by a pool of jobs processes."""
+
+    if criteria:
+        return n_matches_filtered(valA, valB, n_pairs)
+    if jobs <= 1 or n_pairs <= 0:
+        return count_segment(valA, valB, 0, n_pairs)
+
+    # segments of a whole number of blocks
+    size = -(-n_pairs // (jobs * LANES)) * LANES
+    starts = range(0, n_pairs, size)
+    counts = [min(size, n_pairs - start) for start in starts]
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        return sum(executor.map(count_segment, [valA] * len(starts),
+                                [valB] * len(starts), starts, counts))
+
+def solve(text):
+    """Read the generator seeds from text. Yield the answer of each part."""
+
+    if isinstance(text, bytes):
+        text = text.decode()
+
+    seeds = text.split()
+    seedA, seedB = int(seeds[4]), int(seeds[9])
+    yield n_matches(seedA, seedB, 40000000)
+    yield n_matches(seedA, seedB, 5000000, True)
+
 if __name__ == '__main__':
     filename = "day15_seeds.txt"
     if not os.path.exists(filename):
         print("ERROR. Name your input file as:", filename)
     else:
-        seeds = open(filename).read().split()
-        seedA, seedB = int(seeds[4]), int(seeds[9])
-        part_1 = n_matches(seedA, seedB, 40000000)
-        print("PART ONE:", part_1)
-        part_2 = n_matches(seedA, seedB, 5000000, True)
-        print("PART TWO:", part_2)
+        answers = solve(open(filename).read())
+        print("PART ONE:", next(answers))
+        print("PART TWO:", next(answers))
@@ -21,41 +21,75 @@ def programs_dance(moves, programs):
 
     return "".join(programs)
 
-def programs_dance_repeat(moves):
-    """Find the programs order after 1 billion dances."""
-
-    # the dance is a permutation of all programs (because we end up with a list
-    # of 16 elements containing "a", "b", ... "p" in different order).
-    # Everytime we repeat the dance, we repeat the same permutation. Landau has
-    # proved that recursively applying the same permutation a certain number
-    # of times (named orbit) makes the sequence returns to its original state.
-    # For a sequence of 16 elements, the maximum possible length of this cycle
-    # is 140 (https://oeis.org/A000793). So we start by computing the length of
-    # the cycle of our permutation.
-    original = "abcdefghijklmnop"
-    programs = original[:]
-    len_cycle = 0
-
-    while True: # at most 140 iterations => no infinite loop
-        programs   = programs_dance(moves, list(programs))
-        len_cycle += 1
-        if programs == original:
-            break
-
-    # then, we only need to repeat the dance for (10^9 % len_cycle) to know the
-    # state after 1 billion dance.
-    for _ in range(10**9 % len_cycle):
-        programs = programs_dance(moves, list(programs))
-
-    return programs
+def compile_dance(moves, programs):
+    """Compile the moves sequence into two permutations of the indexes of
+    programs: positions[i] is the position, before the dance, of the program at
+    position i after the dance (moves s and x), and labels[c] is the name
+    (index) that the program named c takes (moves p)."""
+
+    n = len(programs)
+    index = {name: i for i, name in enumerate(programs)}
+    positions = list(range(n))
+    labels, where = list(range(n)), list(range(n)) # where[labels[c]] == c
+
+    for move in moves:
+        if move[0] == "s":
+            x = int(move[1:]) % n
+            positions = positions[n-x:] + positions[:n-x]
+        if move[0] == "x":
+            A, B = map(int, move[1:].split("/"))
+            positions[A], positions[B] = positions[B], positions[A]
+        if move[0] == "p":
+            A, B = (index[name] for name in move[1:].split("/"))
+            cA, cB = where[A], where[B]
+            labels[cA], labels[cB] = B, A
+            where[A], where[B] = cB, cA
+
+    return positions, labels
+
+def power(permutation, k):
+    """Return permutation composed with itself k times (by squaring)."""
+
+    result = list(range(len(permutation)))
+    while k > 0:
+        if k & 1:
+            result = [permutation[i] for i in result]
+        permutation = [permutation[i] for i in permutation]
+        k >>= 1
+
+    return result
+
+def programs_dance_repeat(moves, times=10**9, programs="abcdefghijklmnop"):
+    """Find the programs order after dancing times times."""
+
+    # the moves s and x only move programs according to their positions, and
+    # the moves p only rename them, so both kinds of moves commute. The dance is
+    # then a permutation of the positions followed by a renaming of the
+    # programs, and dancing k times applies k times each of them. A permutation
+    # composed k times is computed in O(log k) compositions.
+    programs = list(programs)
+    positions, labels = compile_dance(moves, programs)
+    positions, labels = power(positions, times), power(labels, times)
+
+    index = {name: i for i, name in enumerate(programs)}
+    return "".join(programs[labels[index[programs[positions[i]]]]]
+                   for i in range(len(programs)))
+
+def solve(text):
+    """Read the dance moves from text. Yield the answer of each part."""
+
+    if isinstance(text, bytes):
+        text = text.decode()
+
+    moves = text.strip().split(',')
+    yield programs_dance(moves, list("abcdefghijklmnop"))
+    yield programs_dance_repeat(moves)
 
 if __name__ == '__main__':
     filename = "day16_dance.txt"
     if not os.path.exists(filename):
         print("ERROR. Name your input file as:", filename)
     else:
-        moves = open(filename).read().strip().split(',')
-        part_1 = programs_dance(moves, list("abcdefghijklmnop"))
-        print("PART ONE:", part_1)
-        part_2 = programs_dance_repeat(moves)
-        print("PART TWO:", part_2)
+        answers = solve(open(filename).read())
+        print("PART ONE:", next(answers))
+        print("PART TWO:", next(answers))
@@ -1,43 +1,70 @@
 #!/usr/bin/env python3
 
-def value_after_2017(step):
-    """Generate the circular buffer according to the rule. Return value next to
-    2017."""
+import os.path
+from collections import deque
 
-    buf, pos = [0], 0
+def value_after_2017(step, n_inserts=2017):
+    """Generate the circular buffer according to the rule. Return value next to
+    the last inserted value (2017)."""
 
-    # i is current length of circular buffer. If i=10 then the buffer
-    # contains number from 0 to 9, so the value inserted is 10 (that's i).
-    for i in range(1, 2018):
-        pos = (pos+step) % i
-        buf = buf[:pos+1] + [i] + buf[pos+1:]
-        pos += 1
+    # the deque is rotated so that the current position is always its last
+    # element: moving forward is a rotation, inserting after the current
+    # position is an append.
+    buf = deque([0])
+    for i in range(1, n_inserts+1):
+        buf.rotate(-(step % i))
+        buf.append(i)
 
-    return buf[pos+1]
+    return buf[0]
 
-def value_after_0(step):
-    """Return the value next to 0 if we insert 50M new items in circular
+def value_after_0(step, n_inserts=50000000):
+    """Return the value next to 0 if we insert n_inserts new items in circular
     buffer."""
 
-    pos, ans = 0, -1
+    # i is the last inserted value (so the buffer has i+1 values) and pos its
+    # position. 0 always stays at position 0, so we only care of the value next
+    # to it. This value change only when we insert a new element directly after
+    # 0 i.e. when the current position wraps around and lands on 0.
+    i, pos, ans = 0, 0, -1
 
-    # it is impossible that a new value is inserted before 0, so it means that 0
-    # will always be at position 0. We only care of the value next to it. This
-    # value change only when we insert a new element directly after 0 i.e. when
-    # the current position after moving forward is 0.
-    for i in range(1, 50000001):
-        pos = (pos+step) % i
+    # with step 0, each value is inserted right after the previous one, so only
+    # the first one (1) is ever next to 0
+    if step == 0:
+        return 1 if n_inserts > 0 else ans
+
+    while i < n_inserts:
+        # the next inserts move pos forward by step+1 without wrapping as long
+        # as pos+step stays in the buffer: skip them all at once.
+        k = min((i - pos) // step, n_inserts - i)
+        i   += k
+        pos += k * (step+1)
+        if i == n_inserts:
+            break
 
+        # insert one value, possibly wrapping
+        i  += 1
+        pos = (pos+step) % i
         if pos == 0:
             ans = i
-
         pos += 1
 
     return ans
 
+def solve(text):
+    """Read the step from text. Yield the answer of each part."""
+
+    if isinstance(text, bytes):
+        text = text.decode()
+
+    step = int(text)
+    yield value_after_2017(step)
+    yield value_after_0(step)
+
 if __name__ == '__main__':
-    step = 371
-    part_1 = value_after_2017(step)
-    print("PART ONE:", part_1)
-    part_2 = value_after_0(step)
-    print("PART TWO:", part_2)
+    filename = "day17_step.txt"
+    if not os.path.exists(filename):
+        print("ERROR. Name your input file as:", filename)
+    else:
+        answers = solve(open(filename).read())
+        print("PART ONE:", next(answers))
+        print("PART TWO:", next(answers))
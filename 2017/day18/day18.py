@@ -1,137 +1,63 @@
 #!/usr/bin/env python3
 
 import os.path
-from collections import defaultdict
+import sys
+from collections import deque
 
-def convert_value(s, registers):
-    """Convert s to integer value, or look its value in registers."""
-
-    try:
-        return int(s)
-    except:
-        return registers[s]
+# when run as a script, the modules shared by the days of 2017 are in the
+# parent directory (aoc.days.load_module adds it when it imports the script)
+if __name__ == "__main__":
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                 ".."))
+from assembly import (BLOCKED, compile_program, execute, new_registers,
+                      run_process, schedule)
 
-def recover_frequency(instructions):
-    """Process each instruction. Return the last played sound when the first
-    "rcv" instruction is met."""
+def recover_frequency(program):
+    """Execute the program. Return the last played sound when the first "rcv"
+    instruction with a non-zero value is met."""
 
-    pos, sound = 0, 0
-    registers  = defaultdict(int)
+    registers = new_registers(program)
+    sounds = deque(maxlen=1) # only the last played sound matters
+    pc = 0
 
     while True:
-        row = instructions[pos].split()
-
-        if row[0] == "snd":
-            sound = convert_value(row[1], registers)
-
-        if row[0] == "set":
-            registers[row[1]]  = convert_value(row[2], registers)
-
-        if row[0] == "add":
-            registers[row[1]] += convert_value(row[2], registers)
-
-        if row[0] == "mul":
-            registers[row[1]] *= convert_value(row[2], registers)
-
-        if row[0] == "mod":
-            registers[row[1]] %= convert_value(row[2], registers)
-
-        if row[0] == "rcv":
-            if convert_value(row[1], registers) != 0:
-                return sound
-
-        if row[0] == "jgz":
-            if convert_value(row[1], registers) > 0:
-                pos += convert_value(row[2], registers) - 1
-
-        pos += 1
-
-def concurrent_programs(instructions):
+        # "rcv" never receives anything here, so the program stops on each one
+        status, pc, _ = execute(program, registers, pc, deque(), sounds)
+        if status != BLOCKED:
+            return None
+        if registers[program.x[pc]] != 0:
+            return sounds[-1]
+        pc += 1
+
+def concurrent_programs(program):
     """Simulate 2 concurrent programs running the instructions. Return the
     number of times program 1 send a value to program 0."""
 
-    registers0 = defaultdict(int)
-    registers1 = defaultdict(int)
-    registers1["p"] = 1
-    pos0 = 0
-    pos1 = 0
-    queue0 = []
-    queue1 = []
-    prog1_send = 0
-
-    while True:
-        row0 = instructions[pos0].split()
-        row1 = instructions[pos1].split()
-
-        # deadlock?
-        if (row0[0] == "rcv" and row1[0] == "rcv"
-            and len(queue0) == 0 and len(queue1) == 0):
-            return prog1_send
-
-        # process instruction on program 1
-        if row1[0] == "snd":
-            queue0.insert(0, convert_value(row1[1], registers1))
-            prog1_send += 1
-
-        if row1[0] == "set":
-            registers1[row1[1]]  = convert_value(row1[2], registers1)
-
-        if row1[0] == "add":
-            registers1[row1[1]] += convert_value(row1[2], registers1)
-
-        if row1[0] == "mul":
-            registers1[row1[1]] *= convert_value(row1[2], registers1)
-
-        if row1[0] == "mod":
-            registers1[row1[1]] %= convert_value(row1[2], registers1)
-
-        if row1[0] == "rcv":
-            if len(queue1) > 0:
-                registers1[row1[1]] = queue1.pop()
-            else: # no value to receive, stay at same instruction
-                pos1 -= 1
-
-        if row1[0] == "jgz":
-            if convert_value(row1[1], registers1) > 0:
-                pos1 += convert_value(row1[2], registers1) - 1
-
-        pos1 += 1
-
-        # process instruction on program 0
-        if row0[0] == "snd":
-            queue1.insert(0, convert_value(row0[1], registers0))
-
-        if row0[0] == "set":
-            registers0[row0[1]]  = convert_value(row0[2], registers0)
-
-        if row0[0] == "add":
-            registers0[row0[1]] += convert_value(row0[2], registers0)
+    queues = [deque(), deque()] # queues[i]: values sent to program i
+    processes = [run_process(program, new_registers(program, p=p), queues[p],
+                             queues[1-p]) for p in (0, 1)]
 
-        if row0[0] == "mul":
-            registers0[row0[1]] *= convert_value(row0[2], registers0)
+    # each program runs until it waits for a value, then the other one runs
+    # until there is a deadlock
+    _, n_sent = schedule(processes)
 
-        if row0[0] == "mod":
-            registers0[row0[1]] %= convert_value(row0[2], registers0)
+    return n_sent[1]
 
-        if row0[0] == "rcv":
-            if len(queue0) > 0:
-                registers0[row0[1]] = queue0.pop()
-            else: # no value to receive, stay at same instruction
-                pos0 -= 1
+def solve(text):
+    """Read the instructions from text. Yield the answer of each part."""
 
-        if row0[0] == "jgz":
-            if convert_value(row0[1], registers0) > 0:
-                pos0 += convert_value(row0[2], registers0) - 1
+    if isinstance(text, bytes):
+        text = text.decode()
 
-        pos0 += 1
+    program = compile_program(text.split("\n"))
+    yield recover_frequency(program)
+    yield concurrent_programs(program)
 
 if __name__ == "__main__":
     filename = "day18_instructions.txt"
     if not os.path.exists(filename):
         print("ERROR. Name your input file as:", filename)
     else:
-        instructions = open(filename).read().split("\n")
-        part_1 = recover_frequency(instructions)
-        print("PART ONE:", part_1)
-        part_2 = concurrent_programs(instructions)
-        print("PART TWO:", part_2)
+        answers = solve(open(filename).read())
+        print("PART ONE:", next(answers))
+        print("PART TWO:", next(answers))
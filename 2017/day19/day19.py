@@ -1,61 +1,131 @@
 #!/usr/bin/env python3
 
+import mmap
 import os.path
-import string
+import re
+from typing import NamedTuple
 
-def next_cell(x, y, direction):
-    """Find coordinates of next cell given direction."""
+# a straight segment of the path goes on as long as it meets - and | (a line
+# crossing the segment), so each jump stops on a +, a letter or a space
+STOP = re.compile(rb"[^-|]")
 
-    if direction == "N":
-        return x-1, y
-    if direction == "E":
-        return x, y+1
-    if direction == "S":
-        return x+1, y
-    if direction == "W":
-        return x, y-1
+# (dx, dy) of each direction
+MOVES = {"N": (-1, 0), "E": (0, 1), "S": (1, 0), "W": (0, -1)}
 
-def follow_path(lines):
-    """Get every letters on the path. Compute length of path as well."""
+class Grid(NamedTuple):
+    """A labyrinth stored as bytes: height lines of width bytes, each followed
+    by a newline (so row x starts at x*(width+1))."""
+    data: bytes
+    width: int
+    height: int
+
+def load_grid(data):
+    """Return the Grid of data (bytes, or mmap of the input file)."""
+
+    width = data.find(b"\n")
+    if width == -1:
+        width = len(data)
+    stride = width + 1
+    height = (len(data) + 1) // stride
+
+    # lines of different lengths are padded with spaces (copies the data)
+    newlines = data[width::stride]
+    if len(data) % stride not in (0, width) or \
+       newlines.count(b"\n") != len(newlines):
+        lines = bytes(data).split(b"\n")
+        width = max(len(line) for line in lines)
+        return load_grid(b"\n".join(line.ljust(width) for line in lines))
+
+    return Grid(data, width, height)
+
+def cell(grid, x, y):
+    """Return the character (as a byte string) at (x, y), space if outside."""
+
+    if 0 <= x < grid.height and 0 <= y < grid.width:
+        i = x * (grid.width + 1) + y
+        return grid.data[i:i+1]
+    return b" "
+
+def jump(grid, x, y, direction, lines):
+    """From (x, y), go in direction along the straight segment. Return the
+    coordinates of the first cell that is not - or | (may be outside of the
+    grid). lines caches the rows and columns (reversed for N and W)."""
+
+    # the row (or column) is read in the direction of the move, so the next
+    # stop is a forward search of the regex from the current position
+    if direction in "EW":
+        key, size, index = (direction, x), grid.width, y
+    else:
+        key, size, index = (direction, y), grid.height, x
+    if key not in lines:
+        stride = grid.width + 1
+        if direction in "EW":
+            line = grid.data[x*stride:x*stride + grid.width]
+        else:
+            line = grid.data[y::stride][:grid.height]
+        lines[key] = line if direction in "ES" else line[::-1]
+    if direction in "NW":
+        index = size - 1 - index
+
+    match = STOP.search(lines[key], index + 1)
+    stop = match.start() if match else size
+    distance = stop - index
+    dx, dy = MOVES[direction]
+
+    return x + dx*distance, y + dy*distance, distance
+
+def junctions(grid):
+    """Walk along the path, one straight segment at a time. Yield each stop (a
+    + or a letter, then the first space after the end) as (x, y, character,
+    number of steps since the previous stop)."""
 
     direction = "S" # starting point comes from the top, so direction is south
-    x, y = 0, lines[0].index("|")
-    word = ""
-    n_steps = 0
+    x, y = 0, grid.data.find(b"|")
+    lines = {}
 
     while True:
-        c = lines[x][y]
-
-        if c == " ":
-            return word, n_steps
+        x, y, distance = jump(grid, x, y, direction, lines)
+        c = cell(grid, x, y)
+        yield x, y, c.decode(), distance
 
-        elif c in string.ascii_letters:
-            word += c
+        if c == b" ":
+            return
 
-        elif c == "+":
+        if c == b"+":
             if direction in "NS":
                 # can either go left or right
-                if lines[x][y-1] != " ":
-                    direction = "W"
-                else:
-                    direction = "E"
-
+                direction = "W" if cell(grid, x, y-1) != b" " else "E"
             else:
                 # can either go up or down
-                if lines[x-1][y] != " ":
-                    direction = "N"
-                else:
-                    direction = "S"
+                direction = "N" if cell(grid, x-1, y) != b" " else "S"
+
+def follow_path(grid):
+    """Get every letters on the path. Compute length of path as well."""
+
+    letters, n_steps = [], 0
+    for _, _, c, distance in junctions(grid):
+        n_steps += distance
+        if c.isalpha():
+            letters.append(c)
+
+    return "".join(letters), n_steps
+
+def solve(text):
+    """Read the labyrinth from text. Yield the answer of each part."""
+
+    if isinstance(text, str):
+        text = text.encode()
 
-        x, y = next_cell(x, y, direction)
-        n_steps += 1
+    yield from follow_path(load_grid(text))
 
 if __name__ == "__main__":
     filename = "day19_labyrinth.txt"
     if not os.path.exists(filename):
         print("ERROR. Name your input file as:", filename)
     else:
-        labyrinth = open(filename).read().split("\n")
-        part_1, part_2 = follow_path(labyrinth)
-        print("PART ONE:", part_1)
-        print("PART TWO:", part_2)
+        # memory-mapped, so the labyrinth is not read in memory at once
+        with open(filename, "rb") as f, \
+             mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as labyrinth:
+            answers = solve(labyrinth)
+            print("PART ONE:", next(answers))
+            print("PART TWO:", next(answers))
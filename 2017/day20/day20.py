@@ -1,116 +1,247 @@
 #!/usr/bin/env python3
 
 import re
-import copy
+import heapq
 import os.path
-
-def parse_file(filename):
-    """Parse filename to read infos (position/velocity/acceleration) about
-    particles. Return a list of particles."""
-
-    particles = []
-    with open(filename) as f:
-        for line in f:
-            p, v, a = re.findall("<(.*?)>", line)
-            px, py, pz = list(map(int, p.split(",")))
-            vx, vy, vz = list(map(int, v.split(",")))
-            ax, ay, az = list(map(int, a.split(",")))
-
-            particles.append({
-                "px": px, "py": py, "pz": pz,
-                "vx": vx, "vy": vy, "vz": vz,
-                "ax": ax, "ay": ay, "az": az,
-                })
-
-    return particles
-
-def distance(particle):
-    """Return the Manhattan distance between particle and (0,0,0)."""
-
-    return abs(particle["px"]) + abs(particle["py"]) + abs(particle["pz"])
-
-def closest_to_origin(particles_, max_steps):
+from collections import Counter, defaultdict
+from itertools import combinations, compress, repeat
+from math import isqrt
+from operator import add, gt, mod, mul
+from typing import NamedTuple
+
+class Particles(NamedTuple):
+    """The particles, stored by component: px[i] is the x position of particle
+    i, and so on. A step updates each list at once, instead of each particle
+    one by one."""
+    px: list
+    py: list
+    pz: list
+    vx: list
+    vy: list
+    vz: list
+    ax: list
+    ay: list
+    az: list
+
+def parse_particles(lines):
+    """Parse lines to read infos (position/velocity/acceleration) about
+    particles. Return the Particles."""
+
+    rows = []
+    for line in lines:
+        rows.append([int(x) for x in re.findall(r"-?\d+", line)])
+
+    return Particles(*(list(column) for column in zip(*rows)))
+
+def step(particles):
+    """Return the particles after one more step."""
+
+    px, py, pz, vx, vy, vz, ax, ay, az = particles
+    vx, vy, vz = list(map(add, vx, ax)), list(map(add, vy, ay)), \
+                 list(map(add, vz, az))
+    px, py, pz = list(map(add, px, vx)), list(map(add, py, vy)), \
+                 list(map(add, pz, vz))
+
+    return Particles(px, py, pz, vx, vy, vz, ax, ay, az)
+
+def distances(particles):
+    """Return the Manhattan distance between each particle and (0,0,0)."""
+
+    return [abs(x) + abs(y) + abs(z)
+            for x, y, z in zip(particles.px, particles.py, particles.pz)]
+
+def closest_to_origin(particles, max_steps):
     """Find the particle closest to origin (0,0,0) after a certain number of
     steps.
     """
 
-    particles = copy.deepcopy(particles_) # so we don't modify original
-    for step in range(max_steps):
-        for particle in particles:
-            particle["vx"] += particle["ax"]
-            particle["vy"] += particle["ay"]
-            particle["vz"] += particle["az"]
-            particle["px"] += particle["vx"]
-            particle["py"] += particle["vy"]
-            particle["pz"] += particle["vz"]
+    for _ in range(max_steps):
+        particles = step(particles)
+
+    d = distances(particles)
+    return d.index(min(d))
 
-    closest  = 0
-    min_dist = distance(particles[0])
+def remove_collisions(particles):
+    """Remove the particles that are at the same position than another one.
+    Return the particles left."""
 
-    for i in range(1, len(particles)):
-        d = distance(particles[i])
-        if d < min_dist:
-            closest  = i
-            min_dist = d
+    # hash the positions instead of comparing each pair of particles
+    positions = list(zip(particles.px, particles.py, particles.pz))
+    count = Counter(positions)
+    if len(count) == len(positions): # no collision
+        return particles
 
-    return closest
+    alive = [count[position] == 1 for position in positions]
+    return Particles(*(list(compress(column, alive)) for column in particles))
 
-def n_particles_left(particles_, max_steps):
+def n_particles_left(particles, max_steps):
     """Return the number of particles that have not collide. Collisions occur
     when two particles are at the same position at the same step."""
 
-    particles = copy.deepcopy(particles_) # so we don't modify original
-    n = len(particles)
-
-    has_collided = [False for _ in range(len(particles))]
-    n_destroyed  = 0
-
-    for step in range(max_steps):
-        # move every non-destroyed particles
-        for i, particle in enumerate(particles):
-            if has_collided[i]:
-                continue
-
-            particle["vx"] += particle["ax"]
-            particle["vy"] += particle["ay"]
-            particle["vz"] += particle["az"]
-            particle["px"] += particle["vx"]
-            particle["py"] += particle["vy"]
-            particle["pz"] += particle["vz"]
-
-        # look for collisions for this step. Go through each pair (i,j) of
-        # particles to know if there are at the same position.
-        collisions = set()
-        for i in range(n-1):
-            # particle already destroyed, no collision
-            if has_collided[i]:
-                continue
-
-            for j in range(i+1, n):
-                # particles already destroyed, no collision
-                if has_collided[j]:
-                    continue
-
-                if particles[i]["px"] == particles[j]["px"] and \
-                   particles[i]["py"] == particles[j]["py"] and \
-                   particles[i]["pz"] == particles[j]["pz"]:
-                    collisions.add(i)
-                    collisions.add(j)
-
-        # mark the collided particles as destroyed
-        n_destroyed += len(collisions)
-        for p in collisions:
-            has_collided[p] = True
-
-    return n - n_destroyed
+    for _ in range(max_steps):
+        particles = remove_collisions(step(particles))
+
+    return len(particles.px)
+
+def long_run_key(particle):
+    """Return a key such that the particle with the lowest key is the closest to
+    (0,0,0) in the long run. particle is (px, py, pz, vx, vy, vz, ax, ay,
+    az)."""
+
+    # after t steps, x = p + v*t + a*t*(t+1)/2. In the long run, x has the sign
+    # s of a (or of v if a = 0, or of p if v = 0 too), so |x| = s*x and the
+    # distance is A*t^2/2 + (V + A/2)*t + P with A = sum(s*a) = sum(|a|),
+    # V = sum(s*v) and P = sum(s*p). Comparing (A, V, P) compares the distances
+    # for a large enough t.
+    A = V = P = 0
+    for axis in range(3):
+        p, v, a = particle[axis], particle[axis+3], particle[axis+6]
+        sign = -1 if (a or v or p) < 0 else 1
+        A, V, P = A + sign*a, V + sign*v, P + sign*p
+
+    return A, V, P
+
+def closest_in_long_run(particles):
+    """Find the particle that stays the closest to origin (0,0,0) in the long
+    run, without simulating."""
+
+    keys = [long_run_key(particle) for particle in zip(*particles)]
+    return keys.index(min(keys))
+
+def axis_times(A, B, C):
+    """Return the set of integer times t >= 1 such that A*t^2 + B*t + C = 0, or
+    None if the equation is true for all t."""
+
+    if A == 0:
+        if B == 0:
+            return None if C == 0 else set()
+        return {-C // B} if C % B == 0 and -C // B >= 1 else set()
+
+    delta = B*B - 4*A*C
+    if delta < 0:
+        return set()
+    root = isqrt(delta)
+    if root*root != delta:
+        return set()
+
+    return {t // (2*A) for t in (-B - root, -B + root)
+            if t % (2*A) == 0 and t // (2*A) >= 1}
+
+def collision_time(first, second):
+    """Return the first time (>= 1) when the particles first and second are at
+    the same position, or None if they never are. A particle is given as the 3
+    tuples (2p, 2v+a, a) of its axes."""
+
+    # 2*(x1(t) - x2(t)) = da*t^2 + (2*dv + da)*t + 2*dp must be 0 on each axis.
+    # x first: for most pairs, it already has no solution.
+    times = None
+    for (c1, b1, a1), (c2, b2, a2) in zip(first, second):
+        axis = axis_times(a1 - a2, b1 - b2, c1 - c2)
+        if axis is None:
+            continue
+        times = axis if times is None else times & axis
+        if not times:
+            return None
+
+    return 1 if times is None else min(times)
+
+def collision_candidates(coefficients, modulus):
+    """Return the set of pairs i*n + j (i < j, n particles) of particles that
+    may be at the same position at some time. coefficients are the 3 tuples
+    (2p, 2v+a, a) of each particle (see collision_time)."""
+
+    # two particles at the same position at time t also are at the same
+    # position modulo modulus, and so at time r = t % modulus (the position is
+    # a polynomial of t). So grouping the particles on their position modulo
+    # modulus at each time r < modulus finds all the colliding pairs (and
+    # about n^2 / modulus^2 others, that collision_time rejects).
+    n = len(coefficients)
+    moduli = [modulus] * n
+    # 2*position = a*t^2 + (2v+a)*t + 2p at time r, on each axis, and its
+    # increment from time r to r+1 (which grows by 2a at each time)
+    positions, increments, increments_2 = [], [], []
+    for axis in range(3):
+        c, b, a = zip(*(particle[axis] for particle in coefficients))
+        positions.append(list(c))
+        increments.append(list(map(add, b, a)))
+        increments_2.append([2*x for x in a])
+
+    pairs = set()
+    for _ in range(modulus):
+        # key = x + modulus*(y + modulus*z), with x, y, z modulo modulus
+        x, y, z = (map(mod, position, moduli) for position in positions)
+        keys = list(map(add, x, map(mul, map(add, y, map(mul, z, moduli)),
+                                    moduli)))
+        count = Counter(keys)
+        if len(count) < n:
+            groups = defaultdict(list)
+            shared = map(gt, map(count.__getitem__, keys), repeat(1))
+            for i in compress(range(n), shared):
+                groups[keys[i]].append(i)
+            # a pair (i, j) is stored as i*n + j: ints are lighter than tuples
+            for group in groups.values():
+                pairs.update(i*n + j for i, j in combinations(group, 2))
+
+        for axis in range(3):
+            positions[axis] = list(map(add, positions[axis], increments[axis]))
+            increments[axis] = list(map(add, increments[axis],
+                                        increments_2[axis]))
+
+    return pairs
+
+def n_particles_left_exact(particles, modulus=None):
+    """Return the number of particles that never collide, computed from the
+    exact collision time of the pairs of particles that may collide (see
+    collision_candidates)."""
+
+    coefficients = [((2*px, 2*vx + ax, ax), (2*py, 2*vy + ay, ay),
+                     (2*pz, 2*vz + az, az))
+                    for px, py, pz, vx, vy, vz, ax, ay, az in zip(*particles)]
+    n = len(coefficients)
+    if modulus is None:
+        # balances the time spent grouping (modulus passes over n particles)
+        # and solving the candidate pairs (about n^2 / modulus^2)
+        modulus = 2 * round(0.85 * n ** (1/3)) + 1
+
+    events = []
+    for pair in collision_candidates(coefficients, modulus):
+        i, j = divmod(pair, n)
+        t = collision_time(coefficients[i], coefficients[j])
+        if t is not None:
+            events.append((t, i, j))
+    heapq.heapify(events)
+
+    # process the collisions in time order. All the collisions of a step
+    # happen at once: a particle destroyed at time t can still destroy others
+    # at time t, but not later.
+    destroyed = [False] * n
+    while events:
+        t = events[0][0]
+        collided = set()
+        while events and events[0][0] == t:
+            _, i, j = heapq.heappop(events)
+            if not destroyed[i] and not destroyed[j]:
+                collided.update((i, j))
+        for i in collided:
+            destroyed[i] = True
+
+    return n - sum(destroyed)
+
+def solve(text):
+    """Read the particles from text. Yield the answer of each part."""
+
+    if isinstance(text, bytes):
+        text = text.decode()
+
+    particles = parse_particles(text.strip().split("\n"))
+    yield closest_in_long_run(particles)
+    yield n_particles_left_exact(particles)
 
 if __name__ == "__main__":
     filename = "day20_particles.txt"
     if not os.path.exists(filename):
         print("ERROR. Name your input file as:", filename)
     else:
-        particles = parse_file(filename)
-        part_1 = closest_to_origin(particles, 400)
-        print("PART ONE:", part_1)
-        part_2 = n_particles_left(particles, 40)
-        print("PART TWO:", part_2)
+        answers = solve(open(filename).read())
+        print("PART ONE:", next(answers))
+        print("PART TWO:", next(answers))
@@ -1,15 +1,15 @@
 #!/usr/bin/env python3
 
 import os.path
+from collections import Counter
 
-def load_rules(filename):
-    """Read filename to get all the rules (pattern transformation)."""
+def load_rules(lines):
+    """Read lines to get all the rules (pattern transformation)."""
 
     rules = {}
-    with open(filename) as f:
-        for line in f:
-            pattern_in, pattern_out = line.split("=>")
-            rules[pattern_in.strip()] = pattern_out.strip()
+    for line in lines:
+        pattern_in, pattern_out = line.split("=>")
+        rules[pattern_in.strip()] = pattern_out.strip()
 
     return rules
 
@@ -39,82 +39,96 @@ def flip(pattern):
 
     return "/".join(new)
 
-def transform(pattern, rules):
-    """Find the correct transformation of pattern given the rules. If needed,
-    rotate or flip pattern to find the appropriate transformation."""
+def expand_rules(rules):
+    """Return the rules with all the rotations and flips of their pattern, so
+    any square can be transformed with a single lookup."""
 
-    if pattern in rules:
-        return rules[pattern]
+    expanded = {}
+    for pattern, output in rules.items():
+        for _ in range(4):
+            expanded[pattern] = output
+            expanded[flip(pattern)] = output
+            pattern = rotate(pattern)
 
-    for _ in range(4): # at most 4 rotations and flips needed
-        f = flip(pattern)
-        if f in rules:
-            return rules[f]
-
-        pattern = rotate(pattern)
-        if pattern in rules:
-            return rules[pattern]
+    return expanded
 
 def one_iteration(grid, rules):
     """Separate the grid into squares, apply transformation to each square, then
-    recreate the grid by combining squares."""
-
-    # grid -> squares
-    squares = []
-    n = len(grid)
-    if n%2 == 0: # divide grid into 2x2 squares because size is even
-        for j in range(0, n, 2):
-            row = []
-            for i in range(0, n, 2):
-                square = grid[j][i:i+2] + "/" + grid[j+1][i:i+2]
-                row.append(square)
-            squares.append(row)
-
-    else: #divide grid into 3x3 squares
-        for j in range(0, n, 3):
-            row = []
-            for i in range(0, n, 3):
-                square = grid[j][i:i+3] + "/" + grid[j+1][i:i+3] + "/" + \
-                         grid[j+2][i:i+3]
-                row.append(square)
-            squares.append(row)
-
-    # transform each square
-    n = len(squares)
-    for i in range(n):
-        for j in range(n):
-            squares[i][j] = transform(squares[i][j], rules)
-
-    # squares -> grid
-    square_size = len(squares[0][0].split("/"))
+    recreate the grid by combining squares. rules must be expanded."""
+
+    size = 2 if len(grid) % 2 == 0 else 3
     new_grid = []
-    for row in range(n):
-        for i in range(square_size):
-            line = ""
-            for j in range(len(squares[row])):
-                line += squares[row][j].split("/")[i]
-            new_grid.append(line)
+    for j in range(0, len(grid), size):
+        rows = grid[j:j+size]
+        squares = [rules["/".join(row[i:i+size] for row in rows)].split("/")
+                   for i in range(0, len(grid), size)]
+        # concatenate the i-th row of each transformed square
+        new_grid.extend("".join(parts) for parts in zip(*squares))
 
     return new_grid
 
+def split_blocks(grid):
+    """Return the list of 3x3 squares (as .../.../...) of grid."""
+
+    return ["/".join(row[i:i+3] for row in grid[j:j+3])
+            for j in range(0, len(grid), 3) for i in range(0, len(grid), 3)]
+
+def evolve(block, rules, n_iterations):
+    """Return the grid obtained after n_iterations iterations on block."""
+
+    grid = block.split("/")
+    for _ in range(n_iterations):
+        grid = one_iteration(grid, rules)
+
+    return grid
+
+def n_pixels_on(pattern, rules, n_iterations):
+    """Return the number of pixels on after n_iterations iterations of the
+    start pattern (a 3x3 grid). rules must be expanded."""
+
+    # a 3x3 square becomes a 4x4, then a 6x6 (made of 2x2 squares) and a 9x9
+    # (from the 2x2 squares again): after 3 iterations, it is made of 9 3x3
+    # squares, each of them evolving on its own. So we only need to count how
+    # many times each 3x3 square appears, and compute once what each one
+    # becomes: the time depends on the number of different squares, not on
+    # the size of the grid.
+    children = {}
+    blocks = Counter({"/".join(pattern): 1})
+    for _ in range(n_iterations // 3):
+        next_blocks = Counter()
+        for block, count in blocks.items():
+            if block not in children:
+                children[block] = Counter(split_blocks(evolve(block, rules, 3)))
+            for child, n in children[block].items():
+                next_blocks[child] += count * n
+        blocks = next_blocks
+
+    n_left = n_iterations % 3
+    return sum(count * "".join(evolve(block, rules, n_left)).count("#")
+               for block, count in blocks.items())
+
 def generate_fractals(pattern, rules):
-    """Use the start pattern and the rules to generate 18 fractal iterations."""
+    """Use the start pattern and the rules to count the pixels on after 5 and 18
+    fractal iterations."""
+
+    rules = expand_rules(rules)
+    return n_pixels_on(pattern, rules, 5), n_pixels_on(pattern, rules, 18)
+
+def solve(text):
+    """Read the enhancement rules from text. Yield the answer of each part."""
 
-    n_pixels_on = {}
-    for i in range(1, 19):
-        pattern = one_iteration(pattern, rules)
-        c = "".join(pattern).count("#")
-        n_pixels_on[i] = c
+    if isinstance(text, bytes):
+        text = text.decode()
 
-    return n_pixels_on[5], n_pixels_on[18]
+    rules = load_rules(text.strip().split("\n"))
+    start = ".#./..#/###".split("/")
+    yield from generate_fractals(start, rules)
 
 if __name__ == "__main__":
     filename = "day21_input.txt"
     if not os.path.exists(filename):
         print("ERROR. Name your input file as:", filename)
     else:
-        rules = load_rules(filename)
-        start = ".#./..#/###".split("/")
-        part_1, part_2 = generate_fractals(start, rules)
-        print("PART ONE:", part_1)
-        print("PART TWO:", part_2)
+        answers = solve(open(filename).read())
+        print("PART ONE:", next(answers))
+        print("PART TWO:", next(answers))
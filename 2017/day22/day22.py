@@ -2,77 +2,95 @@
 
 import os.path
 
+# node states
+CLEAN, WEAKENED, INFECTED, FLAGGED = range(4)
+
+# how a burst changes the state of the current node, and how the carrier turns
+# (in quarter turns to the right) for each state of the current node
+NEXT_STATE = {
+    False: bytes([INFECTED, 0, CLEAN, 0]),
+    True:  bytes([WEAKENED, INFECTED, FLAGGED, CLEAN]),
+}
+TURN = {
+    False: [3, 0, 1, 0], # clean: left, infected: right
+    True:  [3, 0, 1, 2], # + weakened: same direction, flagged: reverse
+}
+
+MARGIN = 32 # minimum number of clean nodes added on each side when growing
+
+def grow(grid, width, height, margin):
+    """Return the grid with margin clean nodes added on each side, and its new
+    width and height. grid is a flat bytearray (row after row)."""
+
+    new_width = width + 2*margin
+    new = bytearray(new_width * (height + 2*margin))
+    for i in range(height):
+        start = (i+margin) * new_width + margin
+        new[start:start+width] = grid[i*width:(i+1)*width]
+
+    return new, new_width, height + 2*margin
+
 def contaminate(grid, n_burst, evolved=False):
     """Simulate n_burst steps of node contamination."""
 
-    # expand grid (add borders of clean nodes). copy original grid into new grid
-    n = len(grid)
-    border = 100*n
-    new_grid = [["." for _ in range(border*2+n)] for _ in range(border*2+n)]
-    for i in range(n):
-        for j in range(n):
-            new_grid[i+border][j+border] = grid[i][j]
-    grid = new_grid[:]
+    # the grid is a flat bytearray of node states that only grows when the
+    # virus carrier reaches one of its edges
+    height, width = len(grid), len(grid[0])
+    flat = bytearray(INFECTED if c == "#" else CLEAN
+                     for row in grid for c in row)
+    flat, width, height = grow(flat, width, height, MARGIN)
 
-    # starting position of virus (center of grid)
-    x = len(grid) // 2
-    y = len(grid[0]) // 2
+    next_state = NEXT_STATE[evolved]
+    turn = TURN[evolved]
+    # the state that a node has right before being infected
+    infectable = WEAKENED if evolved else CLEAN
 
+    # starting position of virus (center of grid)
+    x, y = height // 2, width // 2
     # direction = 0 (north) / 1 (east) / 2 (south) / 3 (west)
-    # turning right = +1
-    # turning left  = -1
-    # reverse       = +2
     direction = 0
-    x_move = [-1, 0, 1, 0]
-    y_move = [0, 1, 0, -1]
     n_infection = 0
 
-    # not evolved = part 1
-    if not evolved:
-        for i in range(n_burst):
-            if grid[x][y] == "#":
-                grid[x][y] = "." # clean node
-                direction = (direction + 1) % 4
-
-            else:
-                grid[x][y] = "#" # infect node
-                direction = (direction - 1) % 4
+    while n_burst > 0:
+        # the carrier moves by one node per burst, so it can't leave the grid
+        # during the next n_safe bursts: run them without checking the edges
+        n_safe = min(x, y, height-1-x, width-1-y, n_burst)
+        if n_safe == 0:
+            margin = max(MARGIN, width // 2)
+            flat, width, height = grow(flat, width, height, margin)
+            x, y = x + margin, y + margin
+            continue
+
+        moves = [-width, 1, width, -1]
+        pos = x * width + y
+        for _ in range(n_safe):
+            state = flat[pos]
+            if state == infectable:
                 n_infection += 1
+            flat[pos] = next_state[state]
+            direction = (direction + turn[state]) & 3
+            pos += moves[direction]
 
-            x, y = x + x_move[direction], y + y_move[direction]
-
-        return n_infection
+        x, y = divmod(pos, width)
+        n_burst -= n_safe
 
-    # evolved = part 2
-    for i in range(n_burst):
-        if grid[x][y] == ".":   # clean -> weakened, turn left
-            grid[x][y] = "W"
-            direction = (direction - 1) % 4
-
-        elif grid[x][y] == "W": # weakened -> infected, same direction
-            grid[x][y] = "#"
-            n_infection += 1
-
-        elif grid[x][y] == "#": # infected -> flagged, turn right
-            grid[x][y] = "F"
-            direction = (direction + 1) % 4
+    return n_infection
 
-        else:                   # flagged -> clean, reverse direction
-            grid[x][y] = "."
-            direction = (direction + 2) % 4
+def solve(text):
+    """Read the infected nodes from text. Yield the answer of each part."""
 
-        x, y = x + x_move[direction], y + y_move[direction]
+    if isinstance(text, bytes):
+        text = text.decode()
 
-    return n_infection
+    grid = [list(line) for line in text.strip().split("\n")]
+    yield contaminate(grid, 10000)
+    yield contaminate(grid, 10000000, evolved=True)
 
 if __name__ == "__main__":
     filename = "day22_infected.txt"
     if not os.path.exists(filename):
         print("ERROR. Name your input file as:", filename)
     else:
-        grid = open(filename).read().strip().split("\n")
-        grid = [list(line) for line in grid]
-        part_1 = contaminate(grid, 10000)
-        print("PART ONE:", part_1)
-        part_2 = contaminate(grid, 10000000, evolved=True)
-        print("PART TWO:", part_2)
+        answers = solve(open(filename).read())
+        print("PART ONE:", next(answers))
+        print("PART TWO:", next(answers))
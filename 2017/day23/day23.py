@@ -1,65 +1,131 @@
 #!/usr/bin/env python3
 
 import os.path
-from collections import defaultdict
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import compress
+from math import isqrt
 
-def convert_value(s, registers):
-    """Convert s to integer value, or look its value in registers."""
-
-    try:
-        return int(s)
-    except:
-        return registers[s]
-
-def count_mul(instructions):
-    """Return the number of times a mul instruction is executed."""
-
-    pos, n_mul = 0, 0
-    registers  = defaultdict(int)
-
-    while -1 < pos < len(instructions)-1:
-        row = instructions[pos].split()
-
-        if row[0] == "set":
-            registers[row[1]]  = convert_value(row[2], registers)
-
-        if row[0] == "sub":
-            registers[row[1]] -= convert_value(row[2], registers)
-
-        if row[0] == "mul":
-            registers[row[1]] *= convert_value(row[2], registers)
-            n_mul += 1
-
-        if row[0] == "jnz":
-            if convert_value(row[1], registers) != 0:
-                pos += convert_value(row[2], registers) - 1
-
-        pos += 1
-
-    return n_mul
+# when run as a script, the modules shared by the days of 2017 are in the
+# parent directory (aoc.days.load_module adds it when it imports the script)
+if __name__ == "__main__":
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                 ".."))
+from assembly import (MUL, NATIVE, compile_program, execute, new_registers,
+                      optimize)
+
+def count_mul(program, **values):
+    """Return the number of times a mul instruction is executed, and the final
+    registers (starting with the values given in values)."""
+
+    profile = [0] * len(program.ops)
+    registers = new_registers(program, **values)
+    execute(program, registers, profile=profile)
+
+    # the replaced loops are only NATIVE at their first instruction, the other
+    # opcodes are left unchanged
+    return (sum(count for op, count in zip(program.ops, profile) if op == MUL),
+            registers)
+
+def primes_up_to(n):
+    """Return the list of prime numbers <= n (sieve of Eratosthenes)."""
+
+    if n < 2:
+        return []
+
+    is_prime = bytearray([1]) * (n+1)
+    is_prime[0] = is_prime[1] = 0
+    for p in range(2, isqrt(n)+1):
+        if is_prime[p]:
+            is_prime[p*p::p] = bytes(len(range(p*p, n+1, p)))
+
+    return [p for p in compress(range(n+1), is_prime)]
+
+def sieve_segment(start, step, k_lo, k_hi, primes):
+    """Return the number of composite numbers start + k*step for k_lo <= k <
+    k_hi. primes must contain all the primes <= sqrt(start + (k_hi-1)*step)."""
+
+    size = k_hi - k_lo
+    first = start + k_lo*step
+    composite = bytearray(size)
+    ones = memoryview(b"\x01" * size)
+
+    for p in primes:
+        # each composite number is crossed out by its smallest prime factor p,
+        # and is >= p*p
+        k = max(0, -((first - p*p) // step)) # first index with value >= p*p
+        if k >= size:
+            break # primes are sorted, so the next ones are too big as well
+
+        if step % p == 0:
+            if start % p == 0: # all the numbers are multiples of p
+                composite[k:] = ones[k:]
+            continue
+
+        # first index >= k whose number is a multiple of p
+        k += (-(first + k*step) * pow(step, -1, p)) % p
+        n = len(range(k, size, p))
+        composite[k::p] = ones[:n]
+
+    return composite.count(1)
+
+def count_composites(start, stop, step=1, jobs=None, segment_size=1<<20):
+    """Return the number of composite numbers in start, start+step, ..., up to
+    stop (included). The numbers are sieved by segments of segment_size
+    numbers, spread over a pool of jobs processes if jobs > 1. By default, use
+    one process per segment, up to the number of CPUs."""
+
+    if stop < start:
+        return 0
+
+    n_numbers = (stop - start) // step + 1
+    primes = primes_up_to(isqrt(start + (n_numbers-1)*step))
+    bounds = [(k, min(k+segment_size, n_numbers))
+              for k in range(0, n_numbers, segment_size)]
+    args = ([start] * len(bounds), [step] * len(bounds),
+            [lo for lo, _ in bounds], [hi for _, hi in bounds],
+            [primes] * len(bounds))
+
+    if jobs is None:
+        jobs = min(len(bounds), os.cpu_count() or 1)
+    if jobs > 1 and len(bounds) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            return sum(executor.map(sieve_segment, *args))
+    return sum(map(sieve_segment, *args))
 
 def optimized_program(n):
     """Optimized reverse-engineered version of assembler instructions."""
 
+    # the program counts the non prime numbers b, b+17, ..., c
     b = 100000 + 100*n
     c = b + 17000
-    h = 0
 
-    for b in range(b, c+1, 17):
-        for d in range(2, int(b**0.5)+1):
-            if b%d == 0: # b is non prime, increment h, move to next b
-                h += 1
-                break
+    return count_composites(b, c, 17)
+
+def solve(text):
+    """Read the instructions from text. Yield the answer of each part."""
 
-    return h
+    if isinstance(text, bytes):
+        text = text.decode()
+
+    instructions = text.split("\n")
+    program = optimize(compile_program(instructions))
+    yield count_mul(program)[0]
+
+    # the program is too slow to run when a=1, unless its loops are replaced by
+    # native code. If optimize didn't recognize them, fall back on the
+    # reverse-engineered version of the program.
+    if NATIVE not in program.ops:
+        yield optimized_program(int(instructions[0].split()[-1]))
+    else:
+        _, registers = count_mul(program, a=1)
+        yield registers[program.registers["h"]]
 
 if __name__ == "__main__":
     filename = "day23_instructions.txt"
     if not os.path.exists(filename):
         print("ERROR. Name your input file as:", filename)
     else:
-        instructions = open(filename).read().split("\n")
-        part_1 = count_mul(instructions)
-        print("PART ONE:", part_1)
-        part_2 = optimized_program(int(instructions[0].split()[-1]))
-        print("PART TWO:", part_2)
+        answers = solve(open(filename).read())
+        print("PART ONE:", next(answers))
+        print("PART TWO:", next(answers))
@@ -1,51 +1,83 @@
 #!/usr/bin/env python3
 
 import os.path
+from collections import defaultdict
 
-def parse_file(filename):
-    """Read each line as a tuple of integers. Return a set of these tuples."""
+def parse_components(lines):
+    """Read each line as a tuple of integers. Return the list of these tuples
+    (the id of a component is its index)."""
 
-    components = set()
-    with open(filename) as f:
-        for line in f:
-            p1, p2 = list(map(int, line.split("/")))
-            components.add((p1, p2))
+    return [tuple(map(int, line.split("/"))) for line in lines]
 
-    return components
+def port_index(components):
+    """Return a dict port -> list of (id, other port) of the components with
+    this port, and a dict port -> id of the component with this port on both
+    sides."""
 
-def max_strength_bridge(port, components, strength, length=None):
-    """Build all possible bridges with available components starting with the
-    same number of pin as port. Return the one with the maximum strength, or the
-    one with maximum length."""
+    index, doubles = defaultdict(list), {}
+    for i, (p1, p2) in enumerate(components):
+        index[p1].append((i, p2))
+        if p1 != p2:
+            index[p2].append((i, p1))
+        else:
+            doubles[p1] = i
 
-    # find components that can be connected to port
-    candidates = [c for c in components if port in c]
+    return index, doubles
 
-    # no candidate, cannot append another component to the bridge. return
-    # current length and strength
-    if len(candidates) == 0:
-        return (length, strength)
+def strongest_bridges(components, port=0):
+    """Build the bridges starting with the same number of pins as port. Return
+    the maximum strength, and the strength of the longest bridge (the strongest
+    one if there are several of them)."""
 
-    # for each candidate, remove it from the list of available components and
-    # find the maximum strength we can build if we continue the same process.
-    # return the maximum strength among all possible strength
-    possible_strength = []
-    for c in candidates:
-        new_port = c[1] if c[0] == port else c[0]
-        new_components = set(components) # copy because .remove() done in place
-        new_components.remove(c)
-        possible_strength.append(max_strength_bridge(new_port, new_components,
-            strength + sum(c), None if length is None else length+1))
+    index, doubles = port_index(components)
+    strengths = [p1 + p2 for p1, p2 in components]
+    best = {}
 
-    return max(possible_strength)
+    # the best bridges that can be appended to a bridge only depend on its last
+    # port and on the components it uses (a bitmask of their id). Return the
+    # maximum strength and the (length, strength) of the longest one
+    def extend(port, used):
+        key = (port, used)
+        if key in best:
+            return best[key]
+
+        # a component with port on both sides can always be taken right now: it
+        # makes the bridge stronger and longer without changing its last port
+        i = doubles.get(port)
+        if i is not None and not used >> i & 1:
+            strength, (length, longest) = extend(port, used | 1 << i)
+            best[key] = (strength + strengths[i],
+                         (length + 1, longest + strengths[i]))
+            return best[key]
+
+        max_strength, max_length = 0, (0, 0)
+        for i, other in index[port]:
+            if used >> i & 1:
+                continue
+            strength, (length, longest) = extend(other, used | 1 << i)
+            max_strength = max(max_strength, strength + strengths[i])
+            max_length = max(max_length, (length + 1, longest + strengths[i]))
+
+        best[key] = (max_strength, max_length)
+        return best[key]
+
+    max_strength, (_, longest) = extend(port, 0)
+    return max_strength, longest
+
+def solve(text):
+    """Read the components from text. Yield the answer of each part."""
+
+    if isinstance(text, bytes):
+        text = text.decode()
+
+    components = parse_components(text.strip().split("\n"))
+    yield from strongest_bridges(components)
 
 if __name__ == "__main__":
     filename = "day24_ports.txt"
     if not os.path.exists(filename):
         print("ERROR. Name your input file as:", filename)
     else:
-        components = parse_file(filename)
-        part_1 = max_strength_bridge(0, components, 0, None)[1]
-        print("PART ONE:", part_1)
-        part_2 = max_strength_bridge(0, components, 0, 0)[1]
-        print("PART TWO:", part_2)
+        answers = solve(open(filename).read())
+        print("PART ONE:", next(answers))
+        print("PART TWO:", next(answers))
@@ -1,47 +1,209 @@
 #!/usr/bin/env python3
 
 import os.path
+from typing import NamedTuple
 
-def perform_turing(n_steps):
+MARGIN = 64 # minimum number of cells (or blocks) added on each side of the tape
+BLOCK  = 8  # number of cells (bits of a byte) in a block of the macro-step
+            # machine
+
+class Blueprint(NamedTuple):
+    """A Turing machine. The transition of state s when the current value is v
+    is at index 2*s + v of write, move and next_state."""
+    start: int
+    n_steps: int
+    states: list     # name of each state
+    write: bytes
+    move: list       # -1 (left) or +1 (right)
+    next_state: list
+
+def parse_blueprint(lines):
+    """Read the blueprint in lines. Return it as a Blueprint."""
+
+    start = n_steps = state = value = None
+    transitions = {} # (state name, value) -> [write, move, next state name]
+    for line in lines:
+        words = line.strip(" -.:\n").split()
+        if not words:
+            continue
+        if line.startswith("Begin in state"):
+            start = words[-1]
+        elif "diagnostic checksum" in line:
+            n_steps = int(words[-2])
+        elif line.startswith("In state"):
+            state = words[-1]
+        elif "If the current value is" in line:
+            value = int(words[-1])
+            transitions[state, value] = [0, 0, None]
+        elif "Write the value" in line:
+            transitions[state, value][0] = int(words[-1])
+        elif "Move one slot" in line:
+            transitions[state, value][1] = 1 if words[-1] == "right" else -1
+        elif "Continue with state" in line:
+            transitions[state, value][2] = words[-1]
+
+    states = list(dict.fromkeys(name for name, _ in transitions))
+    index = {name: i for i, name in enumerate(states)}
+    write, move, next_state = [], [], []
+    for name in states:
+        for value in (0, 1):
+            if (name, value) not in transitions:
+                raise ValueError(f"no rule for value {value} in state {name}")
+            w, m, n = transitions[name, value]
+            if n not in index or not m:
+                raise ValueError(f"incomplete rule for state {name}")
+            write.append(w)
+            move.append(m)
+            next_state.append(index[n])
+
+    if start not in index:
+        raise ValueError(f"unknown start state: {start}")
+
+    return Blueprint(index[start], n_steps, states, bytes(write), move,
+                     next_state)
+
+def grow(tape, margin):
+    """Return tape with margin zeros added on each side."""
+
+    return bytes(margin) + tape + bytes(margin)
+
+def perform_turing(blueprint, n_steps=None):
     """Follow the instructions on the Turing machine blueprint. Return the
-    number of 1 after n_steps iterations."""
-
-    tape  = [0 for _ in range(10001)]
-    pos   = 5000
-    state = "A"
-
-    for _ in range(n_steps):
-        if state == "A":
-            state = "BF"[tape[pos]]
-            pos, pos_ = pos + 1 - 2*tape[pos], pos
-            tape[pos_] ^= 1
-        elif state == "B":
-            state = "CD"[tape[pos]]
-            tape[pos] = 0
-            pos += 1
-        elif state == "C":
-            state = "DE"[tape[pos]]
-            pos, pos_ = pos - 1 + 2*tape[pos], pos
-            tape[pos_] = 1
-        elif state == "D":
-            state = "ED"[tape[pos]]
-            tape[pos] = 0
-            pos -= 1
-        elif state == "E":
-            state = "AC"[tape[pos]]
-            pos += 1
+    number of 1 after n_steps iterations (the number of the blueprint if
+    None)."""
+
+    if n_steps is None:
+        n_steps = blueprint.n_steps
+
+    # transitions are indexed by 2*state + value, so store 2*next state
+    write, move = blueprint.write, blueprint.move
+    next_index = [2*s for s in blueprint.next_state]
+
+    tape = bytearray(2*MARGIN)
+    pos = MARGIN
+    t = 2*blueprint.start # 2*current state
+
+    while n_steps > 0:
+        # the head moves by one cell per step: it can't leave the tape during
+        # the next n_safe steps, so they run without checking the edges
+        n_safe = min(pos, len(tape)-1-pos, n_steps)
+        if n_safe == 0:
+            margin = max(MARGIN, len(tape) // 2)
+            tape = bytearray(grow(tape, margin))
+            pos += margin
+            continue
+
+        for _ in range(n_safe):
+            t += tape[pos]
+            tape[pos] = write[t]
+            pos += move[t]
+            t = next_index[t]
+
+        n_steps -= n_safe
+
+    return tape.count(1)
+
+def run_block(blueprint, state, block, pos, n_steps):
+    """Run at most n_steps steps of the machine on a block of BLOCK cells (the
+    bits of block, from left to right), starting in state at position pos.
+    Stop when the head leaves the block (pos is then -1 or BLOCK). Return
+    (block, state, pos, number of steps)."""
+
+    write, move = blueprint.write, blueprint.move
+    next_state = blueprint.next_state
+    steps = 0
+    while steps < n_steps and 0 <= pos < BLOCK:
+        t = 2*state + (block >> pos & 1)
+        block = block & ~(1 << pos) | write[t] << pos
+        pos += move[t]
+        state = next_state[t]
+        steps += 1
+
+    return block, state, pos, steps
+
+def perform_turing_macro(blueprint, n_steps=None):
+    """Same as perform_turing, but the tape is made of blocks of BLOCK cells
+    (a bytearray with one byte per block). What happens from the moment the
+    head enters a block until it leaves it only depends on the state, the
+    content of the block and the position of the head, so it is computed once
+    and then done in a single step."""
+
+    if n_steps is None:
+        n_steps = blueprint.n_steps
+
+    # in that many steps, a head that never leaves its block repeats a
+    # configuration (state, block, pos): it will never leave it
+    n_configurations = len(blueprint.states) * 2**BLOCK * BLOCK
+    # a configuration is stored as (state*256 + block)*BLOCK + pos, and
+    # macro[configuration] = (new block, configuration of the next block
+    # without its content, move to the next block, steps) when the head leaves
+    # the block, or steps = None if it never does
+    macro = [None] * n_configurations
+
+    tape = bytearray(2*MARGIN)
+    i = MARGIN # index of the current block
+    key = blueprint.start * 256*BLOCK
+
+    while True:
+        # the head moves by one block per macro step: it can't leave the tape
+        # during the next n_safe ones
+        n_safe = min(i, len(tape)-1-i)
+        if n_safe == 0:
+            margin = max(MARGIN, len(tape) // 2)
+            tape = bytearray(grow(tape, margin))
+            i += margin
+            continue
+
+        for _ in range(n_safe):
+            configuration = key + tape[i]*BLOCK
+            result = macro[configuration]
+            if result is None:
+                state, pos = divmod(key, 256*BLOCK)
+                block, state, pos, steps = run_block(blueprint, state, tape[i],
+                                                     pos, n_configurations)
+                if 0 <= pos < BLOCK:
+                    steps = None
+                result = (block, state*256*BLOCK + pos % BLOCK,
+                          1 if pos == BLOCK else -1, steps)
+                macro[configuration] = result
+
+            block, next_key, move, steps = result
+            if steps is None or steps > n_steps:
+                break
+            tape[i], key = block, next_key
+            i += move
+            n_steps -= steps
         else:
-            state = "A"
-            pos, pos_ = pos - 1 + 2*tape[pos], pos
-            tape[pos_] = 1
+            continue
+        break
+
+    # the head stays in the current block for the last n_steps steps. If it
+    # loops in it forever, skip the whole cycles
+    state, pos = divmod(key, 256*BLOCK)
+    block, seen = tape[i], {}
+    while n_steps > 0 and steps is None:
+        if (state, block, pos) in seen:
+            n_steps %= seen[state, block, pos] - n_steps
+            break
+        seen[state, block, pos] = n_steps
+        block, state, pos, _ = run_block(blueprint, state, block, pos, 1)
+        n_steps -= 1
+    tape[i] = run_block(blueprint, state, block, pos, n_steps)[0]
+
+    return int.from_bytes(tape, "big").bit_count()
+
+def solve(text):
+    """Read the blueprint from text. Yield the answer of the puzzle."""
+
+    if isinstance(text, bytes):
+        text = text.decode()
 
-    return sum(tape)
+    yield perform_turing_macro(parse_blueprint(text.split("\n")))
 
 if __name__ == "__main__":
     filename = "day25_blueprint.txt"
     if not os.path.exists(filename):
         print("ERROR. Name your input file as:", filename)
     else:
-        n_steps = int(open(filename).read().split("\n")[1].split()[-2])
-        part_1 = perform_turing(n_steps)
-        print("PART ONE:", part_1)
+        answers = solve(open(filename).read())
+        print("PART ONE:", next(answers))
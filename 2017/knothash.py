@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+
+"""Knot Hash of 2017 (day10, day14).
+
+The list of numbers is a single bytearray, modified in place: reversing a
+sublist is a slice assignment, or two of them when the sublist wraps around the
+end of the list.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from operator import xor
+
+SIZE   = 256
+SUFFIX = bytes([17, 31, 73, 47, 23])
+
+def sparse_hash(lengths, rounds=1, size=SIZE):
+    """Apply rounds rounds of the knot algorithm with lengths (a sequence of
+    integers) to the list 0, 1, ..., size-1. Return the list as a bytearray."""
+
+    numbers = bytearray(range(size))
+    pos = skip_size = 0
+
+    for _ in range(rounds):
+        for length in lengths:
+            end = pos + length
+            if end <= size:
+                numbers[pos:end] = numbers[pos:end][::-1]
+            else:
+                # the reversed sublist starts with the reversed beginning of the
+                # list, and ends with the reversed end of the list
+                end -= size
+                sublist = numbers[:end][::-1] + numbers[pos:][::-1]
+                numbers[pos:] = sublist[:size-pos]
+                numbers[:end] = sublist[size-pos:]
+            pos = (end + skip_size) % size
+            skip_size += 1
+
+    return numbers
+
+def dense_hash(message):
+    """Compute the Knot Hash of message (str or bytes). Return its 16 bytes."""
+
+    if isinstance(message, str):
+        message = message.encode()
+
+    numbers = sparse_hash(message + SUFFIX, 64)
+    return bytes(reduce(xor, numbers[i:i+16]) for i in range(0, SIZE, 16))
+
+def knot_hash(message):
+    """Compute the Knot Hash of message. Return it as an hexadecimal string."""
+
+    return dense_hash(message).hex()
+
+def knot_hashes(messages, as_int=False, jobs=1):
+    """Compute the Knot Hash of each message of messages. Return the list of
+    hashes as bytes, or as 128-bit integers if as_int is True. With jobs > 1,
+    the messages are hashed in a pool of jobs processes."""
+
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            hashes = list(executor.map(dense_hash, messages, chunksize=16))
+    else:
+        hashes = [dense_hash(message) for message in messages]
+
+    if as_int:
+        return [int.from_bytes(h, "big") for h in hashes]
+    return hashes
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+
+"""Spiral memory of 2017 (day03).
+
+The squares are numbered from 1 at the center (0, 0), then 2 at (1, 0) and so
+on counterclockwise: x goes right and y goes up. Ring k (k >= 1) is made of the
+squares (2k-1)^2 + 1 to (2k+1)^2: it has 4 sides of 2k squares, starting just
+above its bottom right corner. So the position of a square (and the number of
+a position) is computed directly from its ring, its side and its offset on the
+side.
+"""
+
+from itertools import count
+from math import isqrt
+
+NEIGHBOURS = [(-1, -1), (0, -1), (1, -1), (-1, 0), (1, 0), (-1, 1), (0, 1),
+              (1, 1)]
+
+def coordinates(n):
+    """Return the position (x, y) of square n."""
+
+    if n == 1:
+        return 0, 0
+
+    ring = (isqrt(n-1) + 1) // 2
+    side, offset = divmod(n - (2*ring-1)**2 - 1, 2*ring)
+    if side == 0:   # right side, going up
+        return ring, offset - ring + 1
+    elif side == 1: # top side, going left
+        return ring - 1 - offset, ring
+    elif side == 2: # left side, going down
+        return -ring, ring - 1 - offset
+    else:           # bottom side, going right
+        return offset - ring + 1, -ring
+
+def square_number(x, y):
+    """Return the number of the square at position (x, y)."""
+
+    ring = max(abs(x), abs(y))
+    if ring == 0:
+        return 1
+
+    first = (2*ring-1)**2 + 1 # number of the first square of the ring
+    if x == ring and y > -ring:
+        return first + y + ring - 1
+    elif y == ring:
+        return first + 2*ring + ring - 1 - x
+    elif x == -ring:
+        return first + 4*ring + ring - 1 - y
+    else:
+        return first + 6*ring + x + ring - 1
+
+def distance_to_1(n):
+    """Return the distance between square n and the center (square 1)."""
+
+    x, y = coordinates(n)
+    return abs(x) + abs(y)
+
+def adjacent_sums():
+    """Generate the values stored in the squares 1, 2, 3, ... when each one is
+    the sum of the values of its adjacent squares already stored."""
+
+    values = {(0, 0): 1} # only the squares stored so far
+    yield 1
+
+    for n in count(2):
+        x, y = coordinates(n)
+        value = sum(values.get((x+dx, y+dy), 0) for dx, dy in NEIGHBOURS)
+        values[x, y] = value
+        yield value
+
+def find_larger_value(n):
+    """Return the first value of adjacent_sums larger than n."""
+
+    return find_larger_values([n])[0]
+
+def distances_to_1(numbers):
+    """Return the distance to the center of each square of numbers."""
+
+    return [distance_to_1(n) for n in numbers]
+
+def find_larger_values(numbers):
+    """Return the first value of adjacent_sums larger than each number of
+    numbers. The values are generated only once, for all the numbers."""
+
+    # answer the numbers from the smallest to the largest while the values are
+    # generated
+    order = sorted(range(len(numbers)), key=numbers.__getitem__)
+    answers = [None] * len(numbers)
+    values = adjacent_sums()
+    value = next(values)
+
+    for i in order:
+        while value <= numbers[i]:
+            value = next(values)
+        answers[i] = value
+
+    return answers
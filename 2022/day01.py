@@ -41,12 +41,6 @@ Python3 solution for the problem of Day 1 in Advent of Code 2022.
 # of their respective group sums.
 # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
-# We open the input file, and instead of reading it line by line, we read it
-# "group" by "group" (since we know that each group is separated by an empty
-# line, i.e. a double \n)
-with open("day01.input", encoding="UTF-8") as f:
-    data = f.read().split("\n\n")
-
 
 def sum_group(group: str) -> int:
     """
@@ -62,13 +56,34 @@ def sum_group(group: str) -> int:
     return sum(values)
 
 
-if __name__ == "__main__":
+def solve(text: str | bytes):
+    """
+    Yield the answer of each part for the puzzle input `text`.
+
+        Parameters:
+            text (str | bytes): The content of the input file.
+
+        Yields:
+            answer (int): The answer of Part 1, then the answer of Part 2.
+    """
+    if isinstance(text, bytes):
+        text = text.decode("UTF-8")
+
+    # Instead of reading the input line by line, we read it "group" by "group"
+    # (since we know that each group is separated by an empty line, i.e. a
+    # double \n)
+    data = text.split("\n\n")
     group_sums = [sum_group(group) for group in data]
 
     # Sort it because Part 2 requires to find the 3 largest group sums.
     group_sums.sort()
-    part1 = group_sums[-1]  # list is already sorted. Max value is at [-1].
-    part2 = sum(group_sums[-3:])  # the 3 largest values are at the end
+    yield group_sums[-1]  # list is already sorted. Max value is at [-1].
+    yield sum(group_sums[-3:])  # the 3 largest values are at the end
+
+
+if __name__ == "__main__":
+    with open("day01.input", encoding="UTF-8") as f:
+        answers = solve(f.read())
 
-    print(f"Part 1: {part1}")
-    print(f"Part 2: {part2}")
+    print(f"Part 1: {next(answers)}")
+    print(f"Part 2: {next(answers)}")
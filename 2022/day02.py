@@ -42,10 +42,6 @@ Python3 solution for the problem of Day 2 in Advent of Code 2022.
 # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
 
-# We open the input file, and read it line by line (i.e. round after round).
-with open("day02.input", encoding="UTF-8") as f:
-    data = f.read().splitlines()
-
 # For easier readability, let's convert the letters to what they represent.
 letter_to_choice = {
     "A": "Rock", "B": "Paper", "C": "Scissors",
@@ -138,9 +134,28 @@ def score_part2(list_rounds: list[str]) -> int:
     return total_score
 
 
+def solve(text: str | bytes):
+    """
+    Yield the answer of each part for the puzzle input `text`.
+
+        Parameters:
+            text (str | bytes): The content of the input file.
+
+        Yields:
+            answer (int): The answer of Part 1, then the answer of Part 2.
+    """
+    if isinstance(text, bytes):
+        text = text.decode("UTF-8")
+
+    # Read the input line by line (i.e. round after round).
+    data = text.splitlines()
+    yield score_part1(data)
+    yield score_part2(data)
+
+
 if __name__ == "__main__":
-    part1 = score_part1(data)
-    part2 = score_part2(data)
+    with open("day02.input", encoding="UTF-8") as f:
+        answers = solve(f.read())
 
-    print(f"Part 1: {part1}")
-    print(f"Part 2: {part2}")
+    print(f"Part 1: {next(answers)}")
+    print(f"Part 2: {next(answers)}")
@@ -35,11 +35,6 @@ Python3 solution for the problem of Day 3 in Advent of Code 2022.
 # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
 
-# We open the input file, and read it line by line
-with open("day03.input", encoding="UTF-8") as f:
-    data = f.read().splitlines()
-
-
 def compute_priority(item: str) -> int:
     """
     Return the priority value of the item, given the rule stated in the
@@ -85,7 +80,24 @@ def solve_part1(rucksacks: list[str]) -> int:
     return sum_priorities
 
 
+def solve(text: str | bytes):
+    """
+    Yield the answer of each part for the puzzle input `text`.
+
+        Parameters:
+            text (str | bytes): The content of the input file.
+
+        Yields:
+            answer (int): The answer of Part 1.
+    """
+    if isinstance(text, bytes):
+        text = text.decode("UTF-8")
+
+    yield solve_part1(text.splitlines())
+
+
 if __name__ == "__main__":
-    part1 = solve_part1(data)
+    with open("day03.input", encoding="UTF-8") as f:
+        answers = solve(f.read())
 
-    print(f"Part 1: {part1}")
+    print(f"Part 1: {next(answers)}")
@@ -76,20 +76,34 @@ def generate_number(line: str, use_spelled_digits: bool = False) -> int:
     return int(number)
 
 
+def solve(text: str | bytes):
+    """
+    Yield the answer of each part for the puzzle input `text`.
+
+        Parameters:
+            text (str | bytes): The content of the input file.
+
+        Yields:
+            answer (int): The answer of Part 1, then the answer of Part 2.
+    """
+    if isinstance(text, bytes):
+        text = text.decode("UTF-8")
+    data = text.splitlines()
+
+    yield sum(generate_number(line, use_spelled_digits=False)
+              for line in data)
+    yield sum(generate_number(line, use_spelled_digits=True)
+              for line in data)
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("-i", "--input", help="Filename of your input file.",
                         default="day01.input")
     args = parser.parse_args()
 
-    # We open the input file, and read it line by line.
     with open(args.input, encoding="UTF-8") as f:
-        data = f.readlines()
-
-    part1 = sum(generate_number(line, use_spelled_digits=False)
-                for line in data)
-    print(f"Part 1: {part1}")
+        answers = solve(f.read())
 
-    part2 = sum(generate_number(line, use_spelled_digits=True)
-                for line in data)
-    print(f"Part 2: {part2}")
+    print(f"Part 1: {next(answers)}")
+    print(f"Part 2: {next(answers)}")
@@ -122,24 +122,39 @@ def compute_game_power(cube_sets: list) -> int:
     return power
 
 
-if __name__ == "__main__":
-    parser = argparse.ArgumentParser()
-    parser.add_argument("-i", "--input", help="Filename of your input file.",
-                        default="day02.input")
-    args = parser.parse_args()
+def solve(text: str | bytes):
+    """
+    Yield the answer of each part for the puzzle input `text`.
 
-    # We open the input file, and read it line by line.
-    with open(args.input, encoding="UTF-8") as f:
-        data = f.readlines()
+        Parameters:
+            text (str | bytes): The content of the input file.
+
+        Yields:
+            answer (int): The answer of Part 1, then the answer of Part 2.
+    """
+    if isinstance(text, bytes):
+        text = text.decode("UTF-8")
+    data = text.splitlines()
 
     all_games = [parse_line(line) for line in data]
     possible_games = [game_id for (game_id, cube_sets) in all_games
                       if all(is_cube_set_valid(n_cubes)
                              for n_cubes in cube_sets)]
-    part1 = sum(possible_games)
-    print(f"Part 1: {part1}")
+    yield sum(possible_games)
 
     all_powers = [compute_game_power(cube_sets)
                   for (game_id, cube_sets) in all_games]
-    part2 = sum(all_powers)
-    print(f"Part 2: {part2}")
+    yield sum(all_powers)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-i", "--input", help="Filename of your input file.",
+                        default="day02.input")
+    args = parser.parse_args()
+
+    with open(args.input, encoding="UTF-8") as f:
+        answers = solve(f.read())
+
+    print(f"Part 1: {next(answers)}")
+    print(f"Part 2: {next(answers)}")
@@ -42,9 +42,6 @@ from collections import defaultdict
 import argparse
 import re
 
-# Maps a gear position (x,y) to its list of adjacent part numbers.
-GEARS: dict = defaultdict(list)
-
 
 def find_numbers(grid: list) -> list:
     """
@@ -75,7 +72,7 @@ def find_numbers(grid: list) -> list:
     return numbers
 
 
-def find_symbols_around(number: tuple, grid: list) -> list:
+def find_symbols_around(number: tuple, grid: list, gears: dict) -> list:
     """
     Return the list of symbols around `number` in `grid`.
 
@@ -83,6 +80,8 @@ def find_symbols_around(number: tuple, grid: list) -> list:
             number (tuple): Information about the position and the length of
                             `number`to find it in the grid.
             grid (list): A list of string. Each string is a line of the grid.
+            gears (dict): Maps a gear position (x,y) to its list of adjacent
+                          part numbers. Updated with the '*' around `number`.
 
         Returns:
             symbols (list): A list of all the symbols around `number` in the
@@ -92,63 +91,80 @@ def find_symbols_around(number: tuple, grid: list) -> list:
     x, y, length, value = number
 
     # For Part 2, we need to find the '*' symbols that have exactly 2 adjacent
-    # part numbers. So when we find a '*' during Part 1, we save in the global
-    # variable GEARS that for this '*' symbol (at its position), `number` is
-    # one of its adjacent neighbor. That way, we won't need to go through the
+    # part numbers. So when we find a '*' during Part 1, we save in `gears`
+    # that for this '*' symbol (at its position), `number` is one of its
+    # adjacent neighbor. That way, we won't need to go through the
     # traversal of the grid a second time to find the "gears" needed in Part 2.
 
     # Check left side.
     if grid[x][y-1] != ".":
         symbols.append(grid[x][y-1])
         if grid[x][y-1] == "*":  # For Part 2
-            GEARS[(x, y-1)].append(value)
+            gears[(x, y-1)].append(value)
 
     # Check bottom side.
     for j in range(y-1, y-1 + (length+2)):
         if grid[x+1][j] != ".":
             symbols.append(grid[x+1][j])
             if grid[x+1][j] == "*":  # For Part 2
-                GEARS[(x+1, j)].append(value)
+                gears[(x+1, j)].append(value)
 
     # Check right side.
     if grid[x][y+length] != ".":
         symbols.append(grid[x][y+length])
         if grid[x][y+length] == "*":  # For Part 2
-            GEARS[(x, y+length)].append(value)
+            gears[(x, y+length)].append(value)
 
     # Check top side.
     for j in range(y-1, y-1 + (length+2)):
         if grid[x-1][j] != ".":
             symbols.append(grid[x-1][j])
             if grid[x-1][j] == "*":  # For Part 2
-                GEARS[(x-1, j)].append(value)
+                gears[(x-1, j)].append(value)
 
     return symbols
 
 
-if __name__ == "__main__":
-    parser = argparse.ArgumentParser()
-    parser.add_argument("-i", "--input", help="Filename of your input file.",
-                        default="day03.input")
-    args = parser.parse_args()
+def solve(text: str | bytes):
+    """
+    Yield the answer of each part for the puzzle input `text`.
 
-    # We open the input file, and read it line by line.
-    with open(args.input, encoding="UTF-8") as f:
-        data = f.readlines()
+        Parameters:
+            text (str | bytes): The content of the input file.
+
+        Yields:
+            answer (int): The answer of Part 1, then the answer of Part 2.
+    """
+    if isinstance(text, bytes):
+        text = text.decode("UTF-8")
+    data = text.splitlines()
 
     # Generate a grid from data. Add a "border" around the grid, so we don't
     # need to check negative/overflow indexes when looking "around" each cell
     # of the original grid.
-    G = ["." * (len(data[0].strip())+2)]  # +2 because: left/right borders
+    grid = ["." * (len(data[0].strip())+2)]  # +2 because: left/right borders
     for line in data:
-        G.append("." + line.strip() + ".")
-    G.append("." * (len(data[0].strip()) + 2))  # +2 because: same reason
+        grid.append("." + line.strip() + ".")
+    grid.append("." * (len(data[0].strip()) + 2))  # +2 because: same reason
 
-    all_numbers = find_numbers(G)
-    part1 = sum(value for (x, y, length, value) in all_numbers
-                if len(find_symbols_around((x, y, length, value), G)) > 0)
-    print(f"Part 1: {part1}")
+    gears = defaultdict(list)
+    all_numbers = find_numbers(grid)
+    yield sum(value for (x, y, length, value) in all_numbers
+              if len(find_symbols_around((x, y, length, value), grid,
+                                         gears)) > 0)
+
+    yield sum(numbers[0] * numbers[1] for gear, numbers in gears.items()
+              if len(numbers) == 2)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-i", "--input", help="Filename of your input file.",
+                        default="day03.input")
+    args = parser.parse_args()
+
+    with open(args.input, encoding="UTF-8") as f:
+        answers = solve(f.read())
 
-    part2 = sum(numbers[0] * numbers[1] for gear, numbers in GEARS.items()
-                if len(numbers) == 2)
-    print(f"Part 2: {part2}")
+    print(f"Part 1: {next(answers)}")
+    print(f"Part 2: {next(answers)}")
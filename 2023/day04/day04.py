@@ -85,19 +85,22 @@ def count_winning_numbers(line: str) -> int:
     return len(winning_numbers & my_numbers)
 
 
-if __name__ == "__main__":
-    parser = argparse.ArgumentParser()
-    parser.add_argument("-i", "--input", help="Filename of your input file.",
-                        default="day04.input")
-    args = parser.parse_args()
+def solve(text: str | bytes):
+    """
+    Yield the answer of each part for the puzzle input `text`.
 
-    # We open the input file, and read it line by line.
-    with open(args.input, encoding="UTF-8") as f:
-        data = f.readlines()
+        Parameters:
+            text (str | bytes): The content of the input file.
+
+        Yields:
+            answer (int): The answer of Part 1, then the answer of Part 2.
+    """
+    if isinstance(text, bytes):
+        text = text.decode("UTF-8")
+    data = text.splitlines()
 
     n_winning_per_game = [count_winning_numbers(line) for line in data]
-    part1 = sum(compute_score(n_winning) for n_winning in n_winning_per_game)
-    print(f"Part 1: {part1}")
+    yield sum(compute_score(n_winning) for n_winning in n_winning_per_game)
 
     n_cards = [1 for _ in range(len(n_winning_per_game))]
     for i, n_winning in enumerate(n_winning_per_game):
@@ -106,5 +109,17 @@ if __name__ == "__main__":
             # also for all its copies, which is the number of the card `i` that
             # I have at this moment.
             n_cards[next_game_id] += n_cards[i]
-    part2 = sum(n_cards)
-    print(f"Part 2: {part2}")
+    yield sum(n_cards)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-i", "--input", help="Filename of your input file.",
+                        default="day04.input")
+    args = parser.parse_args()
+
+    with open(args.input, encoding="UTF-8") as f:
+        answers = solve(f.read())
+
+    print(f"Part 1: {next(answers)}")
+    print(f"Part 2: {next(answers)}")
@@ -191,15 +191,19 @@ def apply_mapping_to_ranges(source_ranges: list, mapping_ranges: list) -> list:
     return transformed_ranges
 
 
-if __name__ == "__main__":
-    parser = argparse.ArgumentParser()
-    parser.add_argument("-i", "--input", help="Filename of your input file.",
-                        default="day05.input")
-    args = parser.parse_args()
+def solve(text: str | bytes):
+    """
+    Yield the answer of each part for the puzzle input `text`.
 
-    # We open the input file, and read it line by line.
-    with open(args.input, encoding="UTF-8") as f:
-        data = f.read().split("\n\n")
+        Parameters:
+            text (str | bytes): The content of the input file.
+
+        Yields:
+            answer (int): The answer of Part 1, then the answer of Part 2.
+    """
+    if isinstance(text, bytes):
+        text = text.decode("UTF-8")
+    data = text.split("\n\n")
 
     # Parse input data to get seeds ID.
     seeds_str = data[0].split(":")[1]
@@ -214,13 +218,24 @@ if __name__ == "__main__":
 
     locations = [apply_consecutive_mappings(seed, all_mappings)
                  for seed in seeds]
-    part1 = min(locations)
-    print(f"Part 1: {part1}")
+    yield min(locations)
 
     seed_ranges = []
     for pos in range(0, len(seeds), 2):
         seed_ranges.append([seeds[pos], seeds[pos] + seeds[pos+1]])
     for mapping in all_mappings:
         seed_ranges = apply_mapping_to_ranges(seed_ranges, mapping)
-    part2 = min(start_range for (start_range, end_range) in seed_ranges)
-    print(f"Part 2: {part2}")
+    yield min(start_range for (start_range, end_range) in seed_ranges)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-i", "--input", help="Filename of your input file.",
+                        default="day05.input")
+    args = parser.parse_args()
+
+    with open(args.input, encoding="UTF-8") as f:
+        answers = solve(f.read())
+
+    print(f"Part 1: {next(answers)}")
+    print(f"Part 2: {next(answers)}")
@@ -123,28 +123,41 @@ def product(values: list[int]) -> int:
     return prod
 
 
-if __name__ == "__main__":
-    # pylint: disable=C0103
-    parser = argparse.ArgumentParser()
-    parser.add_argument("-i", "--input", help="Filename of your input file.",
-                        default="day06.input")
-    args = parser.parse_args()
+def solve(text: str | bytes):
+    """
+    Yield the answer of each part for the puzzle input `text`.
 
-    # We open the input file, and read it line by line.
-    with open(args.input, encoding="UTF-8") as f:
-        data = f.readlines()
+        Parameters:
+            text (str | bytes): The content of the input file.
+
+        Yields:
+            answer (int): The answer of Part 1, then the answer of Part 2.
+    """
+    if isinstance(text, bytes):
+        text = text.decode("UTF-8")
+    data = text.splitlines()
 
     times_str = data[0].split(":")[1].split()
     times = list(map(int, times_str))
     distances_str = data[1].split(":")[1].split()
     distances = list(map(int, distances_str))
 
-    part1 = product([n_ways_beat_record_optimized(t, d)
-                     for (t, d) in zip(times, distances)])
-    print(f"Part 1: {part1}")
+    yield product([n_ways_beat_record_optimized(t, d)
+                   for (t, d) in zip(times, distances)])
 
     time_single_race = int("".join(times_str))
     distance_single_race = int("".join(distances_str))
-    part2 = n_ways_beat_record_optimized(time_single_race,
-                                         distance_single_race)
-    print(f"Part 2: {part2}")
+    yield n_ways_beat_record_optimized(time_single_race, distance_single_race)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-i", "--input", help="Filename of your input file.",
+                        default="day06.input")
+    args = parser.parse_args()
+
+    with open(args.input, encoding="UTF-8") as f:
+        answers = solve(f.read())
+
+    print(f"Part 1: {next(answers)}")
+    print(f"Part 2: {next(answers)}")
@@ -145,15 +145,19 @@ def compute_hand_value(hand: str, use_jokers: bool = False) -> tuple:
     return hand_value
 
 
-if __name__ == "__main__":
-    parser = argparse.ArgumentParser()
-    parser.add_argument("-i", "--input", help="Filename of your input file.",
-                        default="day07.input")
-    args = parser.parse_args()
+def solve(text: str | bytes):
+    """
+    Yield the answer of each part for the puzzle input `text`.
 
-    # We open the input file, and read it line by line.
-    with open(args.input, encoding="UTF-8") as f:
-        data = f.readlines()
+        Parameters:
+            text (str | bytes): The content of the input file.
+
+        Yields:
+            answer (int): The answer of Part 1, then the answer of Part 2.
+    """
+    if isinstance(text, bytes):
+        text = text.decode("UTF-8")
+    data = text.splitlines()
 
     poker_hands = []
     for line in data:
@@ -161,8 +165,7 @@ if __name__ == "__main__":
         poker_hands.append((compute_hand_value(hand_str, False), int(bid)))
         poker_hands.sort()
 
-    part1 = sum((rank+1) * hand[1] for rank, hand in enumerate(poker_hands))
-    print(f"Part 1: {part1}")
+    yield sum((rank+1) * hand[1] for rank, hand in enumerate(poker_hands))
 
     poker_hands = []
     for line in data:
@@ -170,5 +173,17 @@ if __name__ == "__main__":
         poker_hands.append((compute_hand_value(hand_str, True), int(bid)))
         poker_hands.sort()
 
-    part2 = sum((rank+1) * hand[1] for rank, hand in enumerate(poker_hands))
-    print(f"Part 2: {part2}")
+    yield sum((rank+1) * hand[1] for rank, hand in enumerate(poker_hands))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-i", "--input", help="Filename of your input file.",
+                        default="day07.input")
+    args = parser.parse_args()
+
+    with open(args.input, encoding="UTF-8") as f:
+        answers = solve(f.read())
+
+    print(f"Part 1: {next(answers)}")
+    print(f"Part 2: {next(answers)}")
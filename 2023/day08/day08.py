@@ -110,20 +110,24 @@ def traverse_graph(graph: dict, instructions: str,
     return n_steps
 
 
-if __name__ == "__main__":
-    # pylint: disable=C0103
-    parser = argparse.ArgumentParser()
-    parser.add_argument("-i", "--input", help="Filename of your input file.",
-                        default="day08.input")
-    args = parser.parse_args()
+def solve(text: str | bytes):
+    """
+    Yield the answer of each part for the puzzle input `text`.
 
-    # We open the input file, and read it block by block.
-    with open(args.input, encoding="UTF-8") as f:
-        traverse_instructions, graph_instructions = f.read().split("\n\n")
+        Parameters:
+            text (str | bytes): The content of the input file.
+
+        Yields:
+            answer (int): The answer of Part 1, then the answer of Part 2.
+    """
+    if isinstance(text, bytes):
+        text = text.decode("UTF-8")
+    # pylint: disable=C0103
+    # The input is read block by block.
+    traverse_instructions, graph_instructions = text.split("\n\n")
 
     G = build_graph(graph_instructions.strip())
-    part1 = traverse_graph(G, traverse_instructions, "AAA", {"ZZZ"})
-    print(f"Part 1: {part1}")
+    yield traverse_graph(G, traverse_instructions, "AAA", {"ZZZ"})
 
     # This graph is special. For every nodes that end with "A", there exists a
     # unique node that ends with Z which is "reversed". For example, in my
@@ -148,5 +152,17 @@ if __name__ == "__main__":
     for s in possible_starts:
         all_N_i[s] = traverse_graph(G, traverse_instructions,
                                     s, possible_ends)
-    part2 = lcm(*all_N_i.values())
-    print(f"Part 2: {part2}")
+    yield lcm(*all_N_i.values())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-i", "--input", help="Filename of your input file.",
+                        default="day08.input")
+    args = parser.parse_args()
+
+    with open(args.input, encoding="UTF-8") as f:
+        answers = solve(f.read())
+
+    print(f"Part 1: {next(answers)}")
+    print(f"Part 2: {next(answers)}")
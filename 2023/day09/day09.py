@@ -78,19 +78,23 @@ def extrapolate_right(numbers: list[int]) -> int:
     return extrapolated
 
 
-if __name__ == "__main__":
-    parser = argparse.ArgumentParser()
-    parser.add_argument("-i", "--input", help="Filename of your input file.",
-                        default="day09.input")
-    args = parser.parse_args()
+def solve(text: str | bytes):
+    """
+    Yield the answer of each part for the puzzle input `text`.
 
-    # Open the input file, and read it line by line. The, parse each line
-    # (sequences of integer numbers).
-    with open(args.input, encoding="UTF-8") as f:
-        data = [list(map(int, line.split())) for line in f.readlines()]
+        Parameters:
+            text (str | bytes): The content of the input file.
+
+        Yields:
+            answer (int): The answer of Part 1, then the answer of Part 2.
+    """
+    if isinstance(text, bytes):
+        text = text.decode("UTF-8")
+    # Read the input line by line, and parse each line (sequences of integer
+    # numbers).
+    data = [list(map(int, line.split())) for line in text.splitlines()]
 
-    part1 = sum(extrapolate_right(sequence) for sequence in data)
-    print(f"Part 1: {part1}")
+    yield sum(extrapolate_right(sequence) for sequence in data)
 
     # Let's illustrate Part 2 with an example sequence. The
     # sequence could look like:
@@ -121,5 +125,17 @@ if __name__ == "__main__":
     # (which is what we are looking for, the extrapolated previous value of the
     # sequence), we simply have to compute the value Z, the extrapolated next
     # value of the reversed sequence.
-    part2 = sum(extrapolate_right(sequence[::-1]) for sequence in data)
-    print(f"Part 2: {part2}")
+    yield sum(extrapolate_right(sequence[::-1]) for sequence in data)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-i", "--input", help="Filename of your input file.",
+                        default="day09.input")
+    args = parser.parse_args()
+
+    with open(args.input, encoding="UTF-8") as f:
+        answers = solve(f.read())
+
+    print(f"Part 1: {next(answers)}")
+    print(f"Part 2: {next(answers)}")
@@ -0,0 +1,3 @@
+"""
+Tools to run, time and inspect the Advent of Code solutions of this repository.
+"""
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# *_* coding: utf-8 *_*
+
+"""
+Solve one day on many input files in a pool of processes.
+"""
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+# Running `day07.py -i <file>` once per input file spends most of its time
+# starting the interpreter. Here, each worker process of the pool imports the
+# solution once (when it starts) and then calls its `solve` function on every
+# input file it is given.
+#
+# The results are written on stdout as JSON lines, in the order the files are
+# solved (not the order they are given):
+#   {"input": "in/a.txt", "parts": [{"part": 1, "answer": "42", "wall": ...,
+#    "cpu": ...}, ...], "cached": false}
+# A file that cannot be solved gives a line with an "error" key instead.
+# The answers are also read from and written to the cache (see aoc/cache.py),
+# which is then evicted down to --cache-size MB.
+#
+# Usage:
+#   python3 -m aoc.batch 2023 7 inputs/               # every file of inputs/
+#   python3 -m aoc.batch 2023 7 'inputs/*.txt' -j 8 > results.jsonl
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+import argparse
+import glob
+import json
+import os
+import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from aoc import cache
+from aoc.days import Day, find_days
+from aoc.runner import load_solver, time_parts
+
+
+def find_inputs(patterns: list) -> list:
+    """
+    Return the sorted list of input files matched by `patterns`. A pattern is
+    either a directory (all its files) or a glob pattern.
+
+        Parameters:
+            patterns (list): The directories and glob patterns.
+
+        Returns:
+            paths (list): The paths of the input files.
+    """
+    paths = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            pattern = os.path.join(pattern, "*")
+        paths.update(path for path in glob.glob(pattern)
+                     if os.path.isfile(path))
+    return sorted(paths)
+
+
+def solve_file(day: Day, path: str, cache_dir: str = None) -> dict:
+    """
+    Solve `day` on the input file `path` and return the result as a dict.
+
+        Parameters:
+            day (Day): The day to solve.
+            path (str): The path of the input file.
+            cache_dir (str): The directory of the cache. No cache if None.
+
+        Returns:
+            result (dict): The path, and either the parts or the error.
+    """
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+
+        key = None
+        if cache_dir is not None:
+            key = cache.cache_key(day, data)
+            parts = cache.load(cache_dir, key)
+            if parts is not None:
+                return {"input": path, "parts": parts, "cached": True}
+
+        parts = [part._asdict() for part in time_parts(load_solver(day), data)]
+        if key is not None:
+            cache.store(cache_dir, key, day.name, parts)
+        return {"input": path, "parts": parts, "cached": False}
+    except Exception:  # pylint: disable=W0718
+        return {"input": path,
+                "error": traceback.format_exc(limit=-1).strip()}
+
+
+def solve_files(day: Day, paths: list, jobs: int = None,
+                cache_dir: str = None):
+    """
+    Solve `day` on all the input files `paths` in a pool of `jobs` processes.
+    Yield the result of each file as soon as it is solved.
+
+        Parameters:
+            day (Day): The day to solve.
+            paths (list): The paths of the input files.
+            jobs (int): Number of worker processes. Use all the CPUs if None.
+            cache_dir (str): The directory of the cache. No cache if None.
+
+        Yields:
+            result (dict): The result of a solved file (see solve_file).
+    """
+    # Import the solution in each worker as soon as it starts.
+    with ProcessPoolExecutor(max_workers=jobs, initializer=load_solver,
+                             initargs=(day,)) as executor:
+        futures = [executor.submit(solve_file, day, path, cache_dir)
+                   for path in paths]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def main():
+    """Parse the command line and solve the day on every input file."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("year", type=int, help="Year of the puzzle.")
+    parser.add_argument("day", type=int, help="Day of the puzzle.")
+    parser.add_argument("inputs", nargs="+",
+                        help="Directories or glob patterns of input files.")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(),
+                        help="Number of worker processes (default: "
+                             "%(default)s).")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Do not read nor write the cache.")
+    parser.add_argument("--cache-dir", default=cache.CACHE_DIR,
+                        help="Directory of the cache (default: %(default)s).")
+    parser.add_argument("--cache-size", type=int,
+                        default=cache.CACHE_SIZE // 2**20,
+                        help="Maximum size of the cache, in MB "
+                             "(default: %(default)s).")
+    args = parser.parse_args()
+    cache_dir = None if args.no_cache else args.cache_dir
+
+    days = find_days(years=[args.year], days=[args.day])
+    if not days:
+        parser.error(f"no solution for {args.year}/day{args.day:02d}")
+    paths = find_inputs(args.inputs)
+    if not paths:
+        parser.error("no input file found")
+
+    n_errors = 0
+    for result in solve_files(days[0], paths, args.jobs, cache_dir):
+        n_errors += "error" in result
+        print(json.dumps(result), flush=True)
+    print(f"{len(paths)} inputs ({n_errors} failed)", file=sys.stderr)
+    if cache_dir is not None:
+        cache.evict(cache_dir, args.cache_size * 2**20)
+
+    if n_errors:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# *_* coding: utf-8 *_*
+
+"""
+Benchmark the solutions on synthetic inputs of increasing size.
+"""
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+# For each selected day and each scale (1x, 10x, 100x, 1000x the size of a real
+# input by default), we generate an input with aoc/generators.py and solve it
+# in a fresh process. The process records the wall time and CPU time of each
+# part, and how much its peak memory (resident set size) grew while solving.
+# A run that exceeds the time limit is killed, and the bigger scales of the
+# same day are skipped.
+#
+# To see how a solution scales, the report shows an "exponent" for each scale:
+# log(time / previous time) / log(scale / previous scale). It is about 1 for a
+# linear solution and about 2 for a quadratic one.
+#
+# Usage:
+#   python3 -m aoc.bench -y 2017 -d 20                   # 1x ... 1000x
+#   python3 -m aoc.bench -y 2023 -s 1 10 -o bench.json  # save the results
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+import argparse
+import json
+import math
+import multiprocessing
+import resource
+import sys
+import traceback
+
+from aoc.days import Day, find_days, load_module
+from aoc.generators import GENERATORS, generate
+from aoc.runner import time_parts
+
+SCALES = [1, 10, 100, 1000]
+
+
+def measure(day: Day, text: str, memory_limit: int, connection):
+    """
+    Solve `day` on `text` and send the measures through `connection`. This is
+    the target of the benchmark process.
+
+        Parameters:
+            day (Day): The day to benchmark.
+            text (str): The generated input.
+            memory_limit (int): Maximum size of the address space (in bytes)
+                                of the process. No limit if None.
+            connection (Connection): Where to send the measures (a dict).
+    """
+    try:
+        if memory_limit is not None:
+            resource.setrlimit(resource.RLIMIT_AS,
+                               (memory_limit, memory_limit))
+        solve = load_module(day).solve
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        parts = time_parts(solve, text)
+        rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        connection.send({
+            "status": "ok",
+            "parts": [part._asdict() for part in parts],
+            "wall": sum(part.wall for part in parts),
+            "cpu": sum(part.cpu for part in parts),
+            "peak_memory_kb": rss_after - rss_before,
+        })
+    except BaseException:  # pylint: disable=W0718
+        connection.send({"status": "error",
+                         "error": traceback.format_exc(limit=-1).strip()})
+
+
+def bench(day: Day, scale: int, seed: int, timeout: float,
+          memory_limit: int) -> dict:
+    """
+    Benchmark `day` on a generated input of size `scale`.
+
+        Parameters:
+            day (Day): The day to benchmark.
+            scale (int): The size of the input, relative to a real input.
+            seed (int): The seed of the generator.
+            timeout (float): Time limit (in seconds) of the solution.
+            memory_limit (int): Memory limit (in bytes) of the solution.
+
+        Returns:
+            record (dict): The description of the run and its measures.
+    """
+    text = generate(day.year, day.day, scale, seed)
+    record = {"year": day.year, "day": day.day, "scale": scale, "seed": seed,
+              "input_bytes": len(text.encode())}
+
+    # "fork" so the generated input is not copied to the child process.
+    context = multiprocessing.get_context("fork")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=measure,
+                              args=(day, text, memory_limit, sender))
+    process.start()
+    sender.close()  # so the pipe is closed if the process dies
+    if not receiver.poll(timeout):
+        record.update({"status": "timeout", "timeout": timeout})
+        process.kill()
+    else:
+        try:
+            record.update(receiver.recv())
+        except EOFError:
+            process.join()
+            record.update({"status": "error",
+                           "error": f"exit code {process.exitcode}"})
+    process.join()
+    return record
+
+
+def print_record(record: dict, previous: dict):
+    """
+    Print one line of the report. Compare with the `previous` record of the
+    same day to compute the scaling exponent.
+
+        Parameters:
+            record (dict): The record to print.
+            previous (dict): The record of the previous scale, or None.
+    """
+    name = f"{record['year']}/day{record['day']:02d}"
+    size = f"{record['input_bytes'] / 1024:.1f}k"
+    if record["status"] != "ok":
+        error = record.get("error", "").split("\n")[-1]
+        print(f"{name:<12}{record['scale']:>6}{size:>10}  {record['status']}"
+              f" {error}")
+        return
+
+    exponent = ""
+    if previous is not None and previous["status"] == "ok" and \
+       previous["wall"] > 0.01 and record["scale"] > previous["scale"]:
+        exponent = math.log(record["wall"] / previous["wall"]) / \
+                   math.log(record["scale"] / previous["scale"])
+        exponent = f"{exponent:.2f}"
+    parts = " ".join(f"{part['wall']:.3f}" for part in record["parts"])
+    print(f"{name:<12}{record['scale']:>6}{size:>10}{record['wall']:>10.3f}"
+          f"{record['cpu']:>10.3f}{record['peak_memory_kb'] / 1024:>10.1f}"
+          f"{exponent:>10}  {parts}")
+
+
+def main():
+    """Parse the command line, run the benchmarks and report them."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-y", "--year", type=int, action="append",
+                        help="Only benchmark the days of this year.")
+    parser.add_argument("-d", "--day", type=int, action="append",
+                        help="Only benchmark this day (repeatable).")
+    parser.add_argument("-s", "--scales", type=int, nargs="+", default=SCALES,
+                        help="Sizes of the inputs (default: %(default)s).")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="Seed of the generators (default: %(default)s).")
+    parser.add_argument("-t", "--timeout", type=float, default=60,
+                        help="Time limit of a run, in seconds "
+                             "(default: %(default)s).")
+    parser.add_argument("-m", "--memory-limit", type=int, default=4096,
+                        help="Memory limit of a run, in MB "
+                             "(default: %(default)s, 0 for no limit).")
+    parser.add_argument("-o", "--output",
+                        help="Write the results to this JSON file.")
+    args = parser.parse_args()
+
+    days = [day for day in find_days(years=args.year, days=args.day)
+            if (day.year, day.day) in GENERATORS]
+    if not days:
+        sys.exit("No day to benchmark.")
+    memory_limit = args.memory_limit * 2**20 if args.memory_limit else None
+
+    print(f"{'day':<12}{'scale':>6}{'input':>10}{'wall (s)':>10}"
+          f"{'cpu (s)':>10}{'mem (MB)':>10}{'exponent':>10}  parts (s)")
+    records = []
+    for day in days:
+        scales = sorted(args.scales)
+        if not GENERATORS[(day.year, day.day)].scalable:
+            scales = scales[:1]  # the input does not grow with the scale
+
+        previous = None
+        for scale in scales:
+            record = bench(day, scale, args.seed, args.timeout, memory_limit)
+            print_record(record, previous)
+            records.append(record)
+            if record["status"] != "ok":
+                break  # bigger inputs would fail as well
+            previous = record
+
+    if args.output:
+        with open(args.output, "w", encoding="UTF-8") as f:
+            json.dump(records, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# *_* coding: utf-8 *_*
+
+"""
+On-disk cache of the answers of a day, keyed by its input and its source code.
+"""
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+# Solving a day again on the same input, with the same code, gives the same
+# answers. So we store the answer and timing of each part in a JSON file whose
+# name is the SHA-256 of:
+#   - the bytes of the input,
+#   - the source of the solution script, and of the modules of its year
+#     directory it imports (like 2017/knothash.py), so that editing the solution
+#     or a library it uses invalidates the entry.
+#
+# The entries are stored in <directory>/<2 first characters of key>/<key>.json.
+# Reading an entry updates its modification time, so the cache can be evicted
+# in least recently used order until its total size fits in a limit.
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+import hashlib
+import json
+import os
+import re
+import tempfile
+
+from aoc.days import ROOT, Day
+
+CACHE_DIR = os.environ.get("AOC_CACHE_DIR", os.path.join(ROOT, ".aoc_cache"))
+CACHE_SIZE = 64 * 2**20
+
+
+def source_files(day: Day) -> list:
+    """
+    Return the path of the script of `day` and of the modules of its year
+    directory that it imports.
+
+        Parameters:
+            day (Day): The day to get the source files of.
+
+        Returns:
+            paths (list): The paths of the source files, script first.
+    """
+    with open(day.path, encoding="UTF-8") as f:
+        source = f.read()
+
+    year_dir = os.path.join(ROOT, str(day.year))
+    paths = [day.path]
+    for name in sorted(set(re.findall(r"^\s*(?:from|import)\s+(\w+)", source,
+                                      flags=re.MULTILINE))):
+        path = os.path.join(year_dir, f"{name}.py")
+        if os.path.isfile(path) and path != day.path:
+            paths.append(path)
+    return paths
+
+
+def cache_key(day: Day, data: bytes) -> str:
+    """
+    Return the key of the answers of `day` on the input `data`.
+
+        Parameters:
+            day (Day): The day to solve.
+            data (bytes): The content of the input file.
+
+        Returns:
+            key (str): The hexadecimal SHA-256 of the input and the source.
+    """
+    digest = hashlib.sha256()
+    digest.update(hashlib.sha256(data).digest())
+    for path in source_files(day):
+        with open(path, "rb") as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()
+
+
+def entry_path(directory: str, key: str) -> str:
+    """Return the path of the file of the entry `key`."""
+    return os.path.join(directory, key[:2], f"{key}.json")
+
+
+def load(directory: str, key: str) -> list:
+    """
+    Return the parts stored for `key`, or None if they are not in the cache.
+
+        Parameters:
+            directory (str): The directory of the cache.
+            key (str): The key of the entry.
+
+        Returns:
+            parts (list): A list of dict (part, answer, wall, cpu).
+    """
+    path = entry_path(directory, key)
+    try:
+        with open(path, encoding="UTF-8") as f:
+            entry = json.load(f)
+        os.utime(path)  # mark as recently used
+    except (OSError, ValueError):
+        return None
+    return entry["parts"]
+
+
+def store(directory: str, key: str, name: str, parts: list):
+    """
+    Store the `parts` of the day `name` in the cache under `key`.
+
+        Parameters:
+            directory (str): The directory of the cache.
+            key (str): The key of the entry.
+            name (str): The name of the day (only informative).
+            parts (list): A list of dict (part, answer, wall, cpu).
+    """
+    path = entry_path(directory, key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    # Write to a temporary file first, so that several processes can write the
+    # same entry and no reader sees a partially written file.
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="UTF-8") as f:
+        json.dump({"day": name, "parts": parts}, f)
+    os.replace(tmp_path, path)
+
+
+def evict(directory: str, max_size: int = CACHE_SIZE) -> int:
+    """
+    Delete the least recently used entries of the cache until the size of the
+    remaining ones is at most `max_size` bytes.
+
+        Parameters:
+            directory (str): The directory of the cache.
+            max_size (int): The maximum size of the cache, in bytes.
+
+        Returns:
+            n_deleted (int): The number of deleted entries.
+    """
+    entries = []
+    for dirpath, _, filenames in os.walk(directory):
+        for filename in filenames:
+            if filename.endswith(".json"):
+                stat = os.stat(os.path.join(dirpath, filename))
+                entries.append((stat.st_mtime, stat.st_size,
+                                os.path.join(dirpath, filename)))
+
+    total_size = sum(size for _, size, _ in entries)
+    n_deleted = 0
+    for _, size, path in sorted(entries):
+        if total_size <= max_size:
+            break
+        os.remove(path)
+        total_size -= size
+        n_deleted += 1
+    return n_deleted
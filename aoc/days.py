@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# *_* coding: utf-8 *_*
+
+"""
+Find the solutions of every year/day in the repository.
+"""
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+# The solutions are not laid out the same way for every year:
+#   - 2017/day05/day05.py  (one directory per day)
+#   - 2022/day01.py        (all days in the year directory)
+#   - 2023/day05/day05.py  (one directory per day)
+#
+# Each solution is a standalone script that reads its input file relatively to
+# its own directory, so a day is identified by its year, its number and the
+# path of its script. The input file is next to the script and is named either
+# dayNN.input (2022, 2023) or dayNN_something.txt (2017).
+#
+# Every script also exposes a `solve(text)` function, free of side effects. It
+# takes the content of an input file (str or bytes) and yields the answer of
+# each part, so it can be imported once and called many times.
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+import glob
+import importlib.util
+import os
+import re
+import sys
+from typing import NamedTuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class Day(NamedTuple):
+    """A single solution script of the repository."""
+    year: int
+    day: int
+    path: str
+
+    @property
+    def name(self) -> str:
+        """Short name of the day, like 2017/day05."""
+        return f"{self.year}/day{self.day:02d}"
+
+
+def find_days(root: str = ROOT, years: list = None, days: list = None) -> list:
+    """
+    Return the list of all solutions found in `root`, sorted by year and day.
+
+        Parameters:
+            root (str): The directory containing the year directories.
+            years (list): If given, only keep the solutions of these years.
+            days (list): If given, only keep the solutions of these days.
+
+        Returns:
+            found (list): A list of Day, one for each solution script.
+    """
+    found = []
+    for year_dir in os.listdir(root):
+        if not re.fullmatch(r"\d{4}", year_dir):
+            continue
+        year = int(year_dir)
+        if years and year not in years:
+            continue
+
+        # Walk the year directory to find both layouts (dayNN.py and
+        # dayNN/dayNN.py).
+        for dirpath, _, filenames in os.walk(os.path.join(root, year_dir)):
+            for filename in filenames:
+                match = re.fullmatch(r"day(\d{2})\.py", filename)
+                if match is None:
+                    continue
+                day = int(match.group(1))
+                if days and day not in days:
+                    continue
+                found.append(Day(year, day, os.path.join(dirpath, filename)))
+
+    found.sort()
+    return found
+
+
+def find_input(day: Day) -> str:
+    """
+    Return the path of the input file of `day`, or None if there is none.
+
+        Parameters:
+            day (Day): The day to find the input file of.
+
+        Returns:
+            path (str): The path of the input file.
+    """
+    directory = os.path.dirname(day.path)
+    for pattern in (f"day{day.day:02d}.input", f"day{day.day:02d}_*.txt"):
+        paths = sorted(glob.glob(os.path.join(directory, pattern)))
+        if paths:
+            return paths[0]
+    return None
+
+
+def load_module(day: Day):
+    """
+    Import the script of `day` as a module (its `__main__` block is not run).
+    The directory of the modules shared by the days of its year is added to
+    `sys.path`, as the script itself does when it is run.
+
+        Parameters:
+            day (Day): The day to import.
+
+        Returns:
+            module (module): The imported module.
+    """
+    # the scripts of a year may import modules shared by all its days (like
+    # 2017/assembly.py), which are in the year directory: the parent of the
+    # script directory in the one-directory-per-day layout
+    directory = os.path.dirname(day.path)
+    if re.fullmatch(r"day\d{2}", os.path.basename(directory)):
+        directory = os.path.dirname(directory)
+    if directory not in sys.path:
+        sys.path.append(directory)
+
+    name = f"aoc_{day.year}_day{day.day:02d}"
+    spec = importlib.util.spec_from_file_location(name, day.path)
+    module = importlib.util.module_from_spec(spec)
+    # registered so that its functions can be pickled (to worker processes)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
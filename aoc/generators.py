@@ -0,0 +1,812 @@
+#!/usr/bin/env python3
+# *_* coding: utf-8 *_*
+
+"""
+Seeded generators of synthetic puzzle inputs, for every year/day.
+"""
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+# Each generator takes a random number generator and a `scale` and returns the
+# content of an input file. With scale=1, the input has the same format and
+# about the same size as the real input of the day. With scale=10, 100, ...
+# the input is about 10, 100, ... times bigger (more lines, more particles,
+# more steps, ...), so we can see how a solution scales.
+#
+# Some inputs do not have a size that drives the work of the solution (a
+# single seed, a fixed rule book, ...). Their generator is registered with
+# `scalable=False` and ignores `scale`.
+#
+# The same (year, day, scale, seed) always gives the same input.
+#
+# Usage:
+#   python3 -m aoc.generators 2017 20 -s 10 --seed 3 > particles.txt
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+import argparse
+import math
+import random
+import string
+from collections import deque
+from typing import NamedTuple
+
+
+class Generator(NamedTuple):
+    """A generator function, and whether its input size follows `scale`."""
+    function: object
+    scalable: bool
+
+
+# Maps (year, day) to its Generator.
+GENERATORS: dict = {}
+
+SPELLED_DIGITS = ["one", "two", "three", "four", "five", "six", "seven",
+                  "eight", "nine"]
+
+
+def register(year: int, day: int, scalable: bool = True):
+    """
+    Return a decorator that registers a generator for (`year`, `day`).
+
+        Parameters:
+            year (int): The year of the puzzle.
+            day (int): The day of the puzzle.
+            scalable (bool): False if the generator ignores `scale`.
+
+        Returns:
+            decorator (function): Registers the decorated function.
+    """
+    def decorator(function):
+        GENERATORS[(year, day)] = Generator(function, scalable)
+        return function
+    return decorator
+
+
+def generate(year: int, day: int, scale: int = 1, seed: int = 0) -> str:
+    """
+    Return a synthetic input for (`year`, `day`).
+
+        Parameters:
+            year (int): The year of the puzzle.
+            day (int): The day of the puzzle.
+            scale (int): How many times bigger than a real input it should be.
+            seed (int): The seed of the random number generator.
+
+        Returns:
+            text (str): The content of the generated input file.
+    """
+    rng = random.Random(f"{year}/{day}/{seed}")
+    return GENERATORS[(year, day)].function(rng, scale)
+
+
+def random_word(rng: random.Random, min_length: int, max_length: int,
+                alphabet: str = string.ascii_lowercase) -> str:
+    """Return a random word of `alphabet` letters."""
+    return "".join(rng.choices(alphabet, k=rng.randint(min_length,
+                                                       max_length)))
+
+
+def unique_words(rng: random.Random, n: int, min_length: int,
+                 max_length: int) -> list:
+    """Return a list of `n` different random lowercase words."""
+    words = set()
+    while len(words) < n:
+        words.add(random_word(rng, min_length, max_length))
+    words = sorted(words)
+    rng.shuffle(words)
+    return words
+
+
+def primes_between(low: int, high: int) -> list:
+    """Return the list of prime numbers p such that low <= p < high."""
+    is_prime = bytearray([1]) * high
+    is_prime[:2] = b"\x00\x00"
+    for i in range(2, math.isqrt(high) + 1):
+        if is_prime[i]:
+            is_prime[i*i::i] = bytes(len(range(i*i, high, i)))
+    return [p for p in range(low, high) if is_prime[p]]
+
+
+# - - - - - - - - - - - - - - - - - - 2017 - - - - - - - - - - - - - - - - - -
+
+@register(2017, 1)
+def captcha_2017_01(rng: random.Random, scale: int) -> str:
+    """A long number. Its length is even because Part 2 looks halfway."""
+    n_digits = 2 * rng.randint(1000, 1100) * scale
+    return "".join(rng.choices(string.digits, k=n_digits)) + "\n"
+
+
+@register(2017, 2)
+def spreadsheet_2017_02(rng: random.Random, scale: int) -> str:
+    """Rows of 16 numbers. Each row has 2 numbers that evenly divide."""
+    rows = []
+    for _ in range(16 * scale):
+        row = [rng.randint(20, 7000) for _ in range(14)]
+        divisor = rng.randint(2, 400)
+        row += [divisor, divisor * rng.randint(2, 20)]
+        rng.shuffle(row)
+        rows.append("\t".join(map(str, row)))
+    return "\n".join(rows) + "\n"
+
+
+@register(2017, 3)
+def square_2017_03(rng: random.Random, scale: int) -> str:
+    """A single square number of the spiral memory."""
+    return f"{rng.randint(200000, 400000) * scale}\n"
+
+
+@register(2017, 4)
+def passphrases_2017_04(rng: random.Random, scale: int) -> str:
+    """Passphrases of lowercase words, with some duplicates and anagrams."""
+    lines = []
+    for _ in range(512 * scale):
+        words = [random_word(rng, 2, 7) for _ in range(rng.randint(2, 10))]
+        if rng.random() < 0.3:
+            words.append(rng.choice(words))
+        if rng.random() < 0.3:
+            anagram = list(rng.choice(words))
+            rng.shuffle(anagram)
+            words.append("".join(anagram))
+        rng.shuffle(words)
+        lines.append(" ".join(words))
+    return "\n".join(lines) + "\n"
+
+
+@register(2017, 5)
+def jumps_2017_05(rng: random.Random, scale: int) -> str:
+    """One jump offset per line. Offsets mostly jump backward, like the real
+    input, so the number of steps grows quickly with the number of offsets."""
+    offsets = [rng.randint(-i, 2) for i in range(1000 * scale)]
+    return "\n".join(map(str, offsets)) + "\n"
+
+
+@register(2017, 6)
+def banks_2017_06(rng: random.Random, scale: int) -> str:
+    """The number of blocks in each memory bank."""
+    banks = [rng.randint(0, 15) for _ in range(16 * scale)]
+    return "\t".join(map(str, banks)) + "\n"
+
+
+@register(2017, 7)
+def tower_2017_07(rng: random.Random, scale: int) -> str:
+    """A balanced tree of programs, except for one program whose weight is
+    wrong. Every program holding other programs holds at least 3 of them, so
+    the wrong one can always be found."""
+    n_programs = 1300 * scale
+    names = unique_words(rng, n_programs, 4, 8)
+
+    # Build the shape of the tree, level by level.
+    children = {0: []}
+    order = [0]
+    queue = deque([0])
+    while queue:
+        node = queue.popleft()
+        n_children = rng.randint(3, 7)
+        if len(order) + n_children > n_programs:
+            break
+        for child in range(len(order), len(order) + n_children):
+            children[node].append(child)
+            children[child] = []
+            order.append(child)
+            queue.append(child)
+
+    # Choose the weights from the leaves to the root, so the towers held by
+    # the children of a program all have the same weight.
+    weight = {node: rng.randint(10, 99) for node in order}
+    tower = {}
+    for node in reversed(order):
+        if children[node]:
+            target = max(tower[child] for child in children[node])
+            for child in children[node]:
+                weight[child] += target - tower[child]
+                tower[child] = target
+            tower[node] = weight[node] + target * len(children[node])
+        else:
+            tower[node] = weight[node]
+
+    # Unbalance the tree.
+    faulty = rng.randint(1, len(order) - 1)
+    delta = rng.choice([-8, -7, -6, -5, -4, -3, -2, -1, 1, 2, 3, 4, 5, 6, 7])
+    weight[faulty] += delta  # weights are at least 10, so still positive
+
+    lines = []
+    for node in order:
+        line = f"{names[node]} ({weight[node]})"
+        if children[node]:
+            line += " -> " + ", ".join(names[c] for c in children[node])
+        lines.append(line)
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
+
+
+@register(2017, 8)
+def instructions_2017_08(rng: random.Random, scale: int) -> str:
+    """Conditional increments and decrements of about 25 registers."""
+    registers = unique_words(rng, 25, 1, 3)
+    operators = ["<", ">", "<=", ">=", "==", "!="]
+    lines = []
+    for _ in range(1000 * scale):
+        lines.append(f"{rng.choice(registers)} {rng.choice(['inc', 'dec'])} "
+                     f"{rng.randint(-1000, 1000)} if {rng.choice(registers)} "
+                     f"{rng.choice(operators)} {rng.randint(-10, 10)}")
+    return "\n".join(lines) + "\n"
+
+
+@register(2017, 9)
+def stream_2017_09(rng: random.Random, scale: int) -> str:
+    """Nested groups { } containing garbage < >, with ! canceling the next
+    character."""
+    size = 14000 * scale
+    chars = ["{"]
+    length, depth, need_comma = 1, 1, False
+    while depth > 0:
+        action = rng.random()
+        if length >= size or (action >= 0.7 and depth > 1):
+            chars.append("}")
+            length += 1
+            depth -= 1
+            need_comma = True
+            continue
+
+        if need_comma:
+            chars.append(",")
+            length += 1
+        if action < 0.35 and depth < 12:
+            chars.append("{")
+            length += 1
+            depth += 1
+            need_comma = False
+        else:
+            garbage = ["<"]
+            for _ in range(rng.randint(0, 15)):
+                if rng.random() < 0.2:
+                    garbage.append("!" + rng.choice("aeiou'\"{},<>!"))
+                else:
+                    garbage.append(rng.choice("aeiou'\"{},<"))
+            garbage.append(">")
+            garbage = "".join(garbage)
+            chars.append(garbage)
+            length += len(garbage)
+            need_comma = True
+    return "".join(chars) + "\n"
+
+
+@register(2017, 10)
+def lengths_2017_10(rng: random.Random, scale: int) -> str:
+    """Comma-separated lengths of the Knot Hash."""
+    lengths = [rng.randint(0, 255) for _ in range(16 * scale)]
+    return ",".join(map(str, lengths)) + "\n"
+
+
+@register(2017, 11)
+def path_2017_11(rng: random.Random, scale: int) -> str:
+    """Comma-separated moves on the hexagonal grid. The moves are not equally
+    likely, so the path drifts away from the origin like the real one."""
+    directions = ["n", "ne", "se", "s", "sw", "nw"]
+    weights = [rng.randint(10, 20) for _ in directions]
+    return ",".join(rng.choices(directions, weights, k=8000 * scale)) + "\n"
+
+
+@register(2017, 12)
+def village_2017_12(rng: random.Random, scale: int) -> str:
+    """Programs connected by bidirectional pipes."""
+    n_programs = 2000 * scale
+    neighbors = [set() for _ in range(n_programs)]
+    for program in range(n_programs):
+        for _ in range(rng.choice([0, 1, 1, 1, 2])):
+            other = rng.randrange(n_programs)
+            neighbors[program].add(other)
+            neighbors[other].add(program)
+        if not neighbors[program]:
+            neighbors[program].add(program)  # connected to itself only
+    return "\n".join(f"{program} <-> {', '.join(map(str, sorted(neigh)))}"
+                     for program, neigh in enumerate(neighbors)) + "\n"
+
+
+@register(2017, 13)
+def firewall_2017_13(rng: random.Random, scale: int) -> str:
+    """Layers of the firewall (depth: range). A delay is chosen first and only
+    the layers that do not catch the packet with this delay are kept. Then
+    layers are added until every smaller delay is caught, so the chosen delay
+    is the answer of part 2 (like in the real input, it is in the millions)."""
+    delay = rng.randint(100000, 4000000) * scale
+    layers = {}
+    for depth in range(0, 90 * scale):
+        if depth > 0 and rng.random() < 0.5:
+            continue
+        for _ in range(20):
+            range_ = rng.randint(2, min(4 + depth // 3, 30))
+            if (depth + delay) % (2 * (range_ - 1)) != 0:
+                layers[depth] = range_
+                break
+
+    # sieve the delays below the chosen one, block by block. Each delay still
+    # safe is caught by a new layer, whose period is the one that catches the
+    # most safe delays of the block without catching the chosen delay.
+    size = 1 << 20
+    periods = range(2, 60, 2)
+    for start in range(0, delay, size):
+        end = min(start + size, delay)
+        block = bytearray([1]) * (end - start)
+        for depth, range_ in layers.items():
+            period = 2 * (range_ - 1)
+            first = (-depth - start) % period
+            block[first::period] = bytes(len(range(first, end - start,
+                                                   period)))
+        safe = block.find(1)
+        while safe != -1:
+            period = max((p for p in periods
+                          if (start + safe - delay) % p != 0),
+                         key=lambda p: block[safe::p].count(1))
+            depth = (-start - safe) % period
+            while depth in layers:
+                depth += period
+            layers[depth] = period // 2 + 1
+            block[safe::period] = bytes(len(range(safe, end - start, period)))
+            safe = block.find(1, safe)
+
+    return "\n".join(f"{depth}: {layers[depth]}"
+                     for depth in sorted(layers)) + "\n"
+
+
+@register(2017, 14, scalable=False)
+def key_2017_14(rng: random.Random, scale: int) -> str:
+    """The key string of the disk (the disk is always 128x128)."""
+    return random_word(rng, 8, 8) + "\n"
+
+
+@register(2017, 15, scalable=False)
+def seeds_2017_15(rng: random.Random, scale: int) -> str:
+    """The starting values of both generators."""
+    return (f"Generator A starts with {rng.randint(1, 2**31 - 2)}\n"
+            f"Generator B starts with {rng.randint(1, 2**31 - 2)}\n")
+
+
+@register(2017, 16)
+def dance_2017_16(rng: random.Random, scale: int) -> str:
+    """Comma-separated dance moves (spin, exchange, partner) of 16 programs."""
+    moves = []
+    for _ in range(10000 * scale):
+        move = rng.choice("sxp")
+        if move == "s":
+            moves.append(f"s{rng.randint(1, 15)}")
+        elif move == "x":
+            a, b = rng.sample(range(16), 2)
+            moves.append(f"x{a}/{b}")
+        else:
+            a, b = rng.sample("abcdefghijklmnop", 2)
+            moves.append(f"p{a}/{b}")
+    return ",".join(moves) + "\n"
+
+
+@register(2017, 17, scalable=False)
+def step_2017_17(rng: random.Random, scale: int) -> str:
+    """The number of steps of the spinlock."""
+    return f"{rng.randint(300, 400)}\n"
+
+
+@register(2017, 18)
+def instructions_2017_18(rng: random.Random, scale: int) -> str:
+    """The duet program of the real inputs: it generates pseudo-random numbers
+    and sorts them by exchanging messages. Only the seed and the number of
+    values change."""
+    n_values = 127 * scale
+    return "\n".join([
+        "set i 31", "set a 1", "mul p 17", "jgz p p", "mul a 2", "add i -1",
+        "jgz i -2", "add a -1", f"set i {n_values}",
+        f"set p {rng.randint(100, 999)}", "mul p 8505", "mod p a",
+        "mul p 129749", "add p 12345", "mod p a", "set b p", "mod b 10000",
+        "snd b", "add i -1", "jgz i -9", "jgz a 3", "rcv b", "jgz b -1",
+        "set f 0", f"set i {n_values - 1}", "rcv a", "rcv b", "set p a",
+        "mul p -1", "add p b", "jgz p 4", "snd a", "set a b", "jgz 1 3",
+        "snd b", "set f 1", "add i -1", "jgz i -11", "snd a", "jgz f -16",
+        "jgz a -19"]) + "\n"
+
+
+@register(2017, 19)
+def labyrinth_2017_19(rng: random.Random, scale: int) -> str:
+    """A routing diagram. The path is the longest branch of a random maze, so
+    it never touches itself and each + has a single way out."""
+    side = int(60 * scale**0.5)
+
+    # Random maze (iterative depth-first search) on a side x side lattice. The
+    # path starts on the top row and ends at the deepest cell of the maze.
+    start = (0, rng.randrange(side))
+    parent = {start: None}
+    stack = [start]
+    deepest, depth, max_depth = start, {start: 0}, 0
+    while stack:
+        i, j = stack[-1]
+        neighbors = [(i+di, j+dj) for di, dj in ((1, 0), (-1, 0), (0, 1),
+                                                (0, -1))
+                     if 0 <= i+di < side and 0 <= j+dj < side
+                     and (i+di, j+dj) not in parent]
+        if not neighbors:
+            stack.pop()
+            continue
+        cell = rng.choice(neighbors)
+        parent[cell] = (i, j)
+        depth[cell] = depth[(i, j)] + 1
+        if depth[cell] > max_depth:
+            deepest, max_depth = cell, depth[cell]
+        stack.append(cell)
+
+    path = [deepest]
+    while parent[path[-1]] is not None:
+        path.append(parent[path[-1]])
+    path.reverse()
+
+    # Draw the path. Lattice cell (i, j) is at (2i+1, 2j+1) in the diagram, and
+    # the path enters the diagram from the top.
+    grid = [[" "] * (2*side + 1) for _ in range(2*side + 2)]
+    cells = [(0, 2*start[1] + 1)]
+    for (i1, j1), (i2, j2) in zip(path, path[1:]):
+        cells += [(2*i1 + 1, 2*j1 + 1), (i1 + i2 + 1, j1 + j2 + 1)]
+    cells.append((2*path[-1][0] + 1, 2*path[-1][1] + 1))
+
+    for k, (x, y) in enumerate(cells):
+        if 0 < k < len(cells) - 1:
+            before, after = cells[k-1], cells[k+1]
+            if before[0] != after[0] and before[1] != after[1]:
+                grid[x][y] = "+"
+                continue
+        vertical = (k + 1 < len(cells) and cells[k+1][1] == y) or \
+                   (k > 0 and cells[k-1][1] == y)
+        grid[x][y] = "|" if vertical else "-"
+
+    # Add letters on some straight parts of the path, and at its end.
+    straight = [k for k, (x, y) in enumerate(cells[1:-1], 1)
+                if grid[x][y] != "+"]
+    letters = sorted(rng.sample(straight, min(len(straight), 9 * scale)))
+    for k in letters + [len(cells) - 1]:
+        x, y = cells[k]
+        grid[x][y] = rng.choice(string.ascii_uppercase)
+
+    return "\n".join("".join(row) for row in grid) + "\n"
+
+
+@register(2017, 20)
+def particles_2017_20(rng: random.Random, scale: int) -> str:
+    """Particles with a position, a velocity and an acceleration. About 10%
+    of them are created in groups that collide during the first 40 ticks."""
+    particles = []
+    n_particles = 1000 * scale
+    while len(particles) < n_particles:
+        if rng.random() < 0.03:
+            # A group of particles that collide at position P after t ticks.
+            t = rng.randint(1, 39)
+            P = [rng.randint(-3000, 3000) for _ in range(3)]
+            for _ in range(rng.randint(2, 4)):
+                v = [rng.randint(-150, 150) for _ in range(3)]
+                a = [rng.randint(-15, 15) for _ in range(3)]
+                p = [P[k] - v[k]*t - a[k] * t*(t+1)//2 for k in range(3)]
+                particles.append((p, v, a))
+        else:
+            particles.append(([rng.randint(-3000, 3000) for _ in range(3)],
+                              [rng.randint(-150, 150) for _ in range(3)],
+                              [rng.randint(-15, 15) for _ in range(3)]))
+    rng.shuffle(particles)
+
+    def vector(values):
+        return ",".join(map(str, values))
+
+    return "\n".join(f"p=<{vector(p)}>, v=<{vector(v)}>, a=<{vector(a)}>"
+                     for p, v, a in particles[:n_particles]) + "\n"
+
+
+@register(2017, 21, scalable=False)
+def rules_2017_21(rng: random.Random, scale: int) -> str:
+    """One enhancement rule for each 2x2 and 3x3 pattern (up to rotations and
+    flips)."""
+    def symmetries(rows):
+        for _ in range(4):
+            rows = ["".join(row[i] for row in reversed(rows))
+                    for i in range(len(rows))]  # 90 degrees rotation
+            yield rows
+            yield [row[::-1] for row in rows]
+
+    lines = []
+    for size in (2, 3):
+        seen = set()
+        for bits in range(2**(size*size)):
+            pixels = "".join("#" if bits >> k & 1 else "."
+                             for k in range(size*size))
+            rows = [pixels[i:i+size] for i in range(0, size*size, size)]
+            if "/".join(rows) in seen:
+                continue
+            seen.update("/".join(sym) for sym in symmetries(rows))
+            output = ["".join(rng.choice(".#") for _ in range(size+1))
+                      for _ in range(size+1)]
+            lines.append(f"{'/'.join(rows)} => {'/'.join(output)}")
+    return "\n".join(lines) + "\n"
+
+
+@register(2017, 22)
+def infected_2017_22(rng: random.Random, scale: int) -> str:
+    """A square grid of clean (.) and infected (#) nodes. Its side is odd so
+    the virus starts in the middle."""
+    side = 2 * int(12.5 * scale**0.5) + 1
+    return "\n".join("".join(rng.choice(".#") for _ in range(side))
+                     for _ in range(side)) + "\n"
+
+
+@register(2017, 23, scalable=False)
+def instructions_2017_23(rng: random.Random, scale: int) -> str:
+    """The coprocessor program of the real inputs. Only the first value of
+    register b changes."""
+    return "\n".join([
+        f"set b {rng.randint(57, 99)}", "set c b", "jnz a 2", "jnz 1 5",
+        "mul b 100", "sub b -100000", "set c b", "sub c -17000", "set f 1",
+        "set d 2", "set e 2", "set g d", "mul g e", "sub g b", "jnz g 2",
+        "set f 0", "sub e -1", "set g e", "sub g b", "jnz g -8", "sub d -1",
+        "set g d", "sub g b", "jnz g -13", "jnz f 2", "sub h -1", "set g b",
+        "sub g c", "jnz g 2", "jnz 1 3", "sub b -17", "jnz 1 -23"]) + "\n"
+
+
+@register(2017, 24)
+def ports_2017_24(rng: random.Random, scale: int) -> str:
+    """Different components with two ports. A few of them have a port 0 and
+    some have the same number of pins on both ports, like the real input."""
+    max_port = 50 * scale
+    components = set()
+    while len(components) < 3:
+        components.add((0, rng.randint(1, max_port)))
+    while len(components) < 56 * scale:
+        port = rng.randint(1, max_port)
+        if rng.random() < 0.15:
+            components.add((port, port))
+        else:
+            components.add(tuple(sorted((rng.randint(0, max_port), port))))
+    components = [list(c) for c in sorted(components)]
+    for c in components:
+        rng.shuffle(c)
+    rng.shuffle(components)
+    return "\n".join(f"{a}/{b}" for a, b in components) + "\n"
+
+
+@register(2017, 25)
+def blueprint_2017_25(rng: random.Random, scale: int) -> str:
+    """A random Turing machine blueprint of 6 states."""
+    states = "ABCDEF"
+    n_steps = rng.randint(12000000, 13000000) * scale
+    lines = ["Begin in state A.",
+             f"Perform a diagnostic checksum after {n_steps} steps."]
+    for state in states:
+        lines += ["", f"In state {state}:"]
+        for value in (0, 1):
+            direction = rng.choice(["left", "right"])
+            lines += [f"  If the current value is {value}:",
+                      f"    - Write the value {rng.randint(0, 1)}.",
+                      f"    - Move one slot to the {direction}.",
+                      f"    - Continue with state {rng.choice(states)}."]
+    return "\n".join(lines) + "\n"
+
+
+# - - - - - - - - - - - - - - - - - - 2022 - - - - - - - - - - - - - - - - - -
+
+@register(2022, 1)
+def calories_2022_01(rng: random.Random, scale: int) -> str:
+    """Groups of integers, separated by an empty line."""
+    groups = []
+    for _ in range(250 * scale):
+        group = [rng.randint(1000, 70000) for _ in range(rng.randint(1, 14))]
+        groups.append("\n".join(map(str, group)))
+    return "\n\n".join(groups) + "\n"
+
+
+@register(2022, 2)
+def rounds_2022_02(rng: random.Random, scale: int) -> str:
+    """Rounds of Rock, Paper, Scissors."""
+    return "\n".join(f"{rng.choice('ABC')} {rng.choice('XYZ')}"
+                     for _ in range(2500 * scale)) + "\n"
+
+
+@register(2022, 3)
+def rucksacks_2022_03(rng: random.Random, scale: int) -> str:
+    """Rucksacks whose 2 compartments have a single item in common."""
+    rucksacks = []
+    for _ in range(300 * scale):
+        items = list(string.ascii_letters)
+        rng.shuffle(items)
+        common, items1, items2 = items[0], items[1:27], items[27:]
+        length = rng.randint(6, 24)
+        compartment1 = rng.choices(items1, k=length - 1) + [common]
+        compartment2 = rng.choices(items2, k=length - 1) + [common]
+        rng.shuffle(compartment1)
+        rng.shuffle(compartment2)
+        rucksacks.append("".join(compartment1 + compartment2))
+    return "\n".join(rucksacks) + "\n"
+
+
+# - - - - - - - - - - - - - - - - - - 2023 - - - - - - - - - - - - - - - - - -
+
+@register(2023, 1)
+def calibration_2023_01(rng: random.Random, scale: int) -> str:
+    """Lines of letters, digits and spelled digits, with at least one digit."""
+    lines = []
+    for _ in range(1000 * scale):
+        tokens = [rng.choice(string.digits[1:])]
+        for _ in range(rng.randint(1, 8)):
+            kind = rng.random()
+            if kind < 0.3:
+                tokens.append(rng.choice(string.digits[1:]))
+            elif kind < 0.6:
+                tokens.append(rng.choice(SPELLED_DIGITS))
+            else:
+                tokens.append(random_word(rng, 1, 6))
+        rng.shuffle(tokens)
+        lines.append("".join(tokens))
+    return "\n".join(lines) + "\n"
+
+
+@register(2023, 2)
+def games_2023_02(rng: random.Random, scale: int) -> str:
+    """Games, each made of several sets of red, green and blue cubes."""
+    lines = []
+    for game_id in range(1, 100 * scale + 1):
+        cube_sets = []
+        for _ in range(rng.randint(2, 6)):
+            colors = rng.sample(["red", "green", "blue"], rng.randint(1, 3))
+            cube_sets.append(", ".join(f"{rng.randint(1, 20)} {color}"
+                                       for color in colors))
+        lines.append(f"Game {game_id}: {'; '.join(cube_sets)}")
+    return "\n".join(lines) + "\n"
+
+
+@register(2023, 3)
+def schematic_2023_03(rng: random.Random, scale: int) -> str:
+    """An engine schematic of 140 columns with numbers and symbols."""
+    width = 140
+    rows = []
+    for _ in range(140 * scale):
+        row = ""
+        while len(row) < width:
+            kind = rng.random()
+            if kind < 0.08 and not row[-1:].isdigit():
+                row += str(rng.randint(1, 999))
+            elif kind < 0.11:
+                row += rng.choice("*#+$/@%=&-")
+            else:
+                row += "."
+        rows.append(row[:width])
+    return "\n".join(rows) + "\n"
+
+
+@register(2023, 4)
+def cards_2023_04(rng: random.Random, scale: int) -> str:
+    """Scratchcards with 10 winning numbers and 25 numbers I have. A card never
+    wins copies of cards past the end of the table."""
+    n_cards = 200 * scale
+    lines = []
+    for card_id in range(1, n_cards + 1):
+        numbers = rng.sample(range(1, 100), 35)
+        winning, others = numbers[:10], numbers[10:]
+        n_matches = 0 if rng.random() < 0.7 else rng.randint(1, 5)
+        n_matches = min(n_matches, n_cards - card_id)
+        mine = rng.sample(winning, n_matches) + others[:25 - n_matches]
+        rng.shuffle(mine)
+        lines.append(f"Card {card_id:>3}: "
+                     f"{' '.join(f'{n:>2}' for n in winning)} | "
+                     f"{' '.join(f'{n:>2}' for n in mine)}")
+    return "\n".join(lines) + "\n"
+
+
+@register(2023, 5)
+def almanac_2023_05(rng: random.Random, scale: int) -> str:
+    """Seed ranges and the 7 consecutive maps of the almanac."""
+    limit = 2**32
+    seeds = []
+    for _ in range(10 * scale):
+        length = rng.randint(10**7, 8 * 10**8)
+        seeds += [rng.randint(0, limit - length), length]
+    blocks = ["seeds: " + " ".join(map(str, seeds))]
+
+    names = ["seed", "soil", "fertilizer", "water", "light", "temperature",
+             "humidity", "location"]
+    for source, destination in zip(names, names[1:]):
+        n_ranges = rng.randint(15, 45) * scale
+        cuts = sorted(rng.sample(range(limit), n_ranges + 1))
+        lines = [f"{source}-to-{destination} map:"]
+        for start, end in zip(cuts, cuts[1:]):
+            if rng.random() < 0.1:
+                continue  # leave a gap, mapped to itself
+            lines.append(f"{rng.randint(0, limit - (end - start))} {start} "
+                         f"{end - start}")
+        blocks.append("\n".join(lines))
+    return "\n\n".join(blocks) + "\n"
+
+
+@register(2023, 6, scalable=False)
+def races_2023_06(rng: random.Random, scale: int) -> str:
+    """Time limits and distance records of 4 races. Each record can be
+    beaten."""
+    times = [rng.randint(40, 99) for _ in range(4)]
+    records = [rng.randint(t*t // 8, t*t // 4 - 1) for t in times]
+    return ("Time:      " + "".join(f"{t:>7}" for t in times) + "\n" +
+            "Distance:  " + "".join(f"{d:>7}" for d in records) + "\n")
+
+
+@register(2023, 7)
+def hands_2023_07(rng: random.Random, scale: int) -> str:
+    """Camel Cards hands, each with its bid."""
+    return "\n".join(f"{''.join(rng.choices('23456789TJQKA', k=5))} "
+                     f"{rng.randint(1, 1000)}"
+                     for _ in range(1000 * scale)) + "\n"
+
+
+@register(2023, 8)
+def network_2023_08(rng: random.Random, scale: int) -> str:
+    """
+    Left/right instructions and a network of nodes with the structure that
+    Part 2 relies on: each start node (ending with A) reaches a single end
+    node (ending with Z), then reaches it again with the same period.
+
+    Each of the 6 ghosts walks along p layers of 2 nodes, where p is a prime
+    number (different for each ghost). Whatever the instructions are, the
+    ghost is back at its end node every p steps.
+    """
+    instructions = "".join(rng.choices("LR", k=rng.choice(
+        primes_between(263, 308))))
+    periods = rng.sample(primes_between(40 * scale, 80 * scale), 6)
+
+    # Names of the regular nodes never end with A or Z.
+    n_nodes = 2 * sum(periods)
+    letters = string.ascii_uppercase[1:-1]
+    width = max(3, math.ceil(math.log(n_nodes + 1, len(letters))))
+    names = set()
+    while len(names) < n_nodes:
+        names.add("".join(rng.choices(letters, k=width)))
+    names = sorted(names)
+    rng.shuffle(names)
+
+    prefixes = ["AA"]
+    while len(prefixes) < len(periods):
+        prefix = "".join(rng.choices(string.ascii_uppercase, k=2))
+        if prefix not in prefixes and prefix != "ZZ":
+            prefixes.append(prefix)
+
+    lines = []
+    for prefix, period in zip(prefixes, periods):
+        start = prefix + "A"
+        end = "ZZZ" if prefix == "AA" else prefix + "Z"
+        layers = [(names.pop(), names.pop()) for _ in range(period - 1)]
+        lines.append(f"{end} = ({layers[0][0]}, {layers[0][1]})")
+        lines.append(f"{start} = ({layers[0][1]}, {layers[0][0]})")
+        for (left, right), following in zip(layers, layers[1:]):
+            lines.append(f"{left} = ({following[0]}, {following[1]})")
+            lines.append(f"{right} = ({following[1]}, {following[0]})")
+        lines.append(f"{layers[-1][0]} = ({end}, {end})")
+        lines.append(f"{layers[-1][1]} = ({end}, {end})")
+    rng.shuffle(lines)
+    return instructions + "\n\n" + "\n".join(lines) + "\n"
+
+
+@register(2023, 9)
+def sequences_2023_09(rng: random.Random, scale: int) -> str:
+    """Sequences of 21 values of random integer polynomials."""
+    lines = []
+    for _ in range(200 * scale):
+        coefficients = [rng.randint(-3, 3) for _ in range(rng.randint(2, 8))]
+        x0 = rng.randint(-5, 5)
+        values = [sum(c * x**k for k, c in enumerate(coefficients))
+                  for x in range(x0, x0 + 21)]
+        lines.append(" ".join(map(str, values)))
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    """Parse the command line and print a generated input."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("year", type=int, help="Year of the puzzle.")
+    parser.add_argument("day", type=int, help="Day of the puzzle.")
+    parser.add_argument("-s", "--scale", type=int, default=1,
+                        help="Size of the input, relative to a real input.")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="Seed of the random number generator.")
+    args = parser.parse_args()
+
+    if (args.year, args.day) not in GENERATORS:
+        parser.error(f"no generator for {args.year}/day{args.day:02d}")
+    print(generate(args.year, args.day, args.scale, args.seed), end="")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+# *_* coding: utf-8 *_*
+
+"""
+Profile the solution of a day: hot functions, memory and time of each part.
+"""
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+# The `solve` function of a day yields the answer of each part (see
+# aoc/days.py), so we can instrument each part on its own. Three modes exist:
+#   - functions: cProfile each part, print the functions sorted by time.
+#   - memory:    tracemalloc each part, print the peak of allocated memory and
+#                the lines holding the most memory when the part ends.
+#   - timing:    solve several times, print the best and mean time of each
+#                part (wall and CPU).
+#
+# With --flamegraph, the stacks of the solution are also sampled at a regular
+# interval and written in the "folded" format (one line per stack, frames
+# separated by ';', followed by the number of samples). This file can be read
+# by flamegraph.pl, speedscope or inferno.
+#
+# The input is the real input of the day, a given file or a generated one:
+#   python3 -m aoc.profiling 2017 22 -m functions memory
+#   python3 -m aoc.profiling 2017 15 -m timing -r 3 --flamegraph day15.folded
+#   python3 -m aoc.profiling 2023 7 -m functions -s 10 --sort cumulative
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+import argparse
+import cProfile
+import io
+import os
+import pstats
+import signal
+import statistics
+import sys
+import tracemalloc
+from collections import Counter
+
+from aoc.days import find_days, find_input, load_module
+from aoc.generators import GENERATORS, generate
+from aoc.runner import time_parts
+
+MODES = ["functions", "memory", "timing"]
+
+
+def profile_functions(solve, data, top: int = 20, sort: str = "tottime"):
+    """
+    Profile each part of `solve` with cProfile. Print the `top` functions of
+    each part, sorted by `sort`.
+
+        Parameters:
+            solve (function): The `solve` function of a day.
+            data (str | bytes): The puzzle input.
+            top (int): Number of functions to print for each part.
+            sort (str): The pstats key used to sort the functions.
+    """
+    answers = solve(data)
+    part = 1
+    while True:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            answer = next(answers)
+        except StopIteration:
+            break
+        finally:
+            profiler.disable()
+
+        report = io.StringIO()
+        stats = pstats.Stats(profiler, stream=report)
+        stats.strip_dirs().sort_stats(sort).print_stats(top)
+        print(f"=== Part {part}: {answer}")
+        print(report.getvalue().strip("\n"))
+        print()
+        part += 1
+
+
+def profile_memory(solve, data, top: int = 10):
+    """
+    Trace the memory allocated by each part of `solve`. Print the peak of
+    allocated memory and the `top` lines holding the most memory at the end of
+    each part.
+
+        Parameters:
+            solve (function): The `solve` function of a day.
+            data (str | bytes): The puzzle input.
+            top (int): Number of allocation sites to print for each part.
+    """
+    tracemalloc.start()
+    try:
+        answers = solve(data)
+        for part, answer in enumerate(answers, 1):
+            current, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+            tracemalloc.reset_peak()
+
+            print(f"=== Part {part}: {answer}")
+            print(f"peak: {peak / 2**20:.2f} MB, "
+                  f"held at the end: {current / 2**20:.2f} MB")
+            snapshot = snapshot.filter_traces([
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__)])
+            print("lines holding the most memory at the end of the part:")
+            for stat in snapshot.statistics("lineno")[:top]:
+                print(f"{stat.size / 2**20:>10.2f} MB {stat.count:>10} "
+                      f"blocks  {stat.traceback}")
+            print()
+    finally:
+        tracemalloc.stop()
+
+
+def profile_timing(solve, data, repeat: int = 5):
+    """
+    Solve `repeat` times. Print the best and mean wall time and CPU time of
+    each part.
+
+        Parameters:
+            solve (function): The `solve` function of a day.
+            data (str | bytes): The puzzle input.
+            repeat (int): Number of times to solve.
+    """
+    runs = [time_parts(solve, data) for _ in range(repeat)]
+    print(f"{'part':>4}{'best wall':>12}{'mean wall':>12}{'best cpu':>12}"
+          f"{'mean cpu':>12}  answer")
+    for results in zip(*runs):
+        walls = [result.wall for result in results]
+        cpus = [result.cpu for result in results]
+        print(f"{results[0].part:>4}{min(walls):>12.4f}"
+              f"{statistics.mean(walls):>12.4f}{min(cpus):>12.4f}"
+              f"{statistics.mean(cpus):>12.4f}  {results[0].answer}")
+    print()
+
+
+def sample_stacks(solve, data, interval: float = 0.001) -> Counter:
+    """
+    Solve while sampling the call stack every `interval` seconds of CPU time.
+    Return the number of samples of each stack.
+
+        Parameters:
+            solve (function): The `solve` function of a day.
+            data (str | bytes): The puzzle input.
+            interval (float): Time between two samples, in seconds.
+
+        Returns:
+            stacks (Counter): Maps a folded stack ("part 1;f;g;h") to its
+                              number of samples.
+    """
+    stacks = Counter()
+    part = 1
+    top = sys._getframe()  # pylint: disable=W0212
+
+    def sample(signum, frame):  # pylint: disable=W0613
+        # Only keep the frames of the solution, below this function.
+        frames = []
+        while frame is not None and frame is not top:
+            code = frame.f_code
+            frames.append(f"{code.co_name} "
+                          f"({os.path.basename(code.co_filename)}:"
+                          f"{code.co_firstlineno})")
+            frame = frame.f_back
+        frames.append(f"part {part}")
+        stacks[";".join(reversed(frames))] += 1
+
+    answers = solve(data)
+    previous = signal.signal(signal.SIGPROF, sample)
+    signal.setitimer(signal.ITIMER_PROF, interval, interval)
+    try:
+        while next(answers, None) is not None:
+            part += 1
+    finally:
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, previous)
+    return stacks
+
+
+def main():
+    """Parse the command line and profile the day."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("year", type=int, help="Year of the puzzle.")
+    parser.add_argument("day", type=int, help="Day of the puzzle.")
+    parser.add_argument("-m", "--modes", nargs="+", choices=MODES,
+                        default=["functions"],
+                        help="What to profile (default: %(default)s).")
+    parser.add_argument("-i", "--input",
+                        help="Input file (default: the real input).")
+    parser.add_argument("-s", "--scale", type=int,
+                        help="Profile a generated input of this size.")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="Seed of the generated input.")
+    parser.add_argument("-n", "--top", type=int, default=20,
+                        help="Number of functions or lines to print.")
+    parser.add_argument("--sort", default="tottime",
+                        help="Sort key of the functions (default: "
+                             "%(default)s, or cumulative, ncalls, ...).")
+    parser.add_argument("-r", "--repeat", type=int, default=5,
+                        help="Number of runs in timing mode.")
+    parser.add_argument("--flamegraph",
+                        help="Write the sampled stacks to this file, in the "
+                             "folded format.")
+    parser.add_argument("--interval", type=float, default=0.001,
+                        help="Sampling interval in seconds (--flamegraph).")
+    args = parser.parse_args()
+
+    days = find_days(years=[args.year], days=[args.day])
+    if not days:
+        parser.error(f"no solution for {args.year}/day{args.day:02d}")
+    day = days[0]
+
+    if args.scale is not None:
+        if (day.year, day.day) not in GENERATORS:
+            parser.error(f"no generator for {day.name}")
+        data = generate(day.year, day.day, args.scale, args.seed)
+    else:
+        path = args.input or find_input(day)
+        if path is None:
+            parser.error(f"no input file for {day.name}")
+        with open(path, "rb") as f:
+            data = f.read()
+
+    solve = load_module(day).solve
+    for mode in args.modes:
+        print(f"##### {day.name}: {mode}\n")
+        if mode == "functions":
+            profile_functions(solve, data, args.top, args.sort)
+        elif mode == "memory":
+            profile_memory(solve, data, args.top)
+        else:
+            profile_timing(solve, data, args.repeat)
+
+    if args.flamegraph:
+        stacks = sample_stacks(solve, data, args.interval)
+        with open(args.flamegraph, "w", encoding="UTF-8") as f:
+            for stack, count in sorted(stacks.items()):
+                f.write(f"{stack} {count}\n")
+        print(f"{sum(stacks.values())} samples written to {args.flamegraph}",
+              file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
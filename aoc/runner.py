@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# *_* coding: utf-8 *_*
+
+"""
+Run every year/day solution of the repository in a pool of processes.
+"""
+
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+# Each solution exposes a `solve(text)` generator that yields the answer of
+# each part (see aoc/days.py). Instead of launching one interpreter per script,
+# one after another, we start a pool of worker processes. Each worker imports
+# the solutions it is given (only once) and calls `solve` on the content of the
+# input file. Since the answers are yielded one after the other, we record the
+# wall time and the CPU time spent to find each of them.
+#
+# The results are cached on disk (see aoc/cache.py): a day whose input and
+# source code did not change since its last run is not solved again.
+#
+# Usage:
+#   python3 -m aoc.runner                 # run everything
+#   python3 -m aoc.runner -y 2017 -d 15   # only run 2017/day15
+#   python3 -m aoc.runner -j 4            # use 4 worker processes
+#   python3 -m aoc.runner --no-cache      # solve everything again
+# - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
+import argparse
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import NamedTuple
+
+from aoc import cache
+from aoc.days import Day, find_days, find_input, load_module
+
+# Solvers already imported by the current process, indexed by Day.
+SOLVERS: dict = {}
+
+
+class PartResult(NamedTuple):
+    """The answer of one part of a day, with the time spent to find it."""
+    part: int
+    answer: str
+    wall: float
+    cpu: float
+
+
+class DayResult(NamedTuple):
+    """
+    The results of all parts of a day. `error` is set if the day failed, and
+    `cached` if the results were found in the cache.
+    """
+    day: Day
+    parts: list
+    error: str = None
+    cached: bool = False
+
+
+def load_solver(day: Day):
+    """
+    Return the `solve` function of `day`. Import its module only the first time.
+
+        Parameters:
+            day (Day): The day to get the solver of.
+
+        Returns:
+            solve (function): The `solve` function of the day.
+    """
+    if day not in SOLVERS:
+        SOLVERS[day] = load_module(day).solve
+    return SOLVERS[day]
+
+
+def time_parts(solve, data: bytes) -> list:
+    """
+    Call `solve` on `data` and return the answer of each part with the wall
+    time and CPU time spent to find it.
+
+        Parameters:
+            solve (function): The `solve` function of a day.
+            data (bytes): The content of the input file.
+
+        Returns:
+            parts (list): A list of PartResult, one for each part.
+    """
+    parts = []
+    last_wall, last_cpu = time.perf_counter(), time.process_time()
+    for answer in solve(data):
+        wall, cpu = time.perf_counter(), time.process_time()
+        parts.append(PartResult(len(parts) + 1, str(answer),
+                                wall - last_wall, cpu - last_cpu))
+        last_wall, last_cpu = wall, cpu
+    return parts
+
+
+def run_day(day: Day, cache_dir: str = None) -> DayResult:
+    """
+    Solve `day` on its input file in the current process and return its
+    results.
+
+        Parameters:
+            day (Day): The day to run.
+            cache_dir (str): The directory of the cache. No cache if None.
+
+        Returns:
+            result (DayResult): The answer and timing of each part.
+    """
+    path = find_input(day)
+    if path is None:
+        return DayResult(day, [], "no input file")
+
+    with open(path, "rb") as f:
+        data = f.read()
+
+    key = None
+    if cache_dir is not None:
+        key = cache.cache_key(day, data)
+        parts = cache.load(cache_dir, key)
+        if parts is not None:
+            return DayResult(day, [PartResult(**part) for part in parts],
+                             cached=True)
+
+    try:
+        parts = time_parts(load_solver(day), data)
+    except Exception:  # pylint: disable=W0718
+        return DayResult(day, [], traceback.format_exc(limit=-1))
+
+    if key is not None:
+        cache.store(cache_dir, key, day.name,
+                    [part._asdict() for part in parts])
+    return DayResult(day, parts)
+
+
+def run_all(days: list, jobs: int = None, cache_dir: str = None):
+    """
+    Run all `days` in a pool of `jobs` processes. Yield the result of each day
+    as soon as it is finished.
+
+        Parameters:
+            days (list): The list of Day to run.
+            jobs (int): Number of worker processes. Use all the CPUs if None.
+            cache_dir (str): The directory of the cache. No cache if None.
+
+        Yields:
+            result (DayResult): The result of a finished day.
+    """
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(run_day, day, cache_dir) for day in days]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def print_report(results: list, total_wall: float):
+    """
+    Print the answer, wall time and CPU time of each part of each day. The
+    times of the cached days are the ones of the run that filled the cache.
+
+        Parameters:
+            results (list): The list of DayResult to report.
+            total_wall (float): The wall time of the whole run (in seconds).
+    """
+    print(f"{'day':<12}{'part':>5}{'wall (s)':>11}{'cpu (s)':>11}  answer")
+    total_cpu = 0
+    for result in sorted(results, key=lambda result: result.day):
+        if result.error is not None:
+            error = result.error.strip().split("\n")[-1]
+            print(f"{result.day.name:<12}{'-':>5}{'-':>11}{'-':>11}  "
+                  f"ERROR: {error}")
+        for part in result.parts:
+            if not result.cached:
+                total_cpu += part.cpu
+            cached = " (cached)" if result.cached else ""
+            print(f"{result.day.name:<12}{part.part:>5}{part.wall:>11.3f}"
+                  f"{part.cpu:>11.3f}  {part.answer}{cached}")
+
+    n_errors = sum(result.error is not None for result in results)
+    n_cached = sum(result.cached for result in results)
+    print(f"\n{len(results)} days ({n_errors} failed, {n_cached} cached) in "
+          f"{total_wall:.3f} s of wall time, {total_cpu:.3f} s of CPU time.")
+
+
+def main():
+    """Parse the command line, run the selected days and print a report."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-y", "--year", type=int, action="append",
+                        help="Only run the days of this year (repeatable).")
+    parser.add_argument("-d", "--day", type=int, action="append",
+                        help="Only run this day (repeatable).")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(),
+                        help="Number of worker processes (default: "
+                             "%(default)s)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Do not read nor write the cache.")
+    parser.add_argument("--cache-dir", default=cache.CACHE_DIR,
+                        help="Directory of the cache (default: %(default)s).")
+    parser.add_argument("--cache-size", type=int,
+                        default=cache.CACHE_SIZE // 2**20,
+                        help="Maximum size of the cache, in MB "
+                             "(default: %(default)s).")
+    args = parser.parse_args()
+    cache_dir = None if args.no_cache else args.cache_dir
+
+    days = find_days(years=args.year, days=args.day)
+    if not days:
+        sys.exit("No solution found.")
+
+    start = time.perf_counter()
+    results = []
+    for result in run_all(days, args.jobs, cache_dir):
+        status = "failed" if result.error is not None else \
+                 "cached" if result.cached else "done"
+        print(f"{result.day.name} {status}", file=sys.stderr)
+        results.append(result)
+    print_report(results, time.perf_counter() - start)
+    if cache_dir is not None:
+        cache.evict(cache_dir, args.cache_size * 2**20)
+
+    if any(result.error is not None for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()